@@ -1 +1,9 @@
-from .g2d import *
+import os, sys
+
+# G2D_BACKEND=headless -> nessuna finestra, nessun Tk, loop non limitato dagli fps
+if os.environ.get("G2D_BACKEND", "").lower() == "headless":
+    from . import g2d_headless as g2d
+    from .g2d_headless import *
+    sys.modules[__name__ + ".g2d"] = g2d  # -> anche "import src.g2d_lib.g2d" risolve al backend headless
+else:
+    from .g2d import *
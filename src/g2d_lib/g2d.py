@@ -1,6 +1,7 @@
 from tkinter import Tk, messagebox, simpledialog
+from collections import OrderedDict
 from urllib.request import urlopen
-import io, math, subprocess, sys
+import io, math, subprocess, sys, time
 try:
     import pygame as pg
 except:
@@ -11,17 +12,31 @@ except:
 Point = tuple[float, float]
 Color = tuple[float, float, float]
 
-_tkmain = Tk()
-_tkmain.withdraw()  # hide the main window
-_ws, _hs = _tkmain.winfo_screenwidth(), _tkmain.winfo_screenheight()
-_tkmain.geometry(f"+{_ws // 2}+{_hs // 2}")
-
+_tkmain = None
 _canvas, _display, _tick = None, None, None
 _size, _stroke = (640, 480), 0
 _color, _background = (127, 127, 127), (255, 255, 255)
 _mouse_pos, _mouse_down = (0, 0), 0
 _curr_keys, _prev_keys = set(), set()
 _loaded = {}
+_handles, _textures, _free, _released = {}, [], [], []  # name (or sprite key) -> handle -> surface; freed handles; handles to free after the frame
+_face, _fonts = None, {}
+_texts, _texts_max = OrderedDict(), 256
+_text_hits, _text_misses = 0, 0
+_layers, _layers_max = OrderedDict(), 128
+_layer_hits, _layer_misses = 0, 0
+_rates = {"ups": 0.0, "fps": 0.0, "update_ms": 0.0, "render_ms": 0.0,
+          "updates": 0, "renders": 0, "skipped": 0, "dropped": 0}
+
+def _tk() -> Tk:
+    """Create the hidden Tk root on first use (dialogs only)"""
+    global _tkmain
+    if _tkmain is None:
+        _tkmain = Tk()
+        _tkmain.withdraw()  # hide the main window
+        _ws, _hs = _tkmain.winfo_screenwidth(), _tkmain.winfo_screenheight()
+        _tkmain.geometry(f"+{_ws // 2}+{_hs // 2}")
+    return _tkmain
 
 def _tup(t: tuple, vmin=-math.inf, vmax=math.inf) -> tuple:
     return tuple(min(max(round(v), vmin), vmax) for v in t)
@@ -40,9 +55,12 @@ def init_canvas(size: Point, scale=1):
 def canvas_size() -> Point:
     return _size
 
+def _rgba(color: Color) -> tuple:
+    return _tup((list(color) + [255])[:4], 0, 255)
+
 def set_color(color: Color, width: float=0) -> None:
     global _color, _stroke
-    _color = _tup((list(color) + [255])[:4], 0, 255)
+    _color = _rgba(color)
     _stroke = int(width)
 
 def clear_canvas(background: Color=None) -> None:
@@ -54,11 +72,15 @@ def clear_canvas(background: Color=None) -> None:
 def update_canvas() -> None:
     global _prev_keys
     _prev_keys = set(_curr_keys)
+    _present()
+
+def _present() -> None:
     if _canvas is not _display:
         scaled = pg.transform.scale(_canvas, _display.get_size())
         _display.blit(scaled, (0, 0))
     pg.display.update()
     pg.time.wait(0)
+    _release_handles()
 
 def drawing_surface() -> pg.Surface:
     if len(_color) > 3 and _color[3] != 255:
@@ -87,38 +109,256 @@ def draw_rect(pos: Point, size: Point) -> None:
     pg.draw.rect(surf, _color, rect, width=_stroke)
     blit_drawing_surface()
 
+def _font(size: int) -> pg.font.Font:
+    """Return the font for size, scanning system fonts only once"""
+    global _face
+    if _face is None:
+        fname = "segoeuisymbol"
+        _face = fname if fname in pg.font.get_fonts() else "freesansbold"
+    key = (_face, size)
+    if key not in _fonts:
+        _fonts[key] = pg.font.SysFont(_face, size)
+    return _fonts[key]
+
+def _text_surface(text: str, size: int, color: tuple) -> pg.Surface:
+    """Return the rendered text, from the LRU cache when possible"""
+    global _text_hits, _text_misses
+    key = (text, size, color)
+    surface = _texts.get(key)
+    if surface is not None:
+        _text_hits += 1
+        _texts.move_to_end(key)
+        return surface
+    _text_misses += 1
+    surface = _font(size).render(text, True, color)
+    if len(color) > 3 and color[3] != 255:
+        surface.set_alpha(color[3])
+    _texts[key] = surface
+    if len(_texts) > _texts_max:
+        _texts.popitem(last=False)
+    return surface
+
 def draw_text(text: str, center: Point, size: int) -> None:
-    fname, fonts = "segoeuisymbol", pg.font.get_fonts()
-    fname = fname if fname in fonts else "freesansbold"
-    font = pg.font.SysFont(fname, int(size))
-    surface = font.render(text, True, _color)
-    if len(_color) > 3 and _color[3] != 255:
-        surface.set_alpha(_color[3])
+    surface = _text_surface(text, int(size), _color)
     (x, y), (w, h) = _tup(center), surface.get_size()
     _canvas.blit(surface, (x - w//2, y - h//2))
 
+def text_cache_info() -> dict:
+    """Return hits, misses, hit rate and size of the text cache"""
+    total = _text_hits + _text_misses
+    return {"hits": _text_hits, "misses": _text_misses,
+            "hit_rate": _text_hits / total if total else 0.0,
+            "size": len(_texts), "max_size": _texts_max, "fonts": len(_fonts)}
+
+def set_text_cache_size(max_size: int) -> None:
+    """Set how many rendered strings are kept (least recently used go first)"""
+    global _texts_max
+    _texts_max = max(int(max_size), 0)
+    while len(_texts) > _texts_max:
+        _texts.popitem(last=False)
+
+def clear_text_cache() -> None:
+    global _text_hits, _text_misses
+    _texts.clear()
+    _fonts.clear()
+    _text_hits, _text_misses = 0, 0
+
+def load_cached(layer, version, size: Point, paint) -> int:
+    """Return the texture handle of the surface cached for layer.
+
+    paint() is called, with drawing redirected onto a transparent surface
+    of the given size (so in local coordinates), only when version differs
+    from the one the surface was painted with. The handle stays the same
+    while the layer is cached; an evicted handle keeps its surface, and is
+    not reused, until the frame is presented, so draws already queued in
+    the frame stay valid.
+    """
+    global _canvas, _layer_hits, _layer_misses
+    cached = _layers.get(layer)
+    if cached is not None and cached[0] == version:
+        _layer_hits += 1
+        handle = cached[1]
+    else:
+        _layer_misses += 1
+        size = _tup(size, 1)
+        if cached is not None and _textures[cached[1]].get_size() == size:
+            handle = cached[1]
+            _textures[handle].fill((0, 0, 0, 0))
+        elif cached is not None:
+            handle = cached[1]
+            _textures[handle] = pg.Surface(size, pg.SRCALPHA)
+        else:
+            handle = _new_handle(pg.Surface(size, pg.SRCALPHA))
+        canvas, _canvas = _canvas, _textures[handle]
+        try:
+            paint()
+        finally:
+            _canvas = canvas
+        _layers[layer] = (version, handle)
+        if len(_layers) > _layers_max:
+            _free_handle(_layers.popitem(last=False)[1][1])
+    _layers.move_to_end(layer)
+    return handle
+
+def draw_cached(layer, version, pos: Point, size: Point, paint) -> None:
+    """Blit the surface cached for layer at pos (see load_cached)"""
+    _canvas.blit(_textures[load_cached(layer, version, size, paint)], _tup(pos))
+
+def layer_cache_info() -> dict:
+    """Return hits, misses, hit rate and size of the layer cache"""
+    total = _layer_hits + _layer_misses
+    return {"hits": _layer_hits, "misses": _layer_misses,
+            "hit_rate": _layer_hits / total if total else 0.0,
+            "size": len(_layers), "max_size": _layers_max}
+
+def clear_layer_cache() -> None:
+    global _layer_hits, _layer_misses
+    for _, handle in _layers.values():
+        _free_handle(handle)
+    _layers.clear()
+    _layer_hits, _layer_misses = 0, 0
+
 def draw_polygon(points: list[Point]) -> None:
     surf = drawing_surface()
     pg.draw.polygon(surf, _color, [_tup(p) for p in points], width=_stroke)
     blit_drawing_surface()
 
-def load_image(src: str) -> str:
+def _image(src: str) -> pg.Surface:
+    """Return the surface of image src, loading it once"""
     gh = "https://fondinfo.github.io/sprites/"
     if src not in _loaded:
         try:
-            _loaded[src] = pg.image.load(src)
+            image = pg.image.load(src)
         except:
-            url = src if src.startswith("http") else gh + src
-            image = io.BytesIO(urlopen(url).read())
-            _loaded[src] = pg.image.load(image)
-    return src
+            url = src if str(src).startswith("http") else gh + str(src)
+            image = pg.image.load(io.BytesIO(urlopen(url).read()))
+        if pg.display.get_surface() is not None:
+            image = image.convert_alpha()  # display format: no conversion at blit time
+        _loaded[src] = image
+    return _loaded[src]
+
+def _new_handle(surface: pg.Surface) -> int:
+    if _free:
+        handle = _free.pop()
+        _textures[handle] = surface
+        return handle
+    _textures.append(surface)
+    return len(_textures) - 1
+
+def _free_handle(handle: int) -> None:
+    """Free handle once the current frame is presented (see _release_handles)"""
+    _released.append(handle)
+
+def _release_handles() -> None:
+    """Drop the surfaces of the handles freed during the frame and make them reusable"""
+    for handle in _released:
+        _textures[handle] = None
+    _free.extend(_released)
+    _released.clear()
+
+def load_image(src: str) -> int:
+    """Load image src (or a variant name) once and return its texture handle.
+
+    The handle is a small int, valid for the whole run: draw_image and
+    draw_sprite look it up in a list, without hashing src again.
+    """
+    handle = _handles.get(src)
+    if handle is None:
+        handle = _handles[src] = _new_handle(_image(src))
+    return handle
+
+def load_sprite(src: str, clip_pos: Point, clip_size: Point) -> int:
+    """Register the clip_pos/clip_size area of image src once and return its handle.
+
+    The area is kept as a subsurface of the image (no pixels are copied),
+    so draw_sprite needs no clipping area nor rounding of the rect.
+    """
+    key = (src, _tup(clip_pos), _tup(clip_size))
+    handle = _handles.get(key)
+    if handle is None:
+        image = _textures[load_image(src)]
+        area = pg.Rect(key[1] + key[2]).clip(image.get_rect())
+        handle = _handles[key] = _new_handle(image.subsurface(area))
+    return handle
+
+def _recolor(image: pg.Surface, effect: str, value) -> pg.Surface:
+    surface = image.copy()  # alpha is never touched by the BLEND_RGB_* ops
+    if effect == "bright":
+        factor = 3 if value is None else float(value)
+        if factor < 1:
+            surface.fill((round(factor * 255),) * 3, special_flags=pg.BLEND_RGB_MULT)
+            return surface
+        for _ in range(int(factor) - 1):
+            surface.blit(image, (0, 0), special_flags=pg.BLEND_RGB_ADD)
+        if factor % 1:
+            part = image.copy()
+            part.fill((round(factor % 1 * 255),) * 3, special_flags=pg.BLEND_RGB_MULT)
+            surface.blit(part, (0, 0), special_flags=pg.BLEND_RGB_ADD)
+    elif effect == "flash":
+        surface.fill(_tup(value or (255, 255, 255), 0, 255)[:3], special_flags=pg.BLEND_RGB_MAX)
+    elif effect == "tint":
+        surface.fill(_tup(value, 0, 255)[:3], special_flags=pg.BLEND_RGB_MULT)
+    else:
+        raise ValueError(f"unknown effect {effect!r}")
+    return surface
+
+def load_variant(src: str, effect: str, value=None) -> str:
+    """Make (once, in memory) a recolored copy of image src and return its name.
+
+    effect may be "bright" (rgb * value, default 3), "flash" (rgb raised
+    to the value color, default white) or "tint" (rgb * value color / 255).
+    The returned name can be passed to draw_image like any loaded image.
+    """
+    name = f"{src}#{effect}" if value is None else f"{src}#{effect}:{value}"
+    if name not in _loaded:
+        _loaded[name] = _recolor(_image(src), effect, value)
+    return name
 
-def draw_image(src: str, pos: Point,
+def draw_image(src: str | int, pos: Point,
                clip_pos: Point=None, clip_size: Point=None) -> None:
+    """Draw image src (a name or a texture handle), optionally only an area of it"""
     area = None
     if clip_pos and clip_size:
         area=_tup(clip_pos) + _tup(clip_size)
-    _canvas.blit(_loaded[load_image(src)], _tup(pos), area=area)
+    image = _textures[src if type(src) is int else load_image(src)]
+    _canvas.blit(image, _tup(pos), area=area)
+
+def draw_sprite(handle: int, pos: Point) -> None:
+    """Draw the texture or sprite handle (see load_sprite) at pos: a single blit"""
+    x, y = pos
+    _canvas.blit(_textures[handle], (round(x), round(y)))
+
+def draw_sprites(batch) -> None:
+    """Draw many (handle, pos) pairs, in order, with a single Surface.blits"""
+    _canvas.blits([(_textures[h], (round(x), round(y))) for h, (x, y) in batch], doreturn=False)
+
+def fill_rects(color: Color, rects) -> None:
+    """Fill many (pos, size) rects with the same color.
+
+    The color is converted once and the global color is left alone;
+    translucent rects are all composed on one transparent surface,
+    blitted once.
+    """
+    color = _rgba(color)
+    surf = _canvas
+    if color[3] != 255:
+        surf = _draw
+        surf.fill((0, 0, 0, 0))
+    for pos, size in rects:
+        rect = pg.Rect(*_tup((*pos, *size)))
+        rect.normalize()
+        surf.fill(color, rect)
+    if surf is not _canvas:
+        _canvas.blit(surf, (0, 0))
+
+def draw_texts(batch) -> None:
+    """Draw many (text, center, size, color) labels with a single Surface.blits"""
+    blits = []
+    for text, center, size, color in batch:
+        surface = _text_surface(text, int(size), _rgba(color))
+        (x, y), (w, h) = _tup(center), surface.get_size()
+        blits.append((surface, (x - w//2, y - h//2)))
+    _canvas.blits(blits, doreturn=False)
 
 def load_audio(src: str) -> str:
     if src not in _loaded:
@@ -138,16 +378,19 @@ def pause_audio(src: str) -> None:
 def alert(message: str) -> None:
     if _canvas:
         update_canvas()
+    _tk()
     messagebox.showinfo("", message)
 
 def confirm(message: str) -> bool:
     if _canvas:
         update_canvas()
+    _tk()
     return messagebox.askokcancel("", message)
 
 def prompt(message: str) -> str:
     if _canvas:
         update_canvas()
+    _tk()
     return simpledialog.askstring("", message) or ""
 
 def mouse_pos() -> Point:
@@ -185,25 +428,27 @@ def key_pressed(key: str) -> bool:
 def key_released(key: str) -> bool:
     return key in _prev_keys and key not in _curr_keys
 
+def _handle_events() -> bool:
+    """Apply pending input events; return False if the window was closed"""
+    for e in pg.event.get():
+        if e.type == pg.QUIT:
+            return False
+        elif e.type == pg.KEYDOWN:
+            _curr_keys.add(_kb_name(e.key))
+        elif e.type == pg.KEYUP:
+            _curr_keys.discard(_kb_name(e.key))
+        elif e.type == pg.MOUSEBUTTONDOWN:
+            _curr_keys.add(_mb_name(e.button))
+        elif e.type == pg.MOUSEBUTTONUP:
+            _curr_keys.discard(_mb_name(e.button))
+    return True
+
 def main_loop(tick=None, fps: int=30) -> None:
     global _mouse_pos, _tick
     _tick = tick
     clock = pg.time.Clock()
     update_canvas()
-    running = True
-    while running:
-        for e in pg.event.get():
-            if e.type == pg.QUIT:
-                running = False
-                break
-            elif e.type == pg.KEYDOWN:
-                _curr_keys.add(_kb_name(e.key))
-            elif e.type == pg.KEYUP:
-                _curr_keys.discard(_kb_name(e.key))
-            elif e.type == pg.MOUSEBUTTONDOWN:
-                _curr_keys.add(_mb_name(e.button))
-            elif e.type == pg.MOUSEBUTTONUP:
-                _curr_keys.discard(_mb_name(e.button))
+    while _handle_events():
         if _tick:
             _mouse_pos = pg.mouse.get_pos()
             _tick()
@@ -211,6 +456,66 @@ def main_loop(tick=None, fps: int=30) -> None:
         clock.tick(fps)
     close_canvas()
 
+def fixed_loop(update, render=None, ups: int=30,
+               max_frame_skip: int=5, fps: int=None) -> None:
+    """Run update() at a fixed rate of ups per second, render() at most
+    once per iteration (and only if something was updated).
+
+    Real elapsed time is accumulated and consumed in steps of 1/ups; when
+    rendering falls behind, up to max_frame_skip updates run before the
+    next render (max_frame_skip - 1 renders are skipped) to catch up, so
+    gameplay speed does not depend on the frame rate. Beyond that the
+    backlog is dropped. The loop sleeps to keep at most fps
+    iterations per second (default: ups). See loop_rates.
+    """
+    global _mouse_pos, _prev_keys
+    step, clock = 1 / ups, pg.time.Clock()
+    _present()
+    _rates.update(updates=0, renders=0, skipped=0, dropped=0)
+    lag, last = 0.0, time.perf_counter()
+    window, window_start = [0, 0, 0.0, 0.0], last  # updates, renders, update time, render time
+    while _handle_events():
+        now = time.perf_counter()
+        lag, last = lag + now - last, now
+        _mouse_pos = pg.mouse.get_pos()
+        steps = 0
+        while lag >= step and steps < max_frame_skip:
+            update()
+            _prev_keys = set(_curr_keys)  # key edges are seen by one update only
+            lag -= step
+            steps += 1
+        if lag >= step:
+            _rates["dropped"] += 1
+            lag = 0.0
+        t = time.perf_counter()
+        window[0] += steps
+        window[2] += t - now
+        if steps:
+            if render:
+                render()
+            _present()
+            window[1] += 1
+            window[3] += time.perf_counter() - t
+            _rates["skipped"] += steps - 1
+        _rates["updates"] += steps
+        _rates["renders"] += 1 if steps else 0
+        if now - window_start >= 1:
+            elapsed = now - window_start
+            _rates.update(ups=window[0] / elapsed, fps=window[1] / elapsed,
+                          update_ms=1000 * window[2] / max(window[0], 1),
+                          render_ms=1000 * window[3] / max(window[1], 1))
+            window, window_start = [0, 0, 0.0, 0.0], now
+        clock.tick(fps or ups)
+    close_canvas()
+
+def loop_rates() -> dict:
+    """Return the real rates of fixed_loop, measured over the last second:
+    updates and renders per second, average ms per update and per render,
+    plus total updates, renders, skipped renders and dropped backlogs"""
+    return dict(_rates)
+
 def close_canvas() -> None:
+    clear_text_cache()  # fonts are invalid after pg.quit
+    clear_layer_cache()
     pg.quit()
     sys.exit()
@@ -0,0 +1,253 @@
+"""Headless drop-in for g2d: same function surface, no window, no Tk.
+
+Draw calls are accepted and discarded, images are only registered by
+name, input comes from a script instead of the event queue and
+main_loop runs ticks as fast as possible (optionally for a fixed
+number of ticks).
+"""
+from collections.abc import Callable, Iterable, Iterator
+import math, time
+
+Point = tuple[float, float]
+Color = tuple[float, float, float]
+
+Script = Callable[[int], Iterable[str]] | Iterable[Iterable[str]]
+
+_size, _stroke = (640, 480), 0
+_color, _background = (127, 127, 127), (255, 255, 255)
+_mouse_pos = (0, 0)
+_curr_keys, _prev_keys = set(), set()
+_loaded = {}
+_handles, _textures = {}, []
+_script, _script_iter = None, None
+_running, _ticks, _elapsed = False, 0, 0.0
+_rates = {"ups": 0.0, "fps": 0.0, "update_ms": 0.0, "render_ms": 0.0,
+          "updates": 0, "renders": 0, "skipped": 0, "dropped": 0}
+
+def _tup(t: tuple, vmin=-math.inf, vmax=math.inf) -> tuple:
+    return tuple(min(max(round(v), vmin), vmax) for v in t)
+
+def init_canvas(size: Point, scale=1):
+    """Set size of the (virtual) canvas"""
+    global _size
+    _size = _tup(size)
+
+def canvas_size() -> Point:
+    return _size
+
+def set_color(color: Color, width: float=0) -> None:
+    global _color, _stroke
+    _color = _tup((list(color) + [255])[:4], 0, 255)
+    _stroke = int(width)
+
+def clear_canvas(background: Color=None) -> None:
+    global _background
+    if background:
+        _background = background
+
+def update_canvas() -> None:
+    global _prev_keys
+    _prev_keys = set(_curr_keys)
+
+def draw_line(pt1: Point, pt2: Point, width: float=1) -> None:
+    pass
+
+def draw_circle(center: Point, radius: float) -> None:
+    pass
+
+def draw_rect(pos: Point, size: Point) -> None:
+    pass
+
+def draw_text(text: str, center: Point, size: int) -> None:
+    pass
+
+def text_cache_info() -> dict:
+    """No text is rendered: the cache stays empty"""
+    return {"hits": 0, "misses": 0, "hit_rate": 0.0,
+            "size": 0, "max_size": 0, "fonts": 0}
+
+def set_text_cache_size(max_size: int) -> None:
+    pass
+
+def clear_text_cache() -> None:
+    pass
+
+def load_cached(layer, version, size: Point, paint) -> int:
+    """Nothing is painted: every layer gets the same empty handle"""
+    return -1
+
+def draw_cached(layer, version, pos: Point, size: Point, paint) -> None:
+    pass
+
+def layer_cache_info() -> dict:
+    """Nothing is painted: the cache stays empty"""
+    return {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0, "max_size": 0}
+
+def clear_layer_cache() -> None:
+    pass
+
+def draw_polygon(points: list[Point]) -> None:
+    pass
+
+def load_image(src: str) -> int:
+    handle = _handles.get(src)
+    if handle is None:
+        _loaded.setdefault(src, None)
+        handle = _handles[src] = len(_textures)
+        _textures.append(src)
+    return handle
+
+def load_sprite(src: str, clip_pos: Point, clip_size: Point) -> int:
+    key = (src, _tup(clip_pos), _tup(clip_size))
+    handle = _handles.get(key)
+    if handle is None:
+        load_image(src)
+        handle = _handles[key] = len(_textures)
+        _textures.append(key)
+    return handle
+
+def load_variant(src: str, effect: str, value=None) -> str:
+    if effect not in ("bright", "flash", "tint"):
+        raise ValueError(f"unknown effect {effect!r}")
+    name = f"{src}#{effect}" if value is None else f"{src}#{effect}:{value}"
+    load_image(src)
+    _loaded.setdefault(name, None)
+    return name
+
+def draw_image(src: str | int, pos: Point,
+               clip_pos: Point=None, clip_size: Point=None) -> None:
+    if type(src) is not int:
+        load_image(src)
+
+def draw_sprite(handle: int, pos: Point) -> None:
+    pass
+
+def draw_sprites(batch) -> None:
+    pass
+
+def fill_rects(color: Color, rects) -> None:
+    pass
+
+def draw_texts(batch) -> None:
+    pass
+
+def load_audio(src: str) -> str:
+    _loaded.setdefault(src, None)
+    return src
+
+def play_audio(src: str, loop=False) -> None:
+    load_audio(src)
+
+def pause_audio(src: str) -> None:
+    load_audio(src)
+
+def alert(message: str) -> None:
+    print(message)
+
+def confirm(message: str) -> bool:
+    return True
+
+def prompt(message: str) -> str:
+    return ""
+
+def mouse_pos() -> Point:
+    return _mouse_pos
+
+def set_mouse_pos(pos: Point) -> None:
+    global _mouse_pos
+    _mouse_pos = _tup(pos)
+
+def set_input_script(script: Script | None) -> None:
+    """Set the source of the keys held at each tick.
+
+    script may be a callable receiving the tick index and returning the
+    held keys, or an iterable yielding the held keys of one tick at a
+    time (no keys are held once it is exhausted). None clears it.
+    """
+    global _script, _script_iter
+    _script = script if callable(script) else None
+    _script_iter = iter(script) if script is not None and not callable(script) else None
+
+def _scripted_keys(tick: int) -> set[str]:
+    if _script is not None:
+        return set(_script(tick))
+    if _script_iter is not None:
+        return set(next(_script_iter, ()))
+    return set(_curr_keys)
+
+def current_keys() -> list[str]:
+    return list(_curr_keys)
+
+def previous_keys() -> list[str]:
+    return list(_prev_keys)
+
+def mouse_clicked() -> bool:
+    return key_released("LeftButton")
+
+def mouse_right_clicked() -> bool:
+    return key_released("RightButton")
+
+def key_pressed(key: str) -> bool:
+    return key in _curr_keys and key not in _prev_keys
+
+def key_released(key: str) -> bool:
+    return key in _prev_keys and key not in _curr_keys
+
+def main_loop(tick=None, fps: int=30, ticks: int | None=None) -> int:
+    """Run tick() back to back, ignoring fps.
+
+    Stops after `ticks` iterations (if given) or when close_canvas is
+    called. Return the number of ticks actually run.
+    """
+    global _curr_keys, _running, _ticks, _elapsed
+    _running, _ticks = True, 0
+    start = time.perf_counter()
+    while _running and (ticks is None or _ticks < ticks):
+        _curr_keys = _scripted_keys(_ticks)
+        if tick:
+            tick()
+        update_canvas()
+        _ticks += 1
+    _elapsed = time.perf_counter() - start
+    _running = False
+    return _ticks
+
+def fixed_loop(update, render=None, ups: int=30, max_frame_skip: int=5,
+               fps: int=None, ticks: int | None=None) -> int:
+    """Run update() then render() once per tick, back to back.
+
+    There is no real clock to keep up with, so no render is ever skipped;
+    rates and timings are still reported by loop_rates. Return the number
+    of updates run.
+    """
+    spent = [0.0, 0.0]
+
+    def tick():
+        t0 = time.perf_counter()
+        update()
+        t1 = time.perf_counter()
+        if render:
+            render()
+        spent[0] += t1 - t0
+        spent[1] += time.perf_counter() - t1
+
+    n = main_loop(tick, ticks=ticks)
+    rate = ticks_per_second()
+    _rates.update(ups=rate, fps=rate, updates=n, renders=n, skipped=0, dropped=0,
+                  update_ms=1000 * spent[0] / max(n, 1), render_ms=1000 * spent[1] / max(n, 1))
+    return n
+
+def loop_rates() -> dict:
+    return dict(_rates)
+
+def tick_count() -> int:
+    """Return the number of ticks run by the last (or current) main_loop"""
+    return _ticks
+
+def ticks_per_second() -> float:
+    """Return the simulated tick rate of the last main_loop"""
+    return _ticks / _elapsed if _elapsed > 0 else 0.0
+
+def close_canvas() -> None:
+    global _running
+    _running = False
@@ -9,23 +9,23 @@ from src.g2d_lib import g2d
 from .camera import Camera
 from .game import Game
 from .graphical_interface import GraphicalInterface, init_canvas
-from .file_management import read_settings
+from .settings import get_settings
 from .menu_manager import MenuManager
 
 # ENTITIES
 from ..entities import Actor, Platform, Ladder, GraveStone, Arthur, Door
 
 # GUI
-from ..gui import GUIComponent
+from ..gui import GUIComponent, Text
 
 # STATE
 from ..state import Sprite, Phase, Direction
 
 
-settings = read_settings()
-CAMERA_WIDTH, CAMERA_HEIGHT = settings.get("camera_width", 430), settings.get("camera_height", 230)
-SCALE = settings.get("scale", 1)
-FPS = settings.get("fps", 30)
+settings = get_settings()
+CAMERA_WIDTH, CAMERA_HEIGHT = settings.camera_width, settings.camera_height
+SCALE = settings.scale
+FPS = settings.fps
 
 
 class App(object):
@@ -182,10 +182,16 @@ class App(object):
 
         # === GRAPHICAL INTERFACE ===
         camera = Camera(view_x=0, view_y=0, width=CAMERA_WIDTH, height=CAMERA_HEIGHT, target=self.game.player)
+        self.game.camera = camera  # -> la regione attiva del gioco segue la vista
 
         gui_components: list[GUIComponent] = list()
+        self.profile_text: Text | None = None
+        if settings.render_profile:  # -> conteggi dell'ultimo frame disegnato (vedi GraphicalInterface.render_stats)
+            self.profile_text = Text("RenderProfile", x=CAMERA_WIDTH / 2, y=CAMERA_HEIGHT - 8, text="", text_size=8)
+            gui_components.append(self.profile_text)
 
-        self.gui: GraphicalInterface = GraphicalInterface(camera=camera, gui_components=gui_components)
+        self.gui: GraphicalInterface = GraphicalInterface(camera=camera, gui_components=gui_components, profile=settings.render_profile)
+        self.gui.prewarm({sprite.path for sprite in self.game.player.clips.sprites()})  # -> varianti di blinking di Arthur pronte prima del primo colpo
 
         self.app_phase = Phase.PLAYING
 
@@ -210,14 +216,24 @@ class App(object):
         partita da mostrare a schermo.
         """
 
+        if self.update_game(keys):
+            self.render_game()
+
+    def update_game(self, keys: list[str]) -> bool:
+        """Parte di play_game che aggiorna la partita, senza disegnare.
+
+        Restituisce True se la partita è stata aggiornata (e c'è quindi un
+        frame da disegnare), False se si è tornati al menu.
+        """
+
         if "Escape" in keys:
             self.menu.set_home()
             self.app_phase = Phase.MENU
-            return
+            return False
 
         if not (hasattr(self, "game") and hasattr(self, "gui")):
             self.app_phase = Phase.MENU
-            return
+            return False
 
         if self.game.game_over:
             self.app_phase = Phase.GAME_OVER
@@ -226,7 +242,7 @@ class App(object):
             self.app_phase = Phase.GAME_WON
 
         self.game.tick(keys=keys)
-        self.gui.render(self.game)
+        return True
 
 
     def load_menu(self, keys: list[str], pos: tuple[float, float]) -> None:
@@ -271,6 +287,25 @@ class App(object):
                 self.load_game()
             case Phase.PLAYING:
                 self.play_game(self.keys)
+            case _:
+                self.update()
+
+    def update(self) -> None:
+        """Un passo di simulazione a tempo fisso, senza disegnare.
+
+        Smista le fasi come tick, ma in MENU e PLAYING aggiorna soltanto
+        lo stato (MenuManager.update, update_game): il disegno è lasciato a
+        render, che il loop a tempo fisso richiama al massimo una volta per
+        iterazione.
+        """
+
+        match self.app_phase:
+            case Phase.MENU:
+                self.menu.update(keys=self.keys, cursor_pos=self.mouse_pos)
+            case Phase.START_GAME:
+                self.load_game()
+            case Phase.PLAYING:
+                self.update_game(self.keys)
             case Phase.GAME_WON:
                 self.menu.set_game_won()
                 self.app_phase = Phase.MENU
@@ -285,10 +320,33 @@ class App(object):
             case _:
                 self.app_phase = Phase.MENU
 
+    def render(self) -> None:
+        """Disegna lo stato corrente: la partita (anche nel frame in cui
+        termina) oppure la schermata del menu."""
+
+        match self.app_phase:
+            case Phase.MENU:
+                self.menu.render()
+            case Phase.PLAYING | Phase.GAME_WON | Phase.GAME_OVER if hasattr(self, "game") and hasattr(self, "gui"):
+                self.render_game()
+
+    def render_game(self) -> None:
+        """Disegna la partita; con render_profile attivo aggiorna il testo
+        con i conteggi del frame appena disegnato."""
+
+        self.gui.render(self.game)
+        if self.profile_text is not None:
+            stats = self.gui.render_stats()
+            self.profile_text.text = "cmd {commands}  blit {blits}  fill {fills}  text {labels}  g2d {batches}".format(**stats)
+
 
 def main() -> None:
     global CAMERA_WIDTH, CAMERA_HEIGHT, SCALE, FPS
     app = App(get_keys_from=g2d.current_keys, get_mouse_pos_from=g2d.mouse_pos)
 
-    init_canvas(tick=app.tick, size=(CAMERA_WIDTH, CAMERA_HEIGHT), scale=SCALE, fps=FPS)
+    if settings.fixed_timestep:  # -> simulazione a FPS aggiornamenti al secondo, indipendente dal rendering
+        init_canvas(update=app.update, render=app.render, size=(CAMERA_WIDTH, CAMERA_HEIGHT), scale=SCALE, fps=FPS,
+                    max_frame_skip=settings.max_frame_skip)
+    else:
+        init_canvas(tick=app.tick, size=(CAMERA_WIDTH, CAMERA_HEIGHT), scale=SCALE, fps=FPS)
 
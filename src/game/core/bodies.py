@@ -0,0 +1,326 @@
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
+
+try:
+    import numpy
+except ImportError:  # -> numpy è opzionale: senza, le colonne sono liste Python
+    numpy = None
+
+# STATE
+from ..state import Action, Direction
+
+
+@dataclass(frozen=True)
+class Body:
+    """Componenti fisici di un tipo di attore, per la modalità a componenti (Bodies).
+
+    Ogni componente è il nome dell'attributo dell'attore che ne conserva
+    il valore, oppure None se il tipo non lo ha. Nelle azioni di halts
+    l'attore è fermo; se walks è indicato, si muove in orizzontale solo
+    nelle sue azioni. Dopo il passo advance_state() viene chiamato sugli
+    attori in un'azione di reacts e su quelli che hanno percorso la
+    distanza limite di travel.
+    """
+    velocity: tuple[str, str] | None = None  # -> (x_step, y_step): x += x_step, y += y_step
+    heading: str | None = None  # -> velocità orizzontale: ±speed secondo state.direction
+    gravity: str | None = None  # -> y_step += gravity, prima dello spostamento
+    travel: tuple[str, str] | None = None  # -> (distanza percorsa, limite)
+    cooldown: str | None = None  # -> contatore intero, decrementato fino a 0
+    halts: frozenset[Action] = frozenset({Action.DEAD})
+    walks: frozenset[Action] | None = None
+    reacts: frozenset[Action] = frozenset()
+
+    def columns(self) -> dict[str, str]:
+        """Colonna -> attributo dell'attore, per i componenti presenti."""
+        columns = {"x": "x", "y": "y"}
+        if self.velocity is not None:
+            columns["vx"], columns["vy"] = self.velocity
+        if self.heading is not None:
+            columns["speed"] = self.heading
+        if self.gravity is not None:
+            columns["g"] = self.gravity
+        if self.travel is not None:
+            columns["dist"], columns["limit"] = self.travel
+        if self.cooldown is not None:
+            columns["cd"] = self.cooldown
+        return columns
+
+
+# ======== BACKEND ========
+class _ListOps:
+    """Operazioni sulle colonne come liste Python (senza numpy)."""
+
+    @staticmethod
+    def array(values: Iterable) -> list:
+        return list(values)
+
+    @staticmethod
+    def add(a: list, b: list | float) -> list:
+        if isinstance(b, list):
+            return [x + y for x, y in zip(a, b)]
+        return [x + b for x in a]
+
+    @staticmethod
+    def neg(a: list) -> list:
+        return [-x for x in a]
+
+    @staticmethod
+    def abs(a: list) -> list:
+        return [abs(x) for x in a]
+
+    @staticmethod
+    def maximum(a: list, b: float) -> list:
+        return [x if x > b else b for x in a]
+
+    @staticmethod
+    def where(mask: list, a: list, b: list) -> list:
+        if all(mask):  # -> il caso comune: nessun attore fermo
+            return a
+        return [x if m else y for m, x, y in zip(mask, a, b)]
+
+    @staticmethod
+    def ge(a: list, b: list) -> list:
+        return [x >= y for x, y in zip(a, b)]
+
+    @staticmethod
+    def positive(a: list) -> list:
+        return [x > 0 for x in a]
+
+    @staticmethod
+    def and_(a: list, b: list) -> list:
+        return [x and y for x, y in zip(a, b)]
+
+    @staticmethod
+    def or_(a: list, b: list) -> list:
+        return [x or y for x, y in zip(a, b)]
+
+    @staticmethod
+    def nonzero(mask: list) -> list[int]:
+        return [i for i, m in enumerate(mask) if m]
+
+    @staticmethod
+    def tolist(a: list) -> list:
+        return a
+
+
+class _NumpyOps:
+    """Le stesse operazioni, vettorizzate con numpy."""
+
+    @staticmethod
+    def array(values: Iterable) -> Any:
+        return numpy.asarray(values)
+
+    @staticmethod
+    def add(a: Any, b: Any) -> Any:
+        return a + b
+
+    @staticmethod
+    def neg(a: Any) -> Any:
+        return -a
+
+    @staticmethod
+    def abs(a: Any) -> Any:
+        return numpy.abs(a)
+
+    @staticmethod
+    def maximum(a: Any, b: float) -> Any:
+        return numpy.maximum(a, b)
+
+    @staticmethod
+    def where(mask: Any, a: Any, b: Any) -> Any:
+        return numpy.where(mask, a, b)
+
+    @staticmethod
+    def ge(a: Any, b: Any) -> Any:
+        return a >= b
+
+    @staticmethod
+    def positive(a: Any) -> Any:
+        return a > 0
+
+    @staticmethod
+    def and_(a: Any, b: Any) -> Any:
+        return a & b
+
+    @staticmethod
+    def or_(a: Any, b: Any) -> Any:
+        return a | b
+
+    @staticmethod
+    def nonzero(mask: Any) -> list[int]:
+        return numpy.flatnonzero(mask).tolist()
+
+    @staticmethod
+    def tolist(a: Any) -> list:
+        return a.tolist()
+
+
+# ======== SISTEMI ========
+class Bodies:
+    """Modalità a componenti: fisica, percorso e cooldown aggiornati in blocco.
+
+    Per ogni tipo registrato (con un attributo di classe body: Body) gli
+    attori svegli vengono raccolti, a ogni tick, in colonne contigue (una
+    per componente: x, y, velocità, gravità, ...) con un solo passaggio
+    in C (operator.attrgetter); i sistemi aggiornano le colonne con
+    operazioni su tutto il blocco, vettorizzate con numpy se installato,
+    e i risultati vengono riscritti negli attributi degli attori. Gli
+    attributi restano la fonte di verità: handler delle collisioni,
+    rendering e test li leggono e scrivono come prima.
+
+    Non è più veloce del percorso per oggetto: il rilevamento delle
+    collisioni e l'hash spaziale leggono x e y di ogni attore a ogni tick,
+    quindi raccolta e riscrittura delle colonne non si possono evitare e
+    costano quanto il passo stesso. Misurato con 200-2000 attori per tipo
+    (CPython 3.11), in µs per attore a tick: Zombie 3.1 con move contro
+    4.5 in blocco (liste o numpy), Torch 0.7 contro 1.4-1.6, EyeBall 1.6
+    contro 1.4-2.0. Per questo batched_physics resta disattivato di default.
+
+    Gli attori gestiti non vengono mossi da Arena.tick (vedi movers).
+    """
+    def __init__(self, types: Iterable[type], *, vectorized: bool | None = None) -> None:
+        self.vectorized = vectorized if vectorized is not None else numpy is not None
+        self.__types: dict[type, Body] = {}
+        for t in types:
+            body = getattr(t, "body", None)
+            if not isinstance(body, Body):
+                raise TypeError(f"{t.__name__}.body must be a Body")
+            self.__types[t] = body
+        self.__resolved: dict[type, type | None] = {}  # -> tipo concreto -> tipo registrato (lungo la MRO)
+        self.__schemas: dict[type, tuple] = {}
+        self.__setters: dict[tuple[type, str], Any] = {}
+        self.__awake: tuple | None = None  # -> snapshot da cui sono stati calcolati i gruppi
+        self.__groups: dict[type, list] = {}
+        self.__movers: tuple = ()
+
+
+    # ======== PROPERTIES ========
+    @property
+    def vectorized(self) -> bool:
+        return self.__vectorized
+    @vectorized.setter
+    def vectorized(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("vectorized must be a bool")
+        if value and numpy is None:
+            raise ValueError("vectorized requires numpy")
+        self.__vectorized = value
+
+    @property
+    def types(self) -> tuple[type, ...]:
+        return tuple(self.__types)
+
+
+    # ======== METHODS ========
+    def managed(self, t: type) -> type | None:
+        """Tipo registrato che gestisce gli attori di tipo t (None se nessuno)."""
+        if t not in self.__resolved:
+            self.__resolved[t] = next((c for c in t.__mro__ if c in self.__types), None)
+        return self.__resolved[t]
+
+    def movers(self, awake: tuple) -> tuple:
+        """Gli attori di awake da muovere uno per uno (quelli non gestiti), in ordine.
+
+        Il risultato e i gruppi per tipo sono ricalcolati solo quando cambia
+        lo snapshot awake (cioè dopo uno spawn, un kill, uno sleep o un wake).
+        """
+        if awake is not self.__awake:
+            groups: dict[type, list] = {}
+            movers = []
+            for a in awake:
+                t = self.managed(type(a))
+                if t is None:
+                    movers.append(a)
+                else:
+                    groups.setdefault(t, []).append(a)
+            self.__awake, self.__groups, self.__movers = awake, groups, tuple(movers)
+        return self.__movers
+
+    def step(self, awake: tuple) -> None:
+        """Esegue i sistemi su tutti gli attori gestiti di awake."""
+        self.movers(awake)
+        ops = _NumpyOps if self.vectorized else _ListOps
+        for t, actors in self.__groups.items():
+            self._step(t, actors, ops)
+
+    def _step(self, t: type, actors: list, ops: Any) -> None:
+        columns, getter, halts, walks, reacts = self._schema(t)
+        rows = list(map(getter, actors))  # -> componenti raccolti in un solo passaggio in C
+        values = dict(zip(("state", *columns), zip(*rows)))
+        states = values.pop("state")
+        actions = [s.action for s in states]
+        cols = {name: ops.array(v) for name, v in values.items()}
+
+        # -> le azioni sono confrontate per identità (tuple): l'hash di un Enum è calcolato in Python
+        alive = ops.array([a is not Action.DEAD for a in actions])
+        moving = ops.array([a not in halts for a in actions])
+        walking = moving if walks is None else ops.array([a in walks for a in actions])
+        out = {}
+
+        # --- COOLDOWN ---
+        if "cd" in cols:
+            cd = ops.where(alive, ops.maximum(ops.add(cols["cd"], -1), 0), cols["cd"])
+            changed = ops.nonzero(ops.and_(alive, ops.positive(cols["cd"])))  # -> di solito pochi: gli altri sono già a 0
+            setter, cd = self._setter(t, columns["cd"]), ops.tolist(cd)
+            for i in changed:
+                setter(actors[i], cd[i])
+
+        # --- VERTICALE ---
+        if "vy" in cols:
+            vy = cols["vy"]
+            if "g" in cols:
+                vy = out["vy"] = ops.where(moving, ops.add(vy, cols["g"]), vy)
+            out["y"] = ops.where(moving, ops.add(cols["y"], vy), cols["y"])
+
+        # --- ORIZZONTALE ---
+        vx = cols.get("vx")
+        if "speed" in cols:
+            right = ops.array([s.direction is Direction.RIGHT for s in states])
+            heading = ops.where(right, cols["speed"], ops.neg(cols["speed"]))
+            vx = heading if vx is None else ops.where(walking, heading, vx)
+            if "vx" in cols:
+                out["vx"] = vx
+        if vx is not None:
+            out["x"] = ops.where(walking, ops.add(cols["x"], vx), cols["x"])
+            if "dist" in cols:
+                out["dist"] = ops.where(walking, ops.add(cols["dist"], ops.abs(vx)), cols["dist"])
+
+        for name, v in out.items():
+            deque(map(self._setter(t, columns[name]), actors, ops.tolist(v)), maxlen=0)  # -> scrittura senza ciclo Python
+
+        # --- REAZIONI ---
+        react = ops.array([a in reacts for a in actions]) if reacts else None
+        if "dist" in out:
+            expired = ops.and_(alive, ops.ge(out["dist"], cols["limit"]))
+            react = expired if react is None else ops.or_(react, expired)
+        if react is not None:
+            for i in ops.nonzero(react):
+                actors[i].advance_state()
+
+    def _schema(self, t: type) -> tuple[dict[str, str], attrgetter, tuple, tuple | None, tuple]:
+        """Colonne, getter e azioni (in tuple) del tipo t, calcolati una volta."""
+        if t not in self.__schemas:
+            body = self.__types[t]
+            columns = body.columns()
+            self.__schemas[t] = (
+                columns,
+                attrgetter("state", *columns.values()),
+                tuple(body.halts),
+                tuple(body.walks) if body.walks is not None else None,
+                tuple(body.reacts),
+            )
+        return self.__schemas[t]
+
+    def _setter(self, t: type, attr: str) -> Any:
+        """Il __set__ del descrittore di attr (slot o property), per scrivere senza cercare l'attributo."""
+        key = (t, attr)
+        if key not in self.__setters:
+            descriptor = next((c.__dict__[attr] for c in t.__mro__ if attr in c.__dict__), None)
+            if hasattr(descriptor, "__set__"):
+                self.__setters[key] = descriptor.__set__
+            else:
+                self.__setters[key] = lambda a, v: setattr(a, attr, v)
+        return self.__setters[key]
@@ -1,22 +1,40 @@
-import random
+import heapq
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
-from typing import Any
 
 # CORE
-from .file_management import read_settings
+from .bodies import Bodies
+from .camera import Camera
+from .pool import Pool
+from .settings import Settings, get_settings
+from .spawner import Spawner
 
 # ENTITIES
 from ..entities import Actor, Arena, check_collision, Arthur, Zombie, Arthur, Zombie, Platform, GraveStone, Ladder, Weapon, Torch, Flame, Plant, EyeBall, Door
+from ..entities.actor import StaticIndex
 
 # STATE
-from ..state import Phase, Action, Sprite
+from ..state import Phase, Action, Direction, Sprite
 
 
 
+class _Swapped:
+    """Gestore registrato per la coppia di tipi inversa: chiama func con i primi due argomenti scambiati."""
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[Actor, Actor, "Game"], None]) -> None:
+        self.func = func
+
+    def __call__(self, a: Actor, b: Actor, game: "Game") -> None:
+        self.func(b, a, game)
+
+
 class Game(Arena):
-    def __init__(self, size: tuple[int, int], *, background: Sprite | None = None, spawn_queue: list[Actor] | None = None):
+    def __init__(self, size: tuple[int, int], *, background: Sprite | None = None, spawn_queue: list[Actor] | None = None, camera: Camera | None = None):
         super().__init__(size=size)
 
+        self.camera = camera
+
         self.background = background
         self.spawn_queue = spawn_queue
         self.empty_queue()
@@ -28,16 +46,45 @@ class Game(Arena):
         self._register_default_collision_handlers()
         self._register_default_collision_free_handlers()
 
-        self._settings = read_settings()
+        self._settings = get_settings()
+
+        self.spawner = Spawner(
+            {Zombie: self._settings.zombie.spawn_chance, Plant: self._settings.plant.spawn_chance},
+            caps={Zombie: self._settings.zombie.max_alive, Plant: self._settings.plant.max_alive},
+            max_alive=self._settings.max_enemies,
+            budget=self._settings.spawn_budget,
+        )
+
+        self.bodies = Bodies((Zombie, Torch, EyeBall)) if self._settings.batched_physics else None
+
+        self.despawn_policy = {
+            Zombie: self._settings.zombie.despawn_after,
+            Plant: self._settings.plant.despawn_after,
+            EyeBall: self._settings.eye_ball.despawn_after,
+            Torch: self._settings.torch.despawn_after,
+            Flame: self._settings.flame.despawn_after,
+        }
+        self.__despawns: list[tuple[int, int, int, Actor]] = []  # -> heap di (scadenza, seriale, inizio sonno, attore)
+
+        self.pools = {
+            Torch: Pool(Torch, self._settings.torch.pool_size),
+            Flame: Pool(Flame, self._settings.flame.pool_size),
+            EyeBall: Pool(EyeBall, self._settings.eye_ball.pool_size),
+        }
+        for pool in self.pools.values():
+            pool.prewarm()  # -> al caricamento del livello, non durante il combattimento
+
+        self.__walkable: tuple[list[float], list[tuple[float, float, float]], float] = ([], [], 0.0)  # -> (x0 ordinati, segmenti (x0, x1, top), larghezza massima)
+        self.__walkable_source: StaticIndex | None = None  # -> indice statico da cui è stato costruito
 
 
     @property
-    def _settings(self) -> dict[str, Any]:
+    def _settings(self) -> Settings:
         return self.__settings
     @_settings.setter
-    def _settings(self, value: dict[str, Any]) -> None:
-        if not isinstance(value, dict):
-            raise TypeError("_settings must be a dict")
+    def _settings(self, value: Settings) -> None:
+        if not isinstance(value, Settings):
+            raise TypeError("_settings must be a Settings")
         self.__settings = value
 
     @property
@@ -49,6 +96,49 @@ class Game(Arena):
             raise TypeError("background must be a Sprite or None")
         self.__background = value
 
+    @property
+    def bodies(self) -> Bodies | None:
+        return self.__bodies
+    @bodies.setter
+    def bodies(self, value: Bodies | None) -> None:
+        if not isinstance(value, (Bodies, type(None))):
+            raise TypeError("bodies must be a Bodies or None")
+        self.__bodies = value
+
+    @property
+    def camera(self) -> Camera | None:
+        return self.__camera
+    @camera.setter
+    def camera(self, value: Camera | None) -> None:
+        if not isinstance(value, (Camera, type(None))):
+            raise TypeError("camera must be a Camera or None")
+        self.__camera = value
+
+    @property
+    def despawn_policy(self) -> dict[type, int | None]:
+        return self.__despawn_policy
+    @despawn_policy.setter
+    def despawn_policy(self, value: dict[type, int | None]) -> None:
+        if not isinstance(value, dict):
+            raise TypeError("despawn_policy must be a dict")
+        for t, ticks in value.items():
+            if not isinstance(t, type) or isinstance(ticks, bool) or not isinstance(ticks, (int, type(None))):
+                raise TypeError("despawn_policy must map types to an int or None")
+        self.__despawn_policy = dict(value)
+        self.__despawn_after: dict[type, int | None] = {}  # -> politica risolta lungo la MRO, per tipo esatto
+
+    @property
+    def pools(self) -> dict[type, Pool]:
+        return self.__pools
+    @pools.setter
+    def pools(self, value: dict[type, Pool]) -> None:
+        if not isinstance(value, dict):
+            raise TypeError("pools must be a dict")
+        for t, pool in value.items():
+            if not isinstance(t, type) or not isinstance(pool, Pool) or pool.t is not t:
+                raise TypeError("pools must map types to a Pool of that type")
+        self.__pools = dict(value)
+
     @property
     def spawn_queue(self) -> list[Actor] | None:
         return self.__spawn_queue
@@ -59,15 +149,23 @@ class Game(Arena):
         self.__spawn_queue = value
 
     @property
-    def player(self) -> Arthur | None:
-        actors: list[Actor] = self.actors()
+    def spawner(self) -> Spawner:
+        return self.__spawner
+    @spawner.setter
+    def spawner(self, value: Spawner) -> None:
+        if not isinstance(value, Spawner):
+            raise TypeError("spawner must be a Spawner")
+        self.__spawner = value
 
-        if isinstance(actors[0], Arthur): return actors[0] # type: ignore
+    @property
+    def player(self) -> Arthur | None:
+        players = self.of_type(Arthur)  # -> snapshot in cache finché non cambiano gli Arthur registrati
+        return players[0] if players else None
 
-        for actor in self.actors():
-            if isinstance(actor, Arthur):
-                return actor
-        return None
+    @property
+    def door(self) -> Door | None:
+        doors = self.of_type(Door)
+        return doors[0] if doors else None
 
     @property
     def game_phase(self) -> Phase:
@@ -86,6 +184,7 @@ class Game(Arena):
         if not isinstance(value, dict):
             raise TypeError("_collision_handlers must be a dict")
         self.__collision_handlers = value
+        self.__dispatch: dict[tuple[type, type], tuple[Callable[[Actor, Actor, "Game"], None], bool] | None] = {}
 
     @property
     def _collision_free_handlers(self) -> dict[tuple[type, type], Callable[[Actor, Actor, "Game"], None]]:
@@ -95,6 +194,7 @@ class Game(Arena):
         if not isinstance(value, dict):
             raise TypeError("_collision_free_handlers must be a dict")
         self.__collision_free_handlers = value
+        self.__free_hits: dict[tuple[type, type], tuple[tuple[type, type], ...]] = {}
 
     @property
     def game_over(self) -> bool:
@@ -115,16 +215,22 @@ class Game(Arena):
         """Aggiunge un gestore di collisione per una coppia di tipi di attori.
 
         Registra la funzione func come handler per le collisioni tra istanze
-        dei tipi t1 e t2. Se t1 e t2 sono diversi, crea automaticamente anche
-        la versione simmetrica, in modo che il gestore venga chiamato
-        indipendentemente dall ordine con cui gli attori vengono passati
-        alla funzione di controllo collisioni.
+        dei tipi t1 e t2 (o di loro sottoclassi). Se t1 e t2 sono diversi,
+        crea automaticamente anche la versione simmetrica, in modo che il
+        gestore venga chiamato indipendentemente dall ordine con cui gli
+        attori vengono passati alla funzione di controllo collisioni.
+
+        La coppia di tipi viene anche abilitata nei layer di collisione di
+        Arena (allow_collision): le coppie senza gestore non vengono testate.
+        La tabella di dispatch compilata viene invalidata.
         """
 
         self._collision_handlers[(t1, t2)] = func
+        self.allow_collision(t1, t2)
 
         if t1 is not t2:
-            self._collision_handlers[(t2, t1)] = lambda a, b, g: func(b, a, g)
+            self._collision_handlers[(t2, t1)] = _Swapped(func)
+        self.__dispatch.clear()
 
     def add_collision_free_handler(
         self,
@@ -138,73 +244,108 @@ class Game(Arena):
         """
 
         self._collision_free_handlers[(t1, t2)] = func
+        self.allow_collision(t1, t2)
 
         if t1 is not t2:
-            self._collision_free_handlers[(t2, t1)] = lambda a, b, g: func(b, a, g)
+            self._collision_free_handlers[(t2, t1)] = _Swapped(func)
+        self.__free_hits.clear()
+
+    def _resolve_handler(self, t1: type, t2: type) -> tuple[Callable[[Actor, Actor, "Game"], None], bool] | None:
+        """Compila (una volta per coppia di tipi) il gestore di collisione per t1 e t2.
+
+        Cerca in _collision_handlers la prima coppia registrata lungo la MRO
+        dei due tipi, partendo dai tipi esatti, e memorizza la funzione
+        originale con un flag che indica se gli argomenti vanno scambiati.
+        Restituisce None se nessun gestore è applicabile.
+        """
+
+        handlers = self._collision_handlers
+        entry = None
+        for b1 in t1.__mro__:
+            for b2 in t2.__mro__:
+                func = handlers.get((b1, b2))
+                if func is not None:
+                    entry = (func.func, True) if isinstance(func, _Swapped) else (func, False)
+                    break
+            if entry is not None:
+                break
+
+        self.__dispatch[t1, t2] = entry
+        return entry
+
+    def _free_hits(self, t1: type, t2: type) -> tuple[tuple[type, type], ...]:
+        """Coppie di _collision_free_handlers soddisfatte da una collisione tra t1 e t2 (in cache)."""
 
-    def _handle_collisions(self) -> None:
+        hits = tuple(
+            (k1, k2) for k1, k2 in self._collision_free_handlers
+            if (issubclass(t1, k1) and issubclass(t2, k2)) or (issubclass(t2, k1) and issubclass(t1, k2))
+        )
+        self.__free_hits[t1, t2] = hits
+        return hits
+
+    def _handle_collisions(self, pairs: list[tuple[Actor, Actor]] | None = None) -> None:
         """Gestisce tutte le collisioni e non collisioni tra attori presenti nel gioco.
 
-        Scorre tutte le coppie di attori nella arena e per ciascuna coppia:
-        - se ce collisione, invoca il relativo gestore registrato in
-          _collision_handlers, se presente, e segna che per quella coppia
-          di tipi si e verificata almeno una collisione
-        - se non ce collisione, e se esiste un gestore di non collisione
-          in _collision_free_handlers, salva una coppia di attori di esempio
-          per quel pair di tipi
-
-        Al termine, per ogni coppia di tipi che ha un esempio di non
-        collisione ma non ha mai avuto collisioni nel frame corrente,
-        invoca il relativo gestore di non collisione una sola volta usando
-        la coppia di esempio salvata.
+        Le coppie in collisione sono quelle trovate dalla broadphase di Arena
+        (spatial hash + controllo dei bounding box) alla fine di Arena.tick;
+        se pairs non è passato, la broadphase viene eseguita ora sugli attori
+        correnti. Per ciascuna coppia:
+        - invoca il gestore compilato per la coppia di tipi (_resolve_handler,
+          risolto lungo la MRO e messo in cache alla prima occorrenza), se
+          presente
+        - segna le coppie di _collision_free_handlers soddisfatte dalla
+          collisione
+
+        Al termine, per ogni coppia di tipi registrata in
+        _collision_free_handlers che non ha mai avuto collisioni nel frame
+        corrente, invoca il relativo gestore di non collisione una sola volta,
+        usando come esempio il primo attore presente di ciascuno dei due tipi
+        (dalle viste per tipo di of_type).
         """
 
-        actors = self.actors()
-        n = len(actors)
+        if pairs is None:
+            pairs = self._detect_collisions(self.actors())
+
+        dispatch, free_hits = self.__dispatch, self.__free_hits
+        free_handlers = self._collision_free_handlers
 
-        # -> ha almeno una collisione per pair di tipi
+        # -> coppie di tipi "free" che hanno avuto almeno una collisione
         had_collision: set[tuple[type, type]] = set()
-        # -> un esempio di coppia non-collidente per quel pair di tipi
-        free_example: dict[tuple[type, type], tuple[Actor, Actor]] = {}
 
-        for i in range(n):
-            a1 = actors[i]
-            for j in range(i + 1, n):
-                a2 = actors[j]
-                t1, t2 = type(a1), type(a2)
+        for a1, a2 in pairs:
+            key = (type(a1), type(a2))
 
-                if check_collision(a1, a2):
-                    # -> collision handler
-                    handler = self._collision_handlers.get((t1, t2))
-                    if handler is not None:
-                        handler(a1, a2, self)
+            # -> collision handler: una lookup e una chiamata diretta
+            entry = dispatch[key] if key in dispatch else self._resolve_handler(*key)
+            if entry is not None:
+                func, swapped = entry
+                if swapped:
+                    func(a2, a1, self)
+                else:
+                    func(a1, a2, self)
 
-                    # -> segna collisione per entrambi gli ordini di tipi
-                    had_collision.add((t1, t2))
-                    had_collision.add((t2, t1))
+            if free_handlers:
+                had_collision.update(free_hits[key] if key in free_hits else self._free_hits(*key))
 
-                else:
-                    # -> non-collisione salva solo se esiste un handler_free
-                    handler_free = self._collision_free_handlers.get((t1, t2))
-                    if handler_free is not None and (t1, t2) not in free_example:
-                        # salva una coppia "esempio"
-                        free_example[(t1, t2)] = (a1, a2)
-                        free_example[(t2, t1)] = (a2, a1)
+        if not free_handlers:
+            return
 
         done: set[tuple[type, type]] = set()
-        for (t1, t2), (a1, a2) in free_example.items():
+        for (t1, t2), handler_free in free_handlers.items():
             if (t1, t2) in done:
                 continue
-
-            # -> handler_free solo se per quel pair di tipi non si è mai verificata una collisione
-            if (t1, t2) not in had_collision:
-                handler_free = self._collision_free_handlers.get((t1, t2))
-                if handler_free is not None:
-                    handler_free(a1, a2, self)
-
             done.add((t1, t2))
             done.add((t2, t1))
 
+            # -> handler_free solo se per quel pair di tipi non si è mai verificata una collisione
+            if (t1, t2) in had_collision:
+                continue
+            # -> primo attore di ciascun tipo, come coppia "esempio" di non-collisione: viste per tipo del registro, senza scorrere tutti gli attori
+            a1 = next(iter(self.of_type(t1)), None)
+            a2 = next((a for a in self.of_type(t2) if a is not a1), None)
+            if a1 is not None and a2 is not None:
+                handler_free(a1, a2, self)
+
 
     def _register_default_collision_handlers(self) -> None:
         """Registra tutti i gestori di collisione predefiniti del gioco.
@@ -250,6 +391,15 @@ class Game(Arena):
         self.add_collision_handler(Plant, Platform, self._handle_plant_platform)
         self.add_collision_handler(Plant, Arthur, self._handle_plant_arthur)
 
+        # NESSUN EFFETTO
+        # -> i gestori sono risolti lungo la MRO: senza queste coppie quelli di Platform varrebbero anche
+        #    per Ladder e GraveStone (sottoclassi), e (EyeBall, Weapon) per due EyeBall; si attraversano
+        for t in (Zombie, Torch, Flame, Plant, EyeBall):
+            self.add_collision_handler(t, Ladder, self._handle_nothing)
+        for t in (Zombie, Plant, EyeBall):
+            self.add_collision_handler(t, GraveStone, self._handle_nothing)
+        self.add_collision_handler(EyeBall, EyeBall, self._handle_nothing)
+
     def _register_default_collision_free_handlers(self):
         """Registra i gestori per le situazioni di non collisione predefinite.
 
@@ -261,6 +411,10 @@ class Game(Arena):
 
 
     # ======== COLLISION HANDLERS ========
+    @staticmethod
+    def _handle_nothing(a1: Actor, a2: Actor, game: "Game") -> None:
+        """Gestore delle coppie che si attraversano: ha la precedenza su quelli delle classi base."""
+
     @staticmethod
     def _generic_damage(a1: Actor, a2: Actor) -> bool:
         result: bool = False
@@ -368,6 +522,196 @@ class Game(Arena):
     def distance(o1: Actor, o2: Actor) -> float:
         return ((o1.pos()[0] - o2.pos()[0]) ** 2 + (o1.pos()[1] - o2.pos()[1]) ** 2) ** 0.5
 
+    # ======== QUERY SPAZIALI ========
+    def ground_below(self, x: float, y: float, max_distance: float | None = None) -> tuple[float, Platform] | None:
+        """Raycast verso il basso dal punto (x, y) sulla geometria statica.
+
+        Considera solo le Platform calpestabili dall'alto (Direction.UP in
+        contact_surfaces) il cui lato superiore si trova sotto y.
+
+        Returns:
+            (top_y, platform) della prima piattaforma colpita, oppure None se
+            non ce n'è nessuna entro max_distance (o entro il fondo dell'arena).
+        """
+        bottom = self.size()[1] if max_distance is None else y + max_distance
+        best = None
+        for p in self._static_index().query(x, y, x, bottom):
+            if not isinstance(p, Platform) or p.y < y or Direction.UP not in (p.contact_surfaces or ()):
+                continue
+            if best is None or p.y < best[0] or (p.y == best[0] and self._actors[p] < self._actors[best[1]]):
+                best = (p.y, p)  # -> a parità di altezza vince la prima registrata
+        return best
+
+    def walkable_spans(self, x0: float, x1: float, min_width: float = 0) -> list[tuple[float, float, float]]:
+        """Tratti calpestabili dentro la fascia orizzontale [x0, x1], come tuple (x0, x1, top).
+
+        Ogni tratto è il lato superiore di una piattaforma calpestabile
+        ritagliato sulla fascia; sono restituiti solo quelli più larghi di
+        min_width, nell'ordine dei segmenti del livello (per x0 della
+        piattaforma). Sono calpestabili le Platform senza danno con Direction.UP
+        in contact_surfaces, escluse GraveStone e Ladder.
+
+        I segmenti (x0, x1, top) sono calcolati e ordinati una volta per
+        livello, e ricalcolati solo quando cambia la geometria statica
+        dell'arena: la fascia si trova con due bisect sugli x0 (un segmento
+        che la tocca non può iniziare prima di x0 meno la larghezza massima).
+        """
+        statics = self._static_index()
+        if self.__walkable_source is not statics:
+            segments = sorted((p.x, p.x + p.width, p.y) for p in self.of_type(Platform) if p in self._static and self._walkable(p))
+            self.__walkable = ([s[0] for s in segments], segments, max((s[1] - s[0] for s in segments), default=0.0))
+            self.__walkable_source = statics
+        starts, segments, widest = self.__walkable
+        spans = []
+        for i in range(bisect_left(starts, x0 - widest), bisect_right(starts, x1)):
+            sx0, sx1, top = segments[i]
+            lo, hi = max(sx0, x0), min(sx1, x1)
+            if hi - lo > min_width:
+                spans.append((lo, hi, top))
+        return spans
+
+    @staticmethod
+    def _walkable(p: Platform) -> bool:
+        return (
+            not isinstance(p, (GraveStone, Ladder))
+            and round(p.damage) == 0
+            and Direction.UP in (p.contact_surfaces if p.contact_surfaces is not None else [])
+        )
+
+    def query_region(self, pos: tuple[float, float], size: tuple[float, float], t: type | tuple[type, ...] | None = None) -> list[Actor]:
+        """Attori (opzionalmente solo istanze di t) il cui box interseca la regione (pos, size), in ordine di registrazione."""
+        found = self.actors_in(pos, size)
+        return found if t is None else [a for a in found if isinstance(a, t)]
+
+    def nearest(self, t: type, pos: tuple[float, float], max_distance: float | None = None) -> Actor | None:
+        """Attore di tipo t più vicino a pos (misurato dal centro), oppure None se nessuno è entro max_distance.
+
+        Interroga l'hash spaziale (actors_in) su quadrati centrati in pos, a
+        partire da un tile e raddoppiando il lato: appena il migliore trovato
+        dista non più del raggio del quadrato, nessun attore fuori può essere
+        più vicino. La ricerca si ferma quando il quadrato copre l'arena o
+        supera max_distance; a parità di distanza vince il primo registrato.
+        """
+        px, py = pos
+        w, h = self.size()
+        reach = max(abs(px), abs(px - w), abs(py), abs(py - h))  # -> raggio che copre tutta l'arena
+        limit = reach if max_distance is None else min(max_distance, reach)
+        radius = float(self.TILE)
+        while True:
+            last = radius >= limit
+            radius = min(radius, limit)
+            best, best_d2 = None, float("inf")
+            for a in self.actors_in((px - radius, py - radius), (2 * radius, 2 * radius)):
+                if not isinstance(a, t):
+                    continue
+                (x, y), (aw, ah) = a.pos(), a.size()
+                d2 = (x + aw / 2 - px) ** 2 + (y + ah / 2 - py) ** 2
+                if d2 < best_d2:
+                    best, best_d2 = a, d2
+            if best is not None and best_d2 <= radius ** 2:
+                return best
+            if last:
+                return best if max_distance is None or best_d2 <= max_distance ** 2 else None
+            radius *= 2
+
+    def line_of_sight(self, p0: tuple[float, float], p1: tuple[float, float]) -> bool:
+        """True se il segmento p0-p1 non attraversa geometria statica solida.
+
+        Sono solide le Platform (GraveStone incluse) ma non le Ladder; un
+        segmento che sfiora soltanto il bordo di un box non è bloccato.
+        """
+        (x0, y0), (x1, y1) = p0, p1
+        for p in self._static_index().query(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+            if isinstance(p, Platform) and not isinstance(p, Ladder) and self._segment_crosses(p0, p1, p):
+                return False
+        return True
+
+    @staticmethod
+    def _segment_crosses(p0: tuple[float, float], p1: tuple[float, float], a: Actor) -> bool:
+        # -> clipping di Liang-Barsky del segmento contro l'interno del box
+        (x0, y0), (x1, y1) = p0, p1
+        (bx, by), (bw, bh) = a.pos(), a.size()
+        t0, t1 = 0.0, 1.0
+        for d, lo, hi, o in ((x1 - x0, bx, bx + bw, x0), (y1 - y0, by, by + bh, y0)):
+            if d == 0:
+                if not lo < o < hi:
+                    return False
+                continue
+            ta, tb = (lo - o) / d, (hi - o) / d
+            t0, t1 = max(t0, min(ta, tb)), min(t1, max(ta, tb))
+        return t0 < t1
+
+    # ======== REGIONI DI ATTIVAZIONE ========
+    def active_region(self) -> tuple[float, float, float, float]:
+        """Regione attiva (x0, y0, x1, y1): la vista della camera allargata di active_margin.
+
+        Senza camera si usa una vista grande quanto quella delle impostazioni,
+        centrata sul giocatore.
+        """
+        margin = self._settings.active_margin
+        if self.camera is not None:
+            (x, y), (w, h) = self.camera.pos, self.camera.size
+        else:
+            w, h = self._settings.camera_width, self._settings.camera_height
+            player = self.player
+            (px, py), (pw, ph) = (player.pos(), player.size()) if player is not None else ((0, 0), (0, 0))
+            x, y = px + (pw - w) / 2, py + (ph - h) / 2
+        return x - margin, y - margin, x + w + margin, y + h + margin
+
+    def _activate(self) -> None:
+        """Addormenta gli attori svegli usciti dalla regione attiva e sveglia quelli dormienti rientrati.
+
+        Si visitano solo gli attori svegli; i dormienti non si muovono e
+        vengono trovati con l'indice di Arena (sleepers_in). La geometria
+        statica (piattaforme, porta) resta sempre sveglia: non si muove e
+        non ha niente da fermare, e addormentarla ricostruirebbe a ogni
+        passaggio l'indice dei dormienti. Ogni attore
+        addormentato con una politica di despawn viene messo in coda per
+        _despawn.
+        """
+        x0, y0, x1, y1 = self.active_region()
+        player, now = self.player, self.count()
+        for a in self.awake():
+            if a is player or a in self._static:
+                continue
+            (x, y), (w, h) = a.pos(), a.size()
+            if x + w < x0 or x > x1 or y + h < y0 or y > y1:
+                self.sleep(a)
+                ticks = self._despawn_ticks(type(a))
+                if ticks is not None:
+                    heapq.heappush(self.__despawns, (now + ticks, self._actors[a], now, a))
+
+        for a in self.sleepers_in(x0, y0, x1, y1):
+            self.wake(a)
+
+    def _despawn(self) -> None:
+        """Elimina gli attori rimasti addormentati oltre il tempo della loro politica di despawn."""
+        despawns, now = self.__despawns, self.count()
+        while despawns and despawns[0][0] <= now:
+            _, _, since, a = heapq.heappop(despawns)
+            if self.sleeping_since(a) == since:  # -> non svegliato (né riaddormentato) nel frattempo
+                self.kill(a)
+
+    def _despawn_ticks(self, t: type) -> int | None:
+        ticks = self.__despawn_after.get(t, -1)
+        if ticks == -1:
+            ticks = next((self.despawn_policy[c] for c in t.__mro__ if c in self.despawn_policy), None)
+            self.__despawn_after[t] = ticks
+        return ticks
+
+    def kill(self, a: Actor) -> None:
+        """Rimuove a dall'arena (vedi Arena.kill) e, se il suo tipo ha un Pool, ve lo rilascia.
+
+        Il rilascio avviene solo alla rimozione effettiva, non quando la
+        rimozione viene messa in coda: fino ad allora l'attore è in gioco.
+        """
+        removed = self._pending is None and a in self._actors
+        super().kill(a)
+        if removed:
+            pool = self.pools.get(type(a))
+            if pool is not None:
+                pool.release(a)
+
     def empty_queue(self) -> None:
         """Svuota la coda di spawn iniziale popolando l arena con gli attori.
 
@@ -402,50 +746,84 @@ class Game(Arena):
           su GAME_WON
 
         Successivamente:
-        - elimina attori non giocatori che sono morti oppure usciti dalla
-          arena
-        - elimina attori non statici troppo lontani dal giocatore per
-          ottimizzazione
-
-        Poi richiama il tick della classe base Arena per aggiornare la
-        posizione e lo stato di tutti gli attori in base ai tasti premuti,
-        e invoca _handle_collisions per gestire tutte le collisioni del
-        frame.
-
-        Infine, con una piccola probabilita casuale a ogni frame, genera
-        e spawna nuovi nemici come Zombie e Plant, usando i rispettivi
-        metodi auto_init e la posizione/stato del giocatore.
+        - elimina attori svegli non giocatori che sono morti oppure usciti
+          dalla arena
+        - addormenta gli attori usciti dalla regione attiva attorno alla
+          camera e sveglia quelli rientrati (_activate): i dormienti non
+          vengono mossi né testati per le collisioni
+        - elimina i dormienti la cui politica di despawn è scaduta (_despawn)
+
+        Poi, nella modalità a componenti (bodies), aggiorna in blocco la
+        fisica dei tipi gestiti e richiama il tick della classe base Arena
+        per aggiornare la posizione e lo stato degli altri attori in base
+        ai tasti premuti
+        (e rilevare le collisioni con la broadphase), e invoca
+        _handle_collisions sulle coppie trovate per gestire tutte le
+        collisioni del frame.
+
+        Lo spawner genera i nuovi nemici (Zombie e Plant, con i rispettivi
+        metodi auto_init) quando scadono i loro eventi di spawn, nel rispetto
+        dei limiti di popolazione e del budget per tick.
+
+        Infine fa avanzare le animazioni di tutti gli attori (_animate).
+
+        Durante il tick spawn e kill (anche quelli richiesti da attori e
+        handler) vengono accodati e applicati nell ordine in cui sono stati
+        richiesti, in tre punti: dopo l eliminazione degli attori morti o
+        lontani, dopo il movimento (in Arena.tick) e prima delle animazioni.
         """
 
-        if self.player is None or self.player.state.action is Action.DEAD:
-            self.game_phase = Phase.GAME_OVER
-            return
+        with self.deferred():  # -> spawn e kill del frame applicati in blocco (flush)
+            if self.player is None or self.player.state.action is Action.DEAD:
+                self.game_phase = Phase.GAME_OVER
+                return
 
-        if self.player.health <= 0:
-            self.player.state.action = Action.DEAD
+            if self.player.health <= 0:
+                self.player.state.action = Action.DEAD
 
-        if not self.inside_arena(self.player):
-            self.game_phase = Phase.GAME_OVER
-            self.player.health = 0
-            return
+            if not self.inside_arena(self.player):
+                self.game_phase = Phase.GAME_OVER
+                self.player.health = 0
+                return
+
+            door = self.door
+            if door is not None and door.passed:
+                self.game_phase = Phase.GAME_WON
 
-        doors = [a for a in self.actors() if isinstance(a, Door)]
-        door: Door = doors[0] if len(doors) > 0 else None # type: ignore
-        if door is not None and door.passed:
-            self.game_phase = Phase.GAME_WON
+            for actor in self.awake():  # -> i dormienti non si muovono: non possono morire né uscire dall'arena
+                if not isinstance(actor, (Platform, Arthur)) and ((hasattr(actor, "state") and actor.state.action is Action.DEAD) or (not self.inside_arena(actor))):
+                    self.kill(actor)
 
-        for actor in self.actors():
-            if not isinstance(actor, (Platform, Arthur)) and ((hasattr(actor, "state") and actor.state.action is Action.DEAD) or (not self.inside_arena(actor))):
-                self.kill(actor)
+            self._activate()
+            self._despawn()
 
-            if self.player is not None and (not isinstance(actor, (Platform,GraveStone,Ladder,Arthur,Door)) and self.distance(actor, self.player) > 300):
-                self.kill(actor)
+            self.flush()  # -> gli attori eliminati non vengono mossi
+            if self.bodies is not None:
+                self.bodies.step(self.awake())  # -> modalità a componenti: fisica dei tipi gestiti in blocco
+            super().tick(keys)
+            self._handle_collisions(self.collision_pairs())
 
-        super().tick(keys)
-        self._handle_collisions()
+            self.spawner.tick(self)  # -> solo gli eventi di spawn scaduti, entro limiti e budget
 
-        if random.uniform(0, 1) < self._settings.get("Zombie", {}).get("defaults", {}).get("spawn_chance", 0.005) and self.player is not None:
-            self.spawn(Zombie.auto_init(player=self.player, game=self))
+            self.flush()
+            self._animate()
+
+    def _movers(self) -> tuple:
+        """Attori mossi uno per uno da Arena.tick: senza quelli gestiti da bodies."""
+        if self.bodies is None:
+            return self.awake()
+        return self.bodies.movers(self.awake())
+
+    def _animate(self) -> None:
+        """Fa avanzare di un passo le animazioni degli attori svegli.
+
+        Viene eseguito alla fine di tick, dopo movimento, collisioni e
+        spawn: in questo modo l'animazione dipende solo dalla simulazione
+        e non da quante volte (o se) gli attori vengono disegnati, per
+        esempio quando sono fuori dalla visuale o il rendering viene saltato.
+        I dormienti restano fermi anche nell'animazione.
+        """
 
-        if random.uniform(0, 1) < self._settings.get("Plant", {}).get("defaults", {}).get("spawn_chance", 0.005) and self.player is not None:
-            self.spawn(Plant.auto_init(player=self.player, game=self))
+        for actor in self.awake():
+            if hasattr(actor, "animate"):
+                actor.animate()
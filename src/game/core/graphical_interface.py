@@ -1,12 +1,5 @@
 import pathlib
-from collections.abc import Callable
-
-from PIL.ImageMath import lambda_eval
-
-try:
-    from PIL import Image, ImageEnhance
-except ImportError:
-    Image = None; ImageEnhance = None
+from collections.abc import Callable, Iterable
 
 # G2D
 from src.g2d_lib import g2d
@@ -14,7 +7,8 @@ from src.g2d_lib import g2d
 # CORE
 from .game import Game
 from .camera import Camera
-from .file_management import read_settings
+from .settings import get_settings
+from .render_buffer import RenderBuffer, LAYER_ACTORS, LAYER_PLAYER, LAYER_GUI
 
 # ENTITIES
 from ..entities import Actor, Arthur
@@ -25,27 +19,43 @@ from ..gui import GUIComponent, Color
 # STATE
 from ..state import Sprite
 
-settings = read_settings()
-CAMERA_WIDTH, CAMERA_HEIGHT = settings.get("camera_width", 430), settings.get("camera_height", 230)
+settings = get_settings()
+CAMERA_WIDTH, CAMERA_HEIGHT = settings.camera_width, settings.camera_height
+
+BLINK_EFFECT: tuple[str, float] = ("bright", 3)  # -> variante (effetto, intensità) alternata allo sprite normale quando lampeggia
+
 
+def init_canvas(tick: Callable[[], None] | None = None, size: tuple[int, int] | None = None, scale: float = 1, fps: int = 30, *,
+                update: Callable[[], None] | None = None, render: Callable[[], None] | None = None, max_frame_skip: int = 5) -> None:
+    """Inizializzazione del canvas iniziale e avvio del loop principale.
 
-def init_canvas(tick: Callable[[], []], size: tuple[int, int] | None = None, scale: float = 1, fps: int = 30) -> None:
-    """Inizializzazione del canvas iniziale e avvio del loop principale."""
+    Con update (e render) usa il loop a tempo fisso di g2d: update viene
+    eseguito fps volte al secondo indipendentemente dal rendering, con al
+    massimo max_frame_skip update per frame per recuperare. Altrimenti tick
+    viene chiamato una volta per frame.
+    """
 
     g2d.init_canvas(size=size, scale=scale)
-    g2d.main_loop(tick=tick, fps=fps)
+    if update is not None:
+        g2d.fixed_loop(update=update, render=render, ups=fps, max_frame_skip=max_frame_skip)
+    else:
+        g2d.main_loop(tick=tick, fps=fps)
 
 
 class GraphicalInterface:
     def __init__(self, camera: Camera | None, *, gui_components: list[GUIComponent] | None = None,
-                 background: Sprite | Color | None = None, clear_canvas: bool = True):
+                 background: Sprite | Color | None = None, clear_canvas: bool = True, cull_margin: float = 32, profile: bool = False):
         self.camera = camera
         self.gui: list[GUIComponent] = gui_components
         self.background = background
         self.clear_canvas = clear_canvas
+        self.cull_margin = cull_margin
 
         self.__frame = 0
         self.__gui_actors_components = []
+        self.__sprite_handles: dict[Sprite, list[tuple[int, int] | None]] = {}  # -> sprite -> [(texture, handle) normale, (texture, handle) schiarito]: registrati in g2d una sola volta
+        self.__buffer = RenderBuffer(profile=profile)  # -> comandi di disegno del frame, disegnati in blocco
+        self.__color: tuple = (127, 127, 127)  # -> ultimo colore delle figure registrate (quello iniziale di g2d)
 
     # ======== PROPERTIES ========
     @property
@@ -90,6 +100,23 @@ class GraphicalInterface:
             raise TypeError("clear_canvas must be of type bool")
         self.__clear_canvas: bool = value
 
+    @property
+    def cull_margin(self) -> float:
+        return self.__cull_margin
+
+    @cull_margin.setter
+    def cull_margin(self, value: float) -> None:
+        if not isinstance(value, (int, float)) or value < 0:
+            raise TypeError("cull_margin must be a non negative int or float")
+        self.__cull_margin: float = float(value)
+
+    @property
+    def profile(self) -> bool:
+        return self.__buffer.profile
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self.__buffer.profile = value
+
     # ======== METHODS ========
     def render(self, game: Game):
         """Esegue il rendering completo di un frame di gioco.
@@ -102,6 +129,9 @@ class GraphicalInterface:
         - lo sfondo, tramite render_background
         - tutti gli sprite di gioco, tramite render_sprites
         - tutti i componenti grafici di interfaccia, tramite render_guis
+
+        Sprite e componenti vengono solo registrati nel buffer dei comandi
+        e disegnati insieme alla fine, con un solo flush per frame.
         """
 
         if self.clear_canvas: g2d.clear_canvas()
@@ -109,9 +139,10 @@ class GraphicalInterface:
         self.__frame += 1
         self.camera.tick(game)
 
-        self.render_background(self.background)
-        self.render_sprites(game, clear_canvas=False)
-        self.render_guis(clear_canvas=False)
+        with self.__buffer.frame():
+            self.render_background(self.background)
+            self.render_sprites(game, clear_canvas=False)
+            self.render_guis(clear_canvas=False)
 
     def render_sprites(self, game: Game, clear_canvas: bool | None = None):
         """Disegna sul canvas lo sfondo del mondo di gioco e tutti gli attori.
@@ -121,17 +152,27 @@ class GraphicalInterface:
 
         Per prima cosa disegna lo sprite di sfondo del mondo in base alla
         posizione della camera, poi:
-        - recupera la lista degli attori dal Game
-        - sposta Arthur in fondo alla lista in modo che venga disegnato per ultimo
-        - per ogni attore ottiene lo sprite e lo disegna in posizione relativa
-          alla camera
-
-        Per gli sprite lampeggianti gestisce un effetto visivo:
-        - se Pillow non sono disponibile, alterna tra sprite visibile
-          e sprite nascosto ogni pochi frame
-        - se Pillow è disponibile genera, solo la prima volta, una versione
-          schiarita dell immagine e alterna tra immagine normale e immagine
-          schiarita salvata su file
+        - recupera dal Game solo gli attori il cui rettangolo interseca quello
+          della camera allargato di cull_margin (Arena.actors_in, che usa la
+          spatial hash): gli attori fuori schermo non vengono né disegnati né
+          interrogati per la loro GUI
+        - sposta Arthur in fondo alla lista, così la sua GUI viene raccolta per
+          ultima; il suo sprite va nel livello LAYER_PLAYER, sopra gli altri
+        - per ogni attore ottiene lo sprite e registra nel buffer il comando
+          per disegnarlo in posizione relativa alla camera
+
+        Per gli sprite lampeggianti, o degli attori lampeggianti (proprieta
+        blinking, ad es. Arthur invincibile: gli sprite delle clip sono
+        condivisi e non vengono modificati), alterna ogni 5 frame tra
+        immagine normale e una sua variante schiarita (BLINK_EFFECT). La variante è generata
+        in memoria da g2d.load_variant alla prima richiesta (o in anticipo
+        tramite prewarm) e poi riusata: nessun accesso al disco durante il
+        rendering.
+
+        Ogni sprite è disegnato tramite il suo handle g2d (vedi
+        sprite_handle), senza cercare la texture per nome; tutti gli sprite
+        del frame sono disegnati da una sola chiamata a g2d.draw_sprites
+        (Surface.blits) al flush del buffer.
 
         Infine raccoglie eventuali elementi di interfaccia grafica associati
         agli attori e li memorizza in __gui_actors_components per il
@@ -149,54 +190,29 @@ class GraphicalInterface:
             size = self.camera.size
             g2d.draw_image(src=world_sprite.path, pos=(0, 0), clip_pos=pos, clip_size=size)
 
-        actors: list[Actor] = game.actors()
-        index = 0
-        if not isinstance(actors[index], Arthur):
-            for i, actor in enumerate(actors):
-                if isinstance(actor, Arthur):
-                    index = i
-                    break
-        arthur = actors.pop(index)
-        actors.append(arthur)
+        margin = self.cull_margin
+        actors: list[Actor] = game.actors_in(
+            (self.camera.view_x - margin, self.camera.view_y - margin),
+            (self.camera.width + 2 * margin, self.camera.height + 2 * margin)
+        )
+        actors.sort(key=lambda actor: isinstance(actor, Arthur))  # -> ordinamento stabile: Arthur per ultimo, gli altri nell'ordine di registrazione
 
+        buffer = self.__buffer
         self.__gui_actors_components: list[GUIComponent] = []
         for actor in actors:  # end=arthur
             sprite: Sprite | tuple[float, float] | None = actor.sprite()
             if isinstance(sprite, Sprite):
-                pos = actor.pos()[0] - self.camera.view_x, actor.pos()[1] - self.camera.view_y
-
-                if not sprite.blinking:
-                    g2d.draw_image(src=sprite.path, pos=pos, clip_pos=sprite.pos, clip_size=sprite.size)
-                else:  # blinking == True -> ogni 5 frame si alterna tra immagine diegnata e nulla. in caso pillow sia stato importato si alterna tra la immagine stessa e una versione con un filtro applicato
-                    if Image is None or ImageEnhance is None or not isinstance(sprite.path, pathlib.Path):
-                        # -> modalità senza pillow
-                        if (self.__frame // 5) % 2 == 0:
-                            g2d.draw_image(src=sprite.path, pos=pos, clip_pos=sprite.pos, clip_size=sprite.size)
-                    else:
-                        # -> modalità con pillow
-                        if (self.__frame // 5) % 2 == 0:
-                            g2d.draw_image(src=sprite.path, pos=pos, clip_pos=sprite.pos, clip_size=sprite.size)
-                        else:
-                            bright_path = getattr(sprite, "_bright_path", None)  # -> controllo dell'esistenza del bright_path (percorso che punta a un file immagine con un filtro gia applicato)
-                            if bright_path is None:
-                                path = str(sprite.path)
-                                # -> preparazione del nuovo percorso dell'immagine col filtro applicato
-                                if "." in path:
-                                    bright_path = path.replace(".", "-bright.", 1)
-                                else:
-                                    bright_path = path + "-bright"
-
-                                img = Image.open(path)  # -> apertura immagine corrente
-                                enhancer = ImageEnhance.Brightness(img)  # -> creazione di un enhancer
-                                img_bright = enhancer.enhance(3)  # -> applicazione del filtro
-                                img_bright.save(bright_path)  # -> salvataggio della immagine nel nuovo percorso
-                                sprite._bright_path = bright_path  # -> creazione di un attributo in sprite da usare per evitare di riapplicare il filtro e salvare ogni volta
-
-                            g2d.draw_image(src=bright_path, pos=pos, clip_pos=sprite.pos, clip_size=sprite.size)
+                x, y = actor.pos()
+                blink = (sprite.blinking or getattr(actor, "blinking", False) is True) and (self.__frame // 5) % 2 == 1  # -> sprite o attore lampeggiante: a frame alterni si disegna la variante schiarita
+                texture, handle = self.sprite_handle(sprite, blink)
+                layer = LAYER_PLAYER if isinstance(actor, Arthur) else LAYER_ACTORS
+                buffer.blit(handle, (x - self.camera.view_x, y - self.camera.view_y), layer=layer, texture=texture, size=sprite.size)
 
             if hasattr(actor, "gui"):  # -> ottengo eventuali elementi di interfaccia grafica appartenenti agli attori da renderizzare
                 self.__gui_actors_components.extend(actor.gui)
 
+        buffer.flush()  # -> dentro render non disegna nulla: il flush avviene una volta, alla fine del frame
+
     def render_guis(self, clear_canvas: bool | None = None):
         """Renderizza tutti i componenti di interfaccia grafica presenti.
 
@@ -207,12 +223,17 @@ class GraphicalInterface:
         sia quelli raccolti dagli attori in __gui_actors_components.
 
         Per ogni componente:
-        - ottiene le informazioni di disegno tramite render_info
-        - adatta eventualmente le coordinate in base alla camera se il
+        - se render_key() è None ottiene le informazioni di disegno tramite
+          render_info e le registra nel buffer dei comandi (vedi _record_items)
+        - altrimenti il componente è "retained": viene rasterizzato in una
+          superficie tramite g2d.load_cached solo quando la sua chiave cambia,
+          e nel buffer si registra il blit della superficie in cache
+        - in entrambi i casi le coordinate sono adattate alla camera se il
           componente non è fissato alla finestra (fixed == False)
-        - imposta il colore desiderato
-        - disegna rettangoli o testo a seconda del tipo specificato nelle
-          informazioni (rect o text)
+
+        Ogni componente ha un proprio livello (LAYER_GUI + posizione), quindi
+        viene disegnato sopra i precedenti; sequenze di rettangoli dello
+        stesso colore e di testi vengono disegnate in blocco al flush.
         """
 
         if clear_canvas is None and self.clear_canvas:
@@ -221,36 +242,85 @@ class GraphicalInterface:
             g2d.clear_canvas()
 
         # -> rendering di tutti gli elementi grafici (appartenenti agli attori o no)
-        for gui_component in self.gui + self.__gui_actors_components:
-            info = gui_component.render_info()  #type: ignore # -> ottengo le informazioni necessarie per disegnere un componente grafico
-            for item in info:  # ogni componente grafico puo essere composto da piu figure da disegnare e sono possibili varie configurazioni e proprietà, quindi le estraggo
-                type_ = item.get("type", None)
-                color = item.get("color", None)
-                text = item.get("text", None)
-                pos = item.get("pos", None)
-                center = item.get("center", None)
-                size = item.get("size", None)
-                font_size = item.get("font_size", None)
-
-                if not gui_component.fixed:  # -> serve per stabilire se le coordinarte del componente grafico sono relative alla Camera o relative alla finestra vera e propria
-                    if pos is not None: pos = pos[0] - self.camera.view_x, pos[1] - self.camera.view_y
-                    if center is not None: center = center[0] - self.camera.view_x, center[1] - self.camera.view_y
-
-                if color is not None: g2d.set_color(color)
-
-                if (  # -> condizioni necessarie per disegnare un oggetto di tipo "rect"
-                        type_ == "rect" and
-                        pos is not None and
-                        size is not None
-                ):
-                    g2d.draw_rect(pos=pos, size=size)
-                elif (  # -> condizioni necessarie per disegnare un oggetto di tipo "text"
-                        type_ == "text" and
-                        text is not None and
-                        center is not None and
-                        font_size is not None
-                ):
-                    g2d.draw_text(text=text, center=center, size=font_size)
+        for depth, gui_component in enumerate(self.gui + self.__gui_actors_components):
+            offset = (0.0, 0.0) if gui_component.fixed else (self.camera.view_x, self.camera.view_y)  # -> coordinate relative alla finestra o alla Camera
+            layer = LAYER_GUI + depth  # -> ogni componente sopra i precedenti
+
+            key = gui_component.render_key()
+            if key is None:
+                self._record_items(gui_component.render_info(), offset, layer)  #type: ignore
+                continue
+
+            (x, y), size = gui_component.bounds()
+            handle = g2d.load_cached(
+                id(gui_component), key, size,
+                lambda c=gui_component, o=(x, y): self._draw_items(c.render_info(), o)  # -> coordinate locali alla superficie
+            )
+            self.__buffer.blit(handle, (x - offset[0], y - offset[1]), layer=layer)
+
+        self.__buffer.flush()
+
+    def _record_items(self, info: list[dict], offset: tuple[float, float], layer: int = LAYER_GUI) -> None:
+        """Registra nel buffer le figure descritte da render_info, traslate di -offset.
+
+        Come _draw_items, ma le figure vanno tutte nel livello layer, nell'ordine
+        di render_info: vengono disegnate sopra i componenti dei livelli
+        precedenti e sotto quelli dei successivi.
+        """
+
+        ox, oy = offset
+        color = self.__color
+        for item in info:
+            type_ = item.get("type", None)
+            color = item.get("color", None) or color  # -> senza colore vale l'ultimo impostato, come con g2d.set_color
+            pos = item.get("pos", None)
+            center = item.get("center", None)
+            size = item.get("size", None)
+            text = item.get("text", None)
+            font_size = item.get("font_size", None)
+
+            if type_ == "rect" and pos is not None and size is not None:
+                self.__buffer.fill(color, (pos[0] - ox, pos[1] - oy), size, layer=layer)
+            elif type_ == "text" and text is not None and center is not None and font_size is not None:
+                self.__buffer.text(text, (center[0] - ox, center[1] - oy), font_size, color, layer=layer)
+        self.__color = color
+
+    @staticmethod
+    def _draw_items(info: list[dict], offset: tuple[float, float]) -> None:
+        """Disegna le figure descritte da render_info, traslate di -offset.
+
+        Ogni figura imposta il colore desiderato e disegna un rettangolo o un
+        testo a seconda del tipo specificato nelle informazioni (rect o text).
+        """
+
+        ox, oy = offset
+        for item in info:  # ogni componente grafico puo essere composto da piu figure da disegnare e sono possibili varie configurazioni e proprietà, quindi le estraggo
+            type_ = item.get("type", None)
+            color = item.get("color", None)
+            text = item.get("text", None)
+            pos = item.get("pos", None)
+            center = item.get("center", None)
+            size = item.get("size", None)
+            font_size = item.get("font_size", None)
+
+            if pos is not None: pos = pos[0] - ox, pos[1] - oy
+            if center is not None: center = center[0] - ox, center[1] - oy
+
+            if color is not None: g2d.set_color(color)
+
+            if (  # -> condizioni necessarie per disegnare un oggetto di tipo "rect"
+                    type_ == "rect" and
+                    pos is not None and
+                    size is not None
+            ):
+                g2d.draw_rect(pos=pos, size=size)
+            elif (  # -> condizioni necessarie per disegnare un oggetto di tipo "text"
+                    type_ == "text" and
+                    text is not None and
+                    center is not None and
+                    font_size is not None
+            ):
+                g2d.draw_text(text=text, center=center, size=font_size)
 
     def render_background(self, bg: Sprite | Color | tuple[int, int, int] | tuple[int, int, int, int] | None = None) -> bool:
         """Gestisce il rendering dello sfondo della interfaccia.
@@ -286,6 +356,43 @@ class GraphicalInterface:
 
         return False
 
+    def sprite_handle(self, sprite: Sprite, blink: bool = False) -> tuple[int, int]:
+        """Restituisce (texture, handle) g2d dell'area di sprite (o della sua variante schiarita).
+
+        L'area viene registrata con g2d.load_sprite alla prima richiesta e
+        poi riusata. Gli handle sono associati all'oggetto sprite, che deve
+        quindi restare invariato: è il caso degli sprite delle clip,
+        condivisi e costruiti una sola volta.
+        """
+
+        handles = self.__sprite_handles.get(sprite)
+        if handles is None:
+            handles = self.__sprite_handles[sprite] = [self._load_sprite(sprite.path, sprite), None]
+        if not blink:
+            return handles[0]  # type: ignore
+        if handles[1] is None:
+            handles[1] = self._load_sprite(g2d.load_variant(sprite.path, *BLINK_EFFECT), sprite)
+        return handles[1]
+
+    @staticmethod
+    def _load_sprite(src: str | pathlib.Path, sprite: Sprite) -> tuple[int, int]:
+        return g2d.load_image(src), g2d.load_sprite(src, sprite.pos, sprite.size)
+
+    def render_stats(self) -> dict[str, int]:
+        """Comandi registrati e chiamate g2d dell'ultimo frame (vedi RenderBuffer.stats), con profile attivo."""
+        return self.__buffer.stats()
+
+    def prewarm(self, textures: Iterable[str | pathlib.Path]) -> "GraphicalInterface":
+        """Carica le texture indicate e ne genera subito la variante di blinking.
+
+        Così il primo lampeggio (ad esempio quando Arthur viene colpito) non
+        deve generare nulla durante il rendering.
+        """
+
+        for texture in textures:
+            g2d.load_variant(texture, *BLINK_EFFECT)
+        return self
+
     # ======== SET METHODS ========
     def add_gui_component(self, gui_component: GUIComponent) -> "GraphicalInterface":
         if not isinstance(gui_component, GUIComponent):
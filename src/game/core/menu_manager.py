@@ -7,16 +7,16 @@ from ..state import Sprite
 
 # CORE
 if TYPE_CHECKING: from .app import App, CAMERA_WIDTH, CAMERA_HEIGHT
-from .file_management import read_settings
+from .settings import get_settings
 from .graphical_interface import GraphicalInterface
 
 # GUI
 from ..gui import Button, Color, Text
 
 
-settings = read_settings()
-CAMERA_WIDTH, CAMERA_HEIGHT = settings.get("camera_width", 430), settings.get("camera_height", 230)
-SCALE = settings.get("scale", 1)
+settings = get_settings()
+CAMERA_WIDTH, CAMERA_HEIGHT = settings.camera_width, settings.camera_height
+SCALE = settings.scale
 
 BUTTON_WIDTH, BUTTON_HEIGHT = 100, 30
 
@@ -132,7 +132,17 @@ class MenuManager:
         self.master.app_phase = Phase.QUIT
 
     def tick(self, keys: list[str], cursor_pos: tuple[float, float]) -> None:
-        """Aggiorna lo stato del menu per il frame corrente.
+        """Aggiorna e disegna il menu per il frame corrente.
+
+        Equivale a update seguito da render; se update riporta il menu
+        alla schermata principale, in questo frame non si disegna nulla.
+        """
+
+        if self.update(keys, cursor_pos):
+            self.render()
+
+    def update(self, keys: list[str], cursor_pos: tuple[float, float]) -> bool:
+        """Aggiorna lo stato del menu, senza disegnare.
 
         Riceve in ingresso:
         - keys: la lista dei tasti correnti premuti
@@ -140,17 +150,12 @@ class MenuManager:
 
         Se la fase corrente è GAME_WON o GAME_OVER, decrementa il contatore
         count_down; quando il contatore arriva a zero richiama set_home e
-        torna al menu principale interrompendo il resto dell aggiornamento.
-
-        Se la fase è ancora attiva:
-        - recupera la GraphicalInterface associata alla fase corrente dal
-          dizionario _graphics
-        - per ogni componente della interfaccia che è un Button, richiama
-          il suo metodo tick passando keys e cursor_pos, in modo da gestire
-          hover, pressione ed eventuale esecuzione del comando associato
-        - chiede poi alla GraphicalInterface di disegnare lo sfondo
-          (render_background) e tutti i componenti grafici di interfaccia
-          (render_guis) per produrre il frame del menu da mostrare a schermo
+        restituisce False.
+
+        Altrimenti, per ogni componente della interfaccia della fase corrente
+        che è un Button, richiama il suo metodo tick passando keys e
+        cursor_pos, in modo da gestire hover, pressione ed eventuale
+        esecuzione del comando associato, e restituisce True.
         """
 
         if self.phase in (MenuPhase.GAME_WON, MenuPhase.GAME_OVER):
@@ -158,7 +163,7 @@ class MenuManager:
 
         if self.count_down <= 0:
             self.set_home()
-            return
+            return False
 
         gi: GraphicalInterface = self._graphics[self.phase]
 
@@ -166,6 +171,13 @@ class MenuManager:
             if isinstance(component, Button):
                 component.tick(keys, cursor_pos)
 
+        return True
+
+    def render(self) -> None:
+        """Disegna la schermata della fase corrente: sfondo (render_background)
+        e componenti grafici di interfaccia (render_guis)."""
+
+        gi: GraphicalInterface = self._graphics[self.phase]
         gi.render_background()
         gi.render_guis()
 
@@ -0,0 +1,95 @@
+from typing import Any
+
+
+class Pool:
+    """Pool di oggetti riutilizzabili di un tipo (proiettili e fiamme).
+
+    Il tipo t deve avere un metodo reset con gli stessi argomenti del
+    costruttore, che riporta un oggetto già usato allo stato di uno
+    appena costruito. acquire riusa un oggetto libero (hit) oppure, se
+    non ce ne sono, ne costruisce uno nuovo (miss); release rimette a
+    disposizione un oggetto uscito dal gioco, fino a size oggetti liberi
+    (gli altri vengono lasciati al garbage collector).
+
+    prewarm costruisce in anticipo gli oggetti liberi, al caricamento del
+    livello, con t(0, 0): posizione e valori sono reimpostati da acquire.
+    I contatori (hits, misses, released, dropped) sono restituiti da stats().
+    """
+
+    COUNTERS = ("hits", "misses", "released", "dropped")
+
+    def __init__(self, t: type, size: int) -> None:
+        self.t = t
+        self.size = size
+
+        self.__free: dict[Any, None] = {}  # -> oggetti liberi, in ordine di rilascio (un rilascio ripetuto non li duplica)
+        self.__counters: dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
+
+
+    # ======== PROPERTIES ========
+    @property
+    def t(self) -> type:
+        return self.__t
+    @t.setter
+    def t(self, value: type) -> None:
+        if not isinstance(value, type) or not callable(getattr(value, "reset", None)):
+            raise TypeError("t must be a type with a reset method")
+        self.__t = value
+
+    @property
+    def size(self) -> int:
+        return self.__size
+    @size.setter
+    def size(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError("size must be an int")
+        self.__size = value
+
+
+    # ======== METHODS ========
+    def acquire(self, *args: Any, **kwargs: Any) -> Any:
+        """Un oggetto di tipo t, come t(*args, **kwargs): riusato se ce n'è uno libero."""
+        if self.__free:
+            a, _ = self.__free.popitem()  # -> l'ultimo rilasciato: il più probabile ancora in cache
+            a.reset(*args, **kwargs)
+            self.__counters["hits"] += 1
+            return a
+        self.__counters["misses"] += 1
+        return self.t(*args, **kwargs)
+
+    def release(self, a: Any) -> None:
+        """Rimette a disposizione a, che non deve essere più usato da chi lo rilascia."""
+        if type(a) is not self.t:
+            raise TypeError(f"a must be a {self.t.__name__}")
+        if a in self.__free:
+            return
+        if len(self.__free) >= self.size:
+            self.__counters["dropped"] += 1
+            return
+        self.__free[a] = None
+        self.__counters["released"] += 1
+
+    def prewarm(self, n: int | None = None) -> None:
+        """Costruisce oggetti liberi fino ad averne n (size se None)."""
+        n = self.size if n is None else min(n, self.size)
+        while len(self.__free) < n:
+            self.__free[self.t(0, 0)] = None
+
+    def free(self) -> int:
+        """Numero di oggetti liberi."""
+        return len(self.__free)
+
+    def stats(self) -> dict[str, int]:
+        """Contatori (hits, misses, released, dropped) e oggetti liberi, per la strumentazione."""
+        return {**self.__counters, "free": len(self.__free)}
+
+
+def acquire(arena: Any, t: type, *args: Any, **kwargs: Any) -> Any:
+    """Un oggetto di tipo t dal Pool di arena (arena.pools), se ne ha uno per t;
+    altrimenti t(*args, **kwargs).
+    """
+    pools = getattr(arena, "pools", None)
+    pool = pools.get(t) if isinstance(pools, dict) else None
+    if pool is None:
+        return t(*args, **kwargs)
+    return pool.acquire(*args, **kwargs)
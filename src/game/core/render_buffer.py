@@ -0,0 +1,155 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import NamedTuple
+
+# G2D
+from src.g2d_lib import g2d
+
+
+# ======== LIVELLI ========
+LAYER_ACTORS = 0
+LAYER_PLAYER = 1  # -> Arthur sopra agli altri attori
+LAYER_GUI = 2  # -> il componente i-esimo della GUI va nel livello LAYER_GUI + i, con le sue figure in sequenza
+
+
+# ======== COMANDI ========
+class Blit(NamedTuple):
+    """Disegna l'handle g2d (sprite o superficie in cache) in pos."""
+    handle: int
+    pos: tuple[float, float]
+
+class Fill(NamedTuple):
+    """Riempie il rettangolo (pos, size) con color."""
+    color: tuple
+    pos: tuple[float, float]
+    size: tuple[float, float]
+
+class Label(NamedTuple):
+    """Disegna text centrato in center."""
+    text: str
+    center: tuple[float, float]
+    size: int
+    color: tuple
+
+Command = Blit | Fill | Label
+
+_LAYER = itemgetter(0)
+_TEXTURE = itemgetter(2)
+
+
+class RenderBuffer:
+    """Buffer dei comandi di disegno di un frame.
+
+    I comandi vengono registrati con un livello e disegnati tutti insieme
+    da flush, ordinati per livello; dentro un livello resta l'ordine di
+    registrazione. Solo i blit consecutivi di un livello che dichiarano
+    texture e dimensioni, e che non si sovrappongono tra loro, vengono
+    riordinati per texture: l'ordine di disegno di figure disgiunte non
+    cambia il risultato. Le sequenze consecutive di comandi dello stesso
+    tipo diventano una sola chiamata g2d: Surface.blits per Blit e Label,
+    un riempimento per ogni sequenza di Fill dello stesso colore.
+
+    In modalità profile, stats() restituisce i conteggi dell'ultimo frame.
+    """
+    COUNTERS = ("commands", "blits", "fills", "labels", "batches")
+
+    def __init__(self, *, profile: bool = False) -> None:
+        self.profile = profile
+        self.__commands: list[tuple[int, Command, int | None, tuple | None]] = []  # -> (livello, comando, texture, rettangolo)
+        self.__held = False
+        self.__stats: dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
+
+
+    # ======== PROPERTIES ========
+    @property
+    def profile(self) -> bool:
+        return self.__profile
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("profile must be a bool")
+        self.__profile = value
+
+
+    # ======== MAGIC METHODS ========
+    def __len__(self) -> int:
+        return len(self.__commands)
+
+
+    # ======== METHODS ========
+    def blit(self, handle: int, pos: tuple[float, float], *, layer: int = LAYER_ACTORS,
+             texture: int | None = None, size: tuple[float, float] | None = None) -> None:
+        """Registra il blit di handle; con texture e size il blit può essere raggruppato per texture."""
+        rect = (pos[0], pos[1], pos[0] + size[0], pos[1] + size[1]) if texture is not None and size is not None else None
+        self.__commands.append((layer, Blit(handle, pos), texture, rect))
+
+    def fill(self, color: tuple, pos: tuple[float, float], size: tuple[float, float], *, layer: int = LAYER_GUI) -> None:
+        self.__commands.append((layer, Fill(tuple(color), pos, size), None, None))
+
+    def text(self, text: str, center: tuple[float, float], size: int, color: tuple, *, layer: int = LAYER_GUI) -> None:
+        self.__commands.append((layer, Label(text, center, size, tuple(color)), None, None))
+
+    @contextmanager
+    def frame(self) -> Iterator["RenderBuffer"]:
+        """Dentro il blocco flush non disegna nulla: i comandi vengono disegnati una sola volta, all'uscita."""
+        held, self.__held = self.__held, True
+        try:
+            yield self
+        finally:
+            self.__held = held
+        self.flush()
+
+    def flush(self) -> None:
+        """Disegna e rimuove i comandi registrati (nulla dentro frame)."""
+        if self.__held:
+            return
+
+        commands = self.__commands
+        commands.sort(key=_LAYER)  # -> stabile: dentro un livello resta l'ordine di registrazione
+        ordered: list[Command] = []
+        for (_, kind), run in groupby(commands, key=lambda c: (c[0], type(c[1]))):
+            run = list(run)
+            if kind is Blit and len(run) > 1 and self._disjoint(run):
+                run.sort(key=_TEXTURE)
+            ordered.extend(c[1] for c in run)
+
+        batches = 0
+        for kind, run in groupby(ordered, key=type):
+            if kind is Fill:
+                for color, group in groupby(run, key=attrgetter("color")):  # -> un riempimento per sequenza dello stesso colore: l'ordine di disegno non cambia
+                    g2d.fill_rects(color, [(fill.pos, fill.size) for fill in group])
+                    batches += 1
+            elif kind is Blit:
+                g2d.draw_sprites(list(run))
+                batches += 1
+            else:
+                g2d.draw_texts(list(run))
+                batches += 1
+
+        if self.profile:
+            kinds = [type(c) for c in ordered]
+            self.__stats = {
+                "commands": len(commands), "blits": kinds.count(Blit), "fills": kinds.count(Fill),
+                "labels": kinds.count(Label), "batches": batches,
+            }
+        commands.clear()
+
+    @staticmethod
+    def _disjoint(run: list[tuple]) -> bool:
+        """True se tutti i blit di run hanno texture e rettangolo e nessuno si sovrappone a un altro."""
+        if any(c[3] is None for c in run):
+            return False
+        rects = sorted(c[3] for c in run)  # -> per bordo sinistro: si confronta solo con i rettangoli che iniziano prima del bordo destro
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            for ox0, oy0, ox1, oy1 in rects[i + 1:]:
+                if ox0 >= x1:
+                    break
+                if oy0 < y1 and y0 < oy1:
+                    return False
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Comandi per tipo e chiamate g2d dell'ultimo frame (solo in modalità profile)."""
+        return dict(self.__stats)
@@ -0,0 +1,262 @@
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any
+
+# CORE
+from .file_management import read_settings
+
+# STATE
+from ..state import Action, Direction
+
+
+# ======== DEFAULTS PER ENTITÀ ========
+# -> i valori di default dei campi sono gli stessi fallback usati in precedenza dai costruttori
+
+@dataclass(frozen=True)
+class ArthurDefaults:
+    width: int = 21
+    height: int = 32
+    speed: float = 5
+    gravity: float = 0.7
+    jump_speed: float = 10.0
+    health: float = 100
+    max_health: float = 100
+    invincibility_time: int = 60
+    sprite_cycle_speed: int = 4
+    default_height: int = 32
+    crouched_height: int = 23
+    default_width: int = 21
+    laddered_width: int = 19
+    throw_interval: int = 10
+
+
+@dataclass(frozen=True)
+class ZombieDefaults:
+    health: float = 70.0
+    max_health: float = 70.0
+    width: int = 21
+    height: int = 70
+    speed: float = 1.0
+    gravity: float = 0.7
+    min_walk_distance: float = 150.0
+    max_walk_distance: float = 300.0
+    sprite_cycle_speed: int = 6
+    direction: Direction = Direction.RIGHT
+    damage: float = 30.0
+    attack_interval: int = 50
+    min_dist_x: float = 70
+    max_dist_x: float = 200
+    spawn_min_dist_x: float = 50
+    spawn_max_dist_x: float = 250
+    spawn_width: int = 21
+    spawn_height: int = 32
+    spawn_chance: float = 0.005
+    max_alive: int = 6  # -> limite di Zombie vivi imposto dallo Spawner
+    despawn_after: int | None = 150  # -> tick di sonno fuori dalla regione attiva prima della rimozione (None: mai)
+
+
+@dataclass(frozen=True)
+class PlantDefaults:
+    health: float = 40.0
+    max_health: float = 40.0
+    damage: float = 10.0
+    damage_interval: int = 60
+    width: int = 21
+    height: int = 32
+    direction: Direction = Direction.RIGHT
+    attack_interval: int = 180
+    projectile_speed: float = 2.0
+    projectile_damage: float = 20.0
+    sprite_cycle_speed: int = 6
+    min_dist_x: float = 100
+    max_dist_x: float = 150
+    spawn_min_dist_x: float | None = None  # -> None: si usano i parametri di Plant.auto_init
+    spawn_max_dist_x: float | None = None
+    spawn_width: int = 21
+    spawn_height: int = 32
+    spawn_chance: float = 0.005
+    max_alive: int = 4
+    despawn_after: int | None = 300
+
+
+@dataclass(frozen=True)
+class EyeBallDefaults:
+    speed: float = 2.0
+    damage: float = 10
+    max_travel_distance: float = 400.0
+    sprite_cycle_speed: int = 6
+    direction: Direction = Direction.RIGHT
+    width: int = 8
+    despawn_after: int | None = 0
+    pool_size: int = 8  # -> oggetti tenuti dal Pool di Game per il riuso (0: nessun riuso)
+
+
+@dataclass(frozen=True)
+class TorchDefaults:
+    damage: float = 50
+    speed: float = 7.0
+    gravity: float = 0.7
+    sprite_cycle_speed: int = 4
+    action: Action = Action.ATTACKING
+    direction: Direction = Direction.RIGHT
+    despawn_after: int | None = 0
+    pool_size: int = 8
+
+
+@dataclass(frozen=True)
+class FlameDefaults:
+    damage: float = 1
+    life_time: int = 60
+    sprite_cycle_speed: int = 6
+    despawn_after: int | None = 0
+    pool_size: int = 8
+
+
+@dataclass(frozen=True)
+class DoorDefaults:
+    name: str = "Door"
+    speed: float = 3.0
+    sprite_cycle_speed: int = 6
+    passage_delay: int = 60
+
+
+# ======== SETTINGS ========
+@dataclass(frozen=True)
+class Settings:
+    """Impostazioni di gioco tipizzate e immutabili.
+
+    Ogni sezione per entità del JSON ("Arthur": {"defaults": {...}}, ...)
+    diventa un oggetto *Defaults congelato, accessibile come attributo
+    (settings.zombie, settings.plant, ...). Tipi e chiavi vengono validati
+    una sola volta, al momento della costruzione.
+    """
+    camera_width: int = 430
+    camera_height: int = 230
+    scale: float = 1
+    fps: int = 30
+    fixed_timestep: bool = False  # -> loop a tempo fisso (g2d.fixed_loop) invece di un tick per frame
+    max_frame_skip: int = 5
+    max_enemies: int = 8  # -> limite globale di nemici vivi generati dallo Spawner
+    spawn_budget: int = 1  # -> spawn massimi per tick
+    active_margin: int = 100  # -> px attorno alla vista della camera in cui gli attori restano svegli
+    batched_physics: bool = False  # -> modalità a componenti: Zombie, Torch ed EyeBall mossi in blocco da Bodies
+    render_profile: bool = False  # -> mostra a schermo i comandi di disegno e le chiamate g2d di ogni frame
+
+    arthur: ArthurDefaults = field(default_factory=ArthurDefaults)
+    zombie: ZombieDefaults = field(default_factory=ZombieDefaults)
+    plant: PlantDefaults = field(default_factory=PlantDefaults)
+    eye_ball: EyeBallDefaults = field(default_factory=EyeBallDefaults)
+    torch: TorchDefaults = field(default_factory=TorchDefaults)
+    flame: FlameDefaults = field(default_factory=FlameDefaults)
+    door: DoorDefaults = field(default_factory=DoorDefaults)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Settings":
+        """Costruisce le impostazioni a partire dal dizionario letto da settings.json.
+
+        Le chiavi mancanti assumono il valore di default.
+
+        Raises:
+            TypeError: se un valore non ha il tipo atteso.
+            ValueError: se una chiave è sconosciuta o un nome di Direction/Action non esiste.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("settings must be a dict")
+
+        values: dict[str, Any] = {}
+        for key, value in data.items():
+            if key in _SECTIONS:
+                if not isinstance(value, dict):
+                    raise TypeError(f"{key} must be a dict")
+                name = _SECTIONS[key]
+                values[name] = _build(_SECTION_TYPES[name], value.get("defaults", {}), f"{key}.defaults")
+            else:
+                values[key] = value
+
+        return _build(cls, values, "settings")
+
+    def defaults(self, name: str) -> Any:
+        """Restituisce l'oggetto di default dell'entità dal suo nome nel JSON (es. "Zombie")."""
+        if name not in _SECTIONS:
+            raise ValueError(f"unknown settings section {name!r}")
+        return getattr(self, _SECTIONS[name])
+
+
+_SECTIONS: dict[str, str] = {
+    "Arthur": "arthur",
+    "Zombie": "zombie",
+    "Plant": "plant",
+    "EyeBall": "eye_ball",
+    "Torch": "torch",
+    "Flame": "flame",
+    "Door": "door",
+}  # -> nome della sezione nel JSON -> campo di Settings
+_SECTION_TYPES: dict[str, type] = {f.name: f.type for f in fields(Settings) if f.name in _SECTIONS.values()}
+
+
+def _check(value: Any, expected: Any, where: str) -> Any:
+    if isinstance(expected, type) and issubclass(expected, Enum):
+        if isinstance(value, expected):
+            return value
+        if not isinstance(value, str):
+            raise TypeError(f"{where} must be a {expected.__name__} name")
+        try:
+            return expected[value]
+        except KeyError:
+            raise ValueError(f"{where}: unknown {expected.__name__} {value!r}") from None
+
+    if expected is float or expected == float | None:
+        if value is None and expected is not float:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{where} must be an int or float")
+        return value  # -> int e float vengono mantenuti così come sono nel JSON
+
+    if expected == int | None:
+        if value is None:
+            return None
+        expected = int
+
+    if (isinstance(value, bool) and expected is not bool) or not isinstance(value, expected):
+        raise TypeError(f"{where} must be {'an' if expected is int else 'a'} {expected.__name__}")
+    return value
+
+
+def _build(cls: type, data: dict[str, Any], where: str) -> Any:
+    if not isinstance(data, dict):
+        raise TypeError(f"{where} must be a dict")
+
+    types = {f.name: f.type for f in fields(cls)}
+    unknown = set(data) - set(types)
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+
+    return cls(**{key: _check(value, types[key], f"{where}.{key}") for key, value in data.items()})
+
+
+# ======== SERVIZIO ========
+_settings: Settings | None = None
+
+
+def get_settings() -> Settings:
+    """Restituisce le impostazioni di processo.
+
+    settings.json viene letto e validato solo alla prima chiamata (o dopo
+    reload_settings); le chiamate successive restituiscono sempre lo
+    stesso oggetto immutabile, senza I/O.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings.from_dict(read_settings())
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Rilegge settings.json e sostituisce le impostazioni in cache.
+
+    Gli oggetti già costruiti mantengono i valori con cui sono stati creati;
+    le costanti di modulo calcolate all'import (es. CAMERA_WIDTH) non cambiano.
+    """
+    global _settings
+    _settings = None
+    return get_settings()
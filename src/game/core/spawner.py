@@ -0,0 +1,151 @@
+import math
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING: from .game import Game
+
+
+class Spawner:
+    """Pianificatore degli spawn dei nemici, guidato da eventi.
+
+    Per ogni tipo (con un metodo di classe auto_init(player, game)) viene
+    estratto il tick del prossimo spawn da una distribuzione geometrica
+    con probabilità rate per tick: la frequenza media resta quella di un
+    tiro per frame contro rate, ma tra un evento e l'altro non viene
+    estratto nessun numero casuale.
+
+    Quando un evento scade lo spawn viene limitato da:
+    - caps: numero massimo di attori vivi per tipo,
+    - max_alive: numero massimo di attori vivi di tutti i tipi gestiti,
+    - budget: numero massimo di spawn per tick; gli eventi oltre il budget
+      restano in attesa e vengono ritentati al tick successivo, prima
+      di quelli scaduti dopo.
+
+    Un evento bloccato da un limite, o senza punto di spawn valido
+    (auto_init restituisce None), viene scartato e ne viene pianificato
+    un altro. I contatori per tipo sono restituiti da stats().
+    """
+
+    COUNTERS = ("spawned", "capped", "no_site", "deferred")
+
+    def __init__(
+        self,
+        rates: dict[type, float],
+        *,
+        caps: dict[type, int] | None = None,
+        max_alive: int | None = None,
+        budget: int = 1,
+    ) -> None:
+        self.rates = rates
+        self.caps = caps if caps is not None else {}
+        self.max_alive = max_alive
+        self.budget = budget
+
+        self.__due: dict[type, float] = {}  # -> tick del prossimo evento per tipo
+        self.__counters: dict[type, dict[str, int]] = {t: dict.fromkeys(self.COUNTERS, 0) for t in rates}
+
+
+    # ======== PROPERTIES ========
+    @property
+    def rates(self) -> dict[type, float]:
+        return self.__rates
+    @rates.setter
+    def rates(self, value: dict[type, float]) -> None:
+        if not isinstance(value, dict):
+            raise TypeError("rates must be a dict")
+        for t, rate in value.items():
+            if not isinstance(t, type) or isinstance(rate, bool) or not isinstance(rate, (int, float)):
+                raise TypeError("rates must map types to an int or float")
+        self.__rates = dict(value)
+
+    @property
+    def caps(self) -> dict[type, int]:
+        return self.__caps
+    @caps.setter
+    def caps(self, value: dict[type, int]) -> None:
+        if not isinstance(value, dict):
+            raise TypeError("caps must be a dict")
+        for t, cap in value.items():
+            if not isinstance(t, type) or isinstance(cap, bool) or not isinstance(cap, int):
+                raise TypeError("caps must map types to an int")
+        self.__caps = dict(value)
+
+    @property
+    def max_alive(self) -> int | None:
+        return self.__max_alive
+    @max_alive.setter
+    def max_alive(self, value: int | None) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, type(None))):
+            raise TypeError("max_alive must be an int or None")
+        self.__max_alive = value
+
+    @property
+    def budget(self) -> int:
+        return self.__budget
+    @budget.setter
+    def budget(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError("budget must be an int")
+        self.__budget = value
+
+
+    # ======== METHODS ========
+    def next_gap(self, t: type) -> float:
+        """Estrae il numero di tick fino al prossimo evento di t (inf se rate <= 0)."""
+        rate = self.rates[t]
+        if rate <= 0:
+            return math.inf
+        if rate >= 1:
+            return 1
+        return 1 + int(math.log(1.0 - random.random()) / math.log(1.0 - rate))
+
+    def due(self, t: type) -> float:
+        """Tick in cui scade il prossimo evento di t (inf se non pianificato)."""
+        return self.__due.get(t, math.inf)
+
+    def tick(self, game: "Game") -> None:
+        """Applica gli eventi scaduti al tick corrente di game.
+
+        Alla prima chiamata pianifica il primo evento di ogni tipo. Senza
+        giocatore gli eventi restano in attesa.
+        """
+        now, due = game.count(), self.__due
+        for t in self.rates:
+            if t not in due:
+                due[t] = now + self.next_gap(t)
+
+        player = game.player
+        if player is None:
+            return
+
+        budget = self.budget
+        alive = None
+        for t in sorted(self.rates, key=due.__getitem__):  # -> prima gli eventi rimandati, nessun tipo resta a secco
+            if due[t] > now:
+                break
+            counters = self.__counters.setdefault(t, dict.fromkeys(self.COUNTERS, 0))
+            if budget <= 0:
+                counters["deferred"] += 1  # -> ritentato al prossimo tick
+                continue
+            due[t] = now + self.next_gap(t)
+
+            if alive is None:
+                alive = {k: len(game.of_type(k)) for k in self.rates}  # -> snapshot in cache dell'arena, O(1)
+            cap = self.caps.get(t)
+            if (cap is not None and alive[t] >= cap) or (self.max_alive is not None and sum(alive.values()) >= self.max_alive):
+                counters["capped"] += 1
+                continue
+
+            actor = t.auto_init(player=player, game=game)
+            if actor is None:
+                counters["no_site"] += 1
+                continue
+
+            game.spawn(actor)
+            alive[t] += 1  # -> lo spawn può essere differito: il conteggio dell'arena non lo vede ancora
+            budget -= 1
+            counters["spawned"] += 1
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Contatori per tipo (spawned, capped, no_site, deferred), per la strumentazione."""
+        return {t.__name__: dict(c) for t, c in self.__counters.items()}
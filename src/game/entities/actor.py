@@ -3,16 +3,20 @@
 @author  Michele Tomaiuolo - https://tomamic.github.io/
 @license This software is free - https://opensource.org/license/mit
 """
+from contextlib import contextmanager
 from copy import copy
 
 # STATE
-from ..state import Sprite
+from ..state import Sprite, Checked
 
 Point = tuple[float, float]
 
-class Actor:
+class Actor(Checked):
     """Interface to be implemented by each game character.
+    Subclasses keep their hot fields in `__slots__` (see `Checked`).
     """
+    __slots__ = ()
+
     def move(self, arena: "Arena"):
         """Called by Arena, at the actor’s turn.
         """
@@ -57,88 +61,484 @@ def check_overlap(a1: Actor, a2: Actor) -> bool:
             x2 < x1 + w1 and x1 < x2 + w2)
 
 
+class StaticIndex:
+    """Index of static actors for interval queries, built once.
+
+    The bounding boxes are sorted by their left edge; each element is also
+    the root of a subtree of the implicit balanced tree over that array
+    (the middle of its range) and stores the max right edge in the subtree.
+    A query visits only the subtrees that can reach the queried x range,
+    so it costs O(log n + k), even with very long pieces (e.g. the ground).
+    """
+    def __init__(self, actors=()):
+        self.build(actors)
+
+    def build(self, actors):
+        """Index the given actors, at their current position and size.
+        """
+        boxes = []
+        for a in actors:
+            (x, y), (w, h) = a.pos(), a.size()
+            boxes.append((x, y, x + w, y + h, a))
+        boxes.sort(key=lambda b: b[0])
+        self._boxes = boxes
+        self._reach = [0] * len(boxes)
+        stack = [(0, len(boxes), False)]
+        while stack:  # -> post-order: reach of the children before their root
+            lo, hi, done = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if not done:
+                stack += [(lo, hi, True), (lo, mid, False), (mid + 1, hi, False)]
+                continue
+            reach = boxes[mid][2]
+            if lo < mid:
+                reach = max(reach, self._reach[(lo + mid) // 2])
+            if mid + 1 < hi:
+                reach = max(reach, self._reach[(mid + 1 + hi) // 2])
+            self._reach[mid] = reach
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Return the actors whose box collides with or touches the rect
+        with corners (x0, y0) and (x1, y1), in no particular order.
+        """
+        boxes, reach, found = self._boxes, self._reach, []
+        stack = [(0, len(boxes))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if reach[mid] < x0:
+                continue  # -> the whole subtree ends before the rect
+            bx0, by0, bx1, by1, a = boxes[mid]
+            if bx0 <= x1:
+                stack.append((mid + 1, hi))
+                if x0 <= bx1 and by0 <= y1 and y0 <= by1:
+                    found.append(a)
+            stack.append((lo, mid))
+        return found
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+
 class Arena:
     """A generic 2D game, with a given size in pixels and a list of actors.
+
+    Actors are kept in an insertion-ordered registry (O(1) spawn, kill and
+    membership), also indexed by each class of their MRO, for `of_type`.
+    Both `actors` and `of_type` return immutable snapshots, cached until
+    the next spawn or kill of a matching actor.
+
+    During a tick (or a `deferred` block), spawns and kills are queued and
+    applied in one batch, in the order they were requested, by `flush`:
+    the registry never changes while actors are being moved.
+
+    Moving actors are also indexed in a persistent spatial hash (tiles of
+    40px), updated on spawn and kill, and after each tick only for the
+    actors whose tile range has changed. Actors with a `static` attribute
+    set to True are kept, instead, in a `StaticIndex` sorted on x, built
+    once (at the first query after they are spawned); call `refresh` if
+    they are moved. Static actors are never tested against each other.
+
+    Any actor can be put to sleep (`sleep`) and woken up (`wake`): a
+    sleeping actor stays registered, but it is not moved and it is taken
+    out of the spatial hash, so it costs nothing to the tick. Sleeping
+    actors do not move, so they are kept in their own `StaticIndex`,
+    rebuilt lazily, and `sleepers_in` finds the ones in a region.
+
+    Optionally, each actor type gets a collision layer (one bit) and a mask
+    of the layers it may collide with, through `allow_collision`; then
+    the other pairs are discarded by the broadphase with a bitwise test.
+    An actor takes the layers and masks of all the classes in its MRO.
     """
+    TILE = 40
+
     def __init__(self, size: Point):
         """Create an arena, with given dimensions in pixels.
         """
         self._w, self._h = size
         self._count = 0
         self._turn = -1
-        self._actors = []
+        self._actors = {}  # actor -> registration number, in order of registration
+        self._types = {}  # class -> {actor: None}, for every class in the MRO of the actors
+        self._views = {}  # class (None for all, False for the awake ones) -> cached tuple of actors
         self._curr_keys = self._prev_keys = list()
-        self._collisions = []
+        self._current = None
+        self._collisions = {}
+        self._collision_pairs = []
+        # divide the arena in tiles, for efficient collision detection
+        self._nx, self._ny = -(-self._w // self.TILE),  -(-self._h // self.TILE)  # ceil div
+        self._cells = {}  # only the occupied tiles: tile index -> set of actors
+        self._ranges = {}  # actor -> (tx0, tx1, ty0, ty1) currently indexed
+        self._static = set()
+        self._statics = None  # StaticIndex of the static actors, None when it must be rebuilt
+        self._layers = {}  # type -> collision layer (one bit)
+        self._masks = {}  # type -> layers it may collide with; empty: all pairs are tested
+        self._bits = {}  # actor -> (layer, mask), merged along the MRO of its type
+        self._sleeping = {}  # actor -> tick when it fell asleep
+        self._sleepers = None  # StaticIndex of the sleeping actors, None when it must be rebuilt
+        self._spawned = 0
+        self._pending = None  # queued (spawn?, actor) commands, while deferring; None: apply immediately
+        self._last = {}  # actor -> last queued command, to drop repeated kills
 
     def spawn(self, a: Actor):
         """Register an actor into this arena.
         Actors are blitted in their order of registration.
+        While deferring, the registration is queued until `flush`.
         """
-        if a not in self._actors:
-            self._actors.append(a)
+        if self._pending is not None:
+            self._pending.append((True, a))
+            self._last[a] = True
+        elif a not in self._actors:
+            self._actors[a] = self._spawned
+            self._spawned += 1
+            for t in type(a).__mro__[:-1]:  # -> except object
+                self._types.setdefault(t, {})[a] = None
+            self._invalidate(a)
+            self._bits[a] = self._type_bits(type(a))
+            if getattr(a, "static", False) is True:
+                self._static.add(a)
+                self._statics = None  # -> rebuilt at the next query
+            else:
+                self._index(a)
 
     def kill(self, a: Actor):
         """Remove an actor from this arena.
+        While deferring, the removal is queued until `flush`;
+        a kill already queued for the same actor is not repeated.
+        """
+        if self._pending is not None:
+            if self._last.get(a) is not False:
+                self._pending.append((False, a))
+                self._last[a] = False
+        elif a in self._actors:
+            del self._actors[a]
+            for t in type(a).__mro__[:-1]:
+                self._types[t].pop(a, None)
+            self._invalidate(a)
+            del self._bits[a]
+            if self._sleeping.pop(a, None) is not None:
+                self._sleepers = None
+                self._views.pop(False, None)
+            if a in self._static:
+                self._static.discard(a)
+                self._statics = None
+            else:
+                self._unindex(a)
+
+    @contextmanager
+    def deferred(self):
+        """Queue spawns and kills until the end of the block, then apply
+        them with `flush`. Nested blocks share the outermost queue.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._pending = None
+
+    def flush(self):
+        """Apply the queued spawns and kills, in their order.
+        """
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = None  # -> apply for real
+        for spawn, a in pending:
+            if spawn:
+                self.spawn(a)
+            else:
+                self.kill(a)
+        pending.clear()
+        self._last.clear()
+        self._pending = pending
+
+    def allow_collision(self, t1: type, t2: type):
+        """Let actors of type t1 and t2 (subclasses included) collide.
+        Once a pair is allowed, the broadphase of the tick only tests the
+        allowed pairs; actors of other types are never tested at all.
+        """
+        layers, masks = self._layers, self._masks
+        for t in (t1, t2):
+            if t not in layers:
+                layers[t] = 1 << len(layers)
+        masks[t1] = masks.get(t1, 0) | layers[t2]
+        masks[t2] = masks.get(t2, 0) | layers[t1]
+        for a in self._bits:
+            self._bits[a] = self._type_bits(type(a))
+
+    def _type_bits(self, t: type) -> tuple[int, int]:
+        layer = mask = 0
+        for c in t.__mro__:
+            layer |= self._layers.get(c, 0)
+            mask |= self._masks.get(c, 0)
+        return layer, mask
+
+    def sleep(self, a: Actor):
+        """Put a registered actor to sleep: it is not moved any more and
+        it leaves the spatial hash (a static one stays in its index),
+        until `wake`.
+        """
+        if a in self._actors and a not in self._sleeping:
+            self._sleeping[a] = self._count
+            self._sleepers = None
+            self._views.pop(False, None)
+            self._unindex(a)
+
+    def wake(self, a: Actor):
+        """Wake up a sleeping actor, back in the spatial hash.
+        """
+        if self._sleeping.pop(a, None) is not None:
+            self._sleepers = None
+            self._views.pop(False, None)
+            if a not in self._static:
+                self._index(a)
+
+    def sleeping_since(self, a: Actor) -> int | None:
+        """Return the tick when the actor fell asleep, or None if it is awake.
+        """
+        return self._sleeping.get(a)
+
+    def sleepers_in(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Return the sleeping actors whose box collides with or touches
+        the rect with corners (x0, y0) and (x1, y1), in no particular order.
+        """
+        if not self._sleeping:
+            return []
+        if self._sleepers is None:
+            self._sleepers = StaticIndex(self._sleeping)
+        return self._sleepers.query(x0, y0, x1, y1)
+
+    def refresh(self, a: Actor):
+        """Update the indexes for an actor (e.g. a static one that was moved).
         """
-        if a in self._actors:
-            self._actors.remove(a)
+        if a in self._sleeping:
+            self._sleepers = None
+        if a in self._static:
+            self._statics = None
+        elif a in self._ranges:
+            self._reindex(a)
+
+    def _static_index(self) -> StaticIndex:
+        if self._statics is None:
+            self._statics = StaticIndex(a for a in self._actors if a in self._static)
+        return self._statics
 
     def tick(self, keys=None):
-        """Move all actors (through their own move method).
+        """Move all the awake actors (through their own move method,
+        see `_movers`), then detect collisions among them.
+        Spawns and kills requested by the actors are applied
+        after all the moves, before collision detection.
+        """
+        with self.deferred():
+            self._prev_keys = self._curr_keys
+            self._curr_keys = keys if keys is not None else []
+            for self._turn, a in enumerate(reversed(self._movers())):  # -> the registry is frozen until flush
+                self._current = a
+                a.move(self)
+            self._current = None
+            self._count += 1
+            self.flush()
+            self._detect_collisions()
+
+    def _movers(self) -> tuple:
+        """Return the actors to move one by one at this tick: all the awake
+        ones. A subclass may leave out those it moves in another way.
         """
-        actors = list(reversed(self._actors))
-        self._detect_collisions(actors)
-        self._prev_keys = self._curr_keys
-        self._curr_keys = keys if keys is not None else []
-        for self._turn, a in enumerate(actors):
-            a.move(self)
-        self._count += 1
+        return self.awake()
 
+    # ======== SPATIAL HASH ========
+    def _tile_range(self, a: Actor) -> tuple[int, int, int, int]:
+        tile, nx, ny = self.TILE, self._nx, self._ny
+        x, y, w, h = (round(v) for v in a.pos() + a.size())
+        # tiles are clamped, so actors partly out of the arena still meet
+        tx0, tx1 = (min(max(t, 0), nx - 1) for t in ((x - 1) // tile, (x + w + 1) // tile))
+        ty0, ty1 = (min(max(t, 0), ny - 1) for t in ((y - 1) // tile, (y + h + 1) // tile))
+        return tx0, tx1, ty0, ty1
+
+    def _tiles(self, r: tuple[int, int, int, int]) -> list[int]:
+        tx0, tx1, ty0, ty1 = r
+        nx = self._nx
+        return [ty * nx + tx for ty in range(ty0, ty1 + 1) for tx in range(tx0, tx1 + 1)]
+
+    def _index(self, a: Actor, r: tuple[int, int, int, int] | None = None):
+        r = r if r is not None else self._tile_range(a)
+        self._ranges[a] = r
+        for t in self._tiles(r):
+            # add actor `a` to the tile @ t
+            self._cells.setdefault(t, set()).add(a)
+
+    def _unindex(self, a: Actor):
+        r = self._ranges.pop(a, None)
+        if r is None:
+            return
+        for t in self._tiles(r):
+            cell = self._cells.get(t)
+            if cell is not None:
+                cell.discard(a)
+                if not cell:
+                    del self._cells[t]
+
+    def _reindex(self, a: Actor):
+        r = self._tile_range(a)
+        if r != self._ranges.get(a):  # -> moves between tiles only when the range changes
+            self._unindex(a)
+            self._index(a, r)
+
+    # ======== COLLISION DETECTION ========
     def _naive_collisions(self, actors):
-        # self._collisions = [[a2 for a2 in actors if a1 is not a2 and check_collision(a1, a2)] for a1 in actors]
-        self._collisions.clear()
-        for a1 in actors:
-            colls1 = []
-            for a2 in actors:
-                if a1 is not a2 and check_collision(a1, a2):
-                    colls1.append(a2)
-            self._collisions.append(colls1)
-
-    def _detect_collisions(self, actors):
-        self._collisions.clear()
-        # divide the arena in tiles, for efficient collision detection
-        tile = 40
-        nx, ny = -(-self._w // tile),  -(-self._h // tile)  # ceil div
-        cells = [set() for _ in range(nx * ny)]  # each tile is a set
-        for i, a in enumerate(actors):
-            x, y, w, h = (round(v) for v in a.pos() + a.size())
-            for tx in range((x - 1) // tile, 1 + (x + w + 1) // tile):
-                for ty in range((y - 1) // tile, 1 + (y + h + 1) // tile):
-                    if 0 <= tx < nx and 0 <= ty < ny:
-                        # add actor `a` to the tile @ (tx, ty)
-                        cells[ty * nx + tx].add(i)
-        for i, a in enumerate(actors):
-            neighs = set()
-            x, y, w, h = (round(v) for v in a.pos() + a.size())
-            for tx in range((x - 1) // tile, 1 + (x + w + 1) // tile):
-                for ty in range((y - 1) // tile, 1 + (y + h + 1) // tile):
-                    if 0 <= tx < nx and 0 <= ty < ny:
-                        # all actors sharing some tile with `a`
-                        neighs |= cells[ty * nx + tx]
-            colls = [actors[j] for j in sorted(neighs, reverse=True)
-                     if i != j and check_collision(a, actors[j])]
-            self._collisions.append(colls)
+        """Reference O(n^2) version of `_detect_collisions`.
+        """
+        self._collisions = {}
+        self._collision_pairs = []
+        for i, a1 in enumerate(actors):
+            for a2 in actors[i + 1:]:
+                if check_collision(a1, a2):
+                    self._collisions.setdefault(a1, []).append(a2)
+                    self._collisions.setdefault(a2, []).append(a1)
+                    self._collision_pairs.append((a1, a2))
+        return self._collision_pairs
+
+    def _detect_collisions(self, actors=None):
+        """Broadphase on the spatial hash, then bounding-box check of the
+        candidate pairs only. Fill the per-actor lists used by `collisions`
+        and return the colliding pairs (a1, a2), ordered as the actors.
+
+        Without arguments, use the persistent indexes of the arena: moved
+        actors are re-indexed in the hash, and each non-static actor finds
+        the other ones in the hash and the static ones in the static index;
+        only pairs whose layers are allowed to collide are tested. With a
+        list of actors, hash them from scratch and test every candidate
+        pair among them.
+        """
+        bits = self._bits
+        filtered = actors is None and bool(self._masks)
+        if actors is None:
+            order = self._actors
+            dynamic = [a for a in self.awake() if a in self._ranges]
+            for a in dynamic:
+                self._reindex(a)
+            cells, ranges, statics = self._cells, self._ranges, self._static_index()
+        else:
+            order = {a: i for i, a in enumerate(actors)}
+            dynamic, cells, ranges, statics = actors, {}, {}, None
+            for a in actors:
+                ranges[a] = r = self._tile_range(a)
+                for t in self._tiles(r):
+                    cells.setdefault(t, set()).add(a)
+        candidates = {}
+        mask = -1
+        for a in dynamic:
+            if filtered:
+                mask = bits[a][1]
+                if not mask:
+                    continue  # -> no layer can touch it
+            i = order[a]
+            for t in self._tiles(ranges[a]):
+                for b in cells[t]:
+                    if b is not a and (not filtered or bits[b][0] & mask):
+                        j = order[b]
+                        candidates[(i, j) if i < j else (j, i)] = (a, b) if i < j else (b, a)
+            if statics:
+                (x, y), (w, h) = a.pos(), a.size()
+                for b in statics.query(x, y, x + w, y + h):
+                    if not filtered or bits[b][0] & mask:
+                        j = order[b]
+                        candidates[(i, j) if i < j else (j, i)] = (a, b) if i < j else (b, a)
+        self._collisions = {}
+        self._collision_pairs = []
+        for key in sorted(candidates):
+            a1, a2 = candidates[key]
+            if check_collision(a1, a2):
+                self._collisions.setdefault(a1, []).append(a2)
+                self._collisions.setdefault(a2, []).append(a1)
+                self._collision_pairs.append((a1, a2))
+        return self._collision_pairs
 
     def collisions(self) -> list[Actor]:
-        """Get list of actors colliding with current actor
+        """Get list of actors colliding with current actor,
+        as detected at the end of the previous tick.
+
+        Collisions are detected once per tick, after all the moves (see
+        `tick`), so during `move` this list lags one tick behind: it
+        reflects the positions after the previous tick's moves, it does
+        not contain actors spawned since then and it may still contain
+        actors killed since then. Positions only change in `move`, so for
+        actors that were there at the end of the previous tick this is the
+        same as a check at the start of the current one.
+        """
+        return self._collisions.get(self._current, [])
+
+    def collision_pairs(self) -> list[tuple[Actor, Actor]]:
+        """Get the pairs of colliding actors detected in the last tick.
         """
-        t, colls = self._turn, self._collisions
-        return colls[t] if 0 <= t < len(colls) else []
+        return self._collision_pairs
 
-    def actors(self) -> list:
-        """Return a copy of the list of actors.
+    def actors_in(self, pos: Point, size: Point) -> list:
+        """Return the actors whose bounding box intersects the rect
+        (pos, size), in their order of registration.
+        Only the tiles covered by the rect, and the static actors near it,
+        are visited, so the cost depends on how many actors are there,
+        not on the whole population.
         """
-        return list(self._actors)
+        (x, y), (w, h) = pos, size
+        tile, nx, ny = self.TILE, self._nx, self._ny
+        tx0, tx1 = (min(max(int(t), 0), nx - 1) for t in (x // tile, (x + w) // tile))
+        ty0, ty1 = (min(max(int(t), 0), ny - 1) for t in (y // tile, (y + h) // tile))
+        cells, found = self._cells, set()
+        for t in self._tiles((tx0, tx1, ty0, ty1)):
+            found.update(cells.get(t, ()))
+        found.update(self._static_index().query(x, y, x + w, y + h))
+        found.update(self.sleepers_in(x, y, x + w, y + h))
+        result = []
+        for a in sorted(found, key=self._actors.__getitem__):
+            (ax, ay), (aw, ah) = a.pos(), a.size()
+            if ax < x + w and ax + aw > x and ay < y + h and ay + ah > y:
+                result.append(a)
+        return result
+
+    def actors(self) -> tuple:
+        """Return the actors, in their order of registration.
+        The tuple is a snapshot: it is safe to spawn or kill while
+        iterating it, and it is rebuilt only after the registry changes.
+        """
+        view = self._views.get(None)
+        if view is None:
+            view = self._views[None] = tuple(self._actors)
+        return view
+
+    def awake(self) -> tuple:
+        """Return the actors which are not sleeping, in their order of
+        registration, as a cached snapshot.
+        """
+        view = self._views.get(False)
+        if view is None:
+            sleeping = self._sleeping
+            view = self._views[False] = tuple(a for a in self._actors if a not in sleeping) if sleeping else self.actors()
+        return view
+
+    def of_type(self, t: type) -> tuple:
+        """Return the actors which are instances of class `t` (subclasses
+        included), in their order of registration, as a cached snapshot.
+        """
+        view = self._views.get(t)
+        if view is None:
+            view = self._views[t] = tuple(self._types.get(t, ()))
+        return view
+
+    def _invalidate(self, a: Actor):
+        views = self._views
+        views.pop(None, None)
+        views.pop(False, None)
+        for t in type(a).__mro__[:-1]:
+            views.pop(t, None)
 
     def size(self) -> Point:
         """Return the size (w, h) of the arena.
@@ -2,16 +2,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import random
 import pathlib
-from dataclasses import dataclass
 
 if TYPE_CHECKING:
     # CORE
     from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
+from ...core.pool import acquire
 
-if TYPE_CHECKING:
-    # PLAYER
-    from ..player import Arthur
+# PLAYER
+from ..player import Arthur
 
 # ACTOR
 from ..actor import Actor
@@ -25,7 +24,8 @@ from ..objects import Ladder
 from ..weapons import EyeBall
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clip, Clips
+from ...state.fields import number, integer
 
 # GUI
 from ...gui import GUIComponent, Bar
@@ -33,37 +33,6 @@ from ...gui import GUIComponent, Bar
 
 
 
-# HELPER CLASSES
-@dataclass
-class Range:
-    """Rappresenta un intervallo numerico con valore minimo e massimo."""
-
-    min: float
-    max: float
-
-    def __str__(self) -> str:
-        return f"<{self.min} -> {self.max}>"
-
-    def __repr__(self) -> str:
-        return f"Range({self.min}, {self.max})"
-
-
-@dataclass
-class Candidate:
-    """Rappresenta un possibile punto di spawn con distanza, altezza, range e direzione."""
-
-    distance: float
-    height: float
-    range: Range
-    direction: Direction
-
-    def __str__(self) -> str:
-        return f"< Candidate | {self.distance}, {self.height}, {self.range}, {self.direction} >"
-
-    def __repr__(self) -> str:
-        return f"Candidate({repr(self.distance)}, {repr(self.height)}, {repr(self.range)}, {repr(self.direction)})"
-
-
 PLANT_SPRITE_PATH = pathlib.Path(__file__).parent.parent.parent.parent / "data" / "textures" / "ghosts-goblins.png"
 
 # IDLE
@@ -92,8 +61,21 @@ PLANT_SPAWN_L2: Sprite = Sprite(path=PLANT_SPRITE_PATH, x=564, y=207, width=16,
 PLANT_SPAWN_L3: Sprite = Sprite(path=PLANT_SPRITE_PATH, x=564, y=207, width=16, height=24)
 PLANT_SPAWN_L4: Sprite = Sprite(path=PLANT_SPRITE_PATH, x=564, y=207, width=16, height=32)
 
+PLANT_CLIPS = Clips({
+    (Action.IDLE, Direction.RIGHT): Clip((PLANT_IDLE_R1,)),
+    (Action.IDLE, Direction.LEFT): Clip((PLANT_IDLE_L1,)),
+    (Action.ATTACKING, Direction.RIGHT): Clip((PLANT_ATTACK_R1, PLANT_ATTACK_R2, PLANT_ATTACK_R3, PLANT_ATTACK_R4), loop=False),
+    (Action.ATTACKING, Direction.LEFT): Clip((PLANT_ATTACK_L1, PLANT_ATTACK_L2, PLANT_ATTACK_L3, PLANT_ATTACK_L4), loop=False),
+    (Action.SPAWNING, Direction.RIGHT): Clip((PLANT_SPAWN_R1, PLANT_SPAWN_R2, PLANT_SPAWN_R3, PLANT_SPAWN_R4), loop=False),
+    (Action.SPAWNING, Direction.LEFT): Clip((PLANT_SPAWN_L1, PLANT_SPAWN_L2, PLANT_SPAWN_L3, PLANT_SPAWN_L4), loop=False),
+})
+
 
 class Plant(Actor):
+    __slots__ = ("x", "y", "sprite_cycle_counter", "__attack_cooldown", "__attack_interval", "__damage", "__damage_counter", "__damage_interval", "__health", "__health_bar", "__height", "__max_health", "__projectile_damage", "__projectile_speed", "__sprite_cycle_speed", "__state", "__width", "direction")
+    _checks = {"x": number("x"), "y": number("y"), "sprite_cycle_counter": integer("sprite_cycle_counter")}
+    clips = PLANT_CLIPS  # -> animazioni condivise dalla classe: ogni pianta ha solo la testina (sprite_cycle_counter)
+
     def __init__(
         self,
         x: int | float,
@@ -106,60 +88,40 @@ class Plant(Actor):
         projectile_damage: int | float | None = None,
         sprite_cycle_speed: int | None = None,
     ) -> None:
-        defaults: dict = read_settings().get("Plant", {}).get("defaults", {})
+        defaults = get_settings().plant
 
         # FORCED INIT
-        self.x = x
-        self.y = y
+        self._init_fields(x=x, y=y)
 
         # DEFAULTS
-        self.max_health = defaults.get("max_health", 40.0)
-        self.health = health if health is not None else defaults.get("health", 40.0)
-        self.damage = damage if damage is not None else defaults.get("damage", 10.0)
-        self.damage_interval = defaults.get("damage_interval", 60)
+        self.max_health = defaults.max_health
+        self.health = health if health is not None else defaults.health
+        self.damage = damage if damage is not None else defaults.damage
+        self.damage_interval = defaults.damage_interval
         self.damage_cooldown = 0
 
-        self.width = defaults.get("width", 21)
-        self.height = defaults.get("height", 32)
+        self.width = defaults.width
+        self.height = defaults.height
 
         # STATE
-        direction_str = defaults.get("direction", "RIGHT")
-        self.direction = direction if direction is not None else getattr(Direction, direction_str, Direction.RIGHT)
+        self.direction = direction if direction is not None else defaults.direction
         self.state = EntityState(action=Action.SPAWNING, direction=self.direction)
 
         self.sprite_cycle_counter = 0
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 6)
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
 
-        self.sprites = SpriteCollection()
-        self._init_sprites()
+        # GUI
+        self.__health_bar: Bar | None = None  # -> creata al primo accesso a gui e poi riusata
 
         # ATTACK
-        self.attack_interval = attack_interval if attack_interval is not None else defaults.get("attack_interval", 180)
+        self.attack_interval = attack_interval if attack_interval is not None else defaults.attack_interval
         self.attack_cooldown = self.attack_interval
 
-        self.projectile_speed = projectile_speed if projectile_speed is not None else defaults.get("projectile_speed", 2.0)
-        self.projectile_damage = projectile_damage if projectile_damage is not None else defaults.get("projectile_damage", 20.0)
+        self.projectile_speed = projectile_speed if projectile_speed is not None else defaults.projectile_speed
+        self.projectile_damage = projectile_damage if projectile_damage is not None else defaults.projectile_damage
 
 
     # ======== PROPERTIES ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: int | float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be int or float")
-        self.__x = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: int | float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be int or float")
-        self.__y = float(value)
-
     @property
     def health(self) -> float:
         if self.__health > 0:
@@ -237,15 +199,6 @@ class Plant(Actor):
             raise TypeError("state must be a State")
         self.__state = value
 
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("sprite_cycle_counter must be int")
-        self.__sprite_cycle_counter = int(value)
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
@@ -300,51 +253,6 @@ class Plant(Actor):
         self.sprite_cycle_counter += 1
         return self.sprite_cycle_counter
 
-    # === SPRITES SETUP ===
-    def _init_sprites(self) -> None:
-        global PLANT_IDLE_R1, PLANT_IDLE_L1
-        global PLANT_ATTACK_R1, PLANT_ATTACK_R2, PLANT_ATTACK_R3, PLANT_ATTACK_R4
-        global PLANT_ATTACK_L1, PLANT_ATTACK_L2, PLANT_ATTACK_L3, PLANT_ATTACK_L4
-        global PLANT_SPAWN_R1, PLANT_SPAWN_R2, PLANT_SPAWN_R3, PLANT_SPAWN_R4
-        global PLANT_SPAWN_L1, PLANT_SPAWN_L2, PLANT_SPAWN_L3, PLANT_SPAWN_L4
-
-        if self.state.action == Action.DEAD:
-            return
-
-        # IDLE
-        self.sprites[Action.IDLE, Direction.RIGHT] = [PLANT_IDLE_R1]
-        self.sprites[Action.IDLE, Direction.LEFT] = [PLANT_IDLE_L1]
-
-        # ATTACKING
-        self.sprites[Action.ATTACKING, Direction.RIGHT] = [
-            PLANT_ATTACK_R1,
-            PLANT_ATTACK_R2,
-            PLANT_ATTACK_R3,
-            PLANT_ATTACK_R4,
-        ]
-        self.sprites[Action.ATTACKING, Direction.LEFT] = [
-            PLANT_ATTACK_L1,
-            PLANT_ATTACK_L2,
-            PLANT_ATTACK_L3,
-            PLANT_ATTACK_L4,
-        ]
-
-        self.sprites[Action.SPAWNING, Direction.RIGHT] = [
-            PLANT_SPAWN_R1,
-            PLANT_SPAWN_R2,
-            PLANT_SPAWN_R3,
-            PLANT_SPAWN_R4,
-        ]
-        self.sprites[Action.SPAWNING, Direction.LEFT] = [
-            PLANT_SPAWN_L1,
-            PLANT_SPAWN_L2,
-            PLANT_SPAWN_L3,
-            PLANT_SPAWN_L4,
-        ]
-
-        self.sprites[Action.DEAD, Direction.RIGHT] = []
-        self.sprites[Action.DEAD, Direction.LEFT] = []
-
     # === INTERFACE IMPLEMENTATION ===
     def pos(self) -> tuple[float, float]:
         return self.x, self.y
@@ -384,8 +292,10 @@ class Plant(Actor):
             if self.attack_cooldown > 0:
                 self.attack_cooldown -= 1
 
-            if self.attack_cooldown <= 0 and arena.player is not None:
-                player = arena.player
+            player = None
+            if self.attack_cooldown <= 0:
+                player = arena.nearest(Arthur, (self.x + self.width / 2, self.y + self.height / 2))
+            if player is not None:
                 # -> scelgo la direzione in base alla posizione di Arthur
                 if player.x + player.width / 2 >= self.x + self.width / 2:
                     self.state.direction = Direction.RIGHT
@@ -401,33 +311,45 @@ class Plant(Actor):
                 self._shoot_eyeball(arena)
                 self._set_state_action(Action.IDLE)
 
+    def animate(self) -> None:
+        """Fa avanzare di un passo l'animazione della pianta (chiamato da Game.tick).
+
+        Incrementa lo sprite_cycle_counter e adatta altezza e posizione
+        verticale al nuovo frame, mantenendo la pianta ancorata al terreno.
+        Non fa nulla in stato DEAD o se non esistono sprite per lo stato
+        corrente.
+        """
+
+        if self.state.action not in (Action.IDLE, Action.ATTACKING, Action.SPAWNING):
+            return
+        if (self.state.action, self.state.direction) not in self.clips:
+            return
+
+        self.sprite_cycle_counter += 1
+        sprite: Sprite = self.sprite()  # type: ignore
+
+        self.y = self.y + self.height - sprite.height
+        self.height = sprite.height
+
     def sprite(self) -> Sprite | None:
         """Restituisce lo sprite corrente della pianta in base allo stato.
 
         Usa la coppia (azione, direzione) dello stato corrente per
-        recuperare la lista di sprite corrispondente dalla collezione:
+        recuperare la clip corrispondente:
 
-        - in stato IDLE usa un ciclo continuo sui frame (looping)
-        - in stato ATTACKING e SPAWNING avanza l animazione in modo
-          bloccato, fino all ultimo frame, usando una logica di
-          looping bloccato
-        - in stato DEAD restituisce sempre None
+        - in stato IDLE la clip è ciclica
+        - in stato ATTACKING e SPAWNING non è in loop e si ferma
+          sull ultimo frame
+        - in stato DEAD non c'è clip
 
-        Se non esistono sprite associati alla combinazione corrente,
-        restituisce None.
+        Se non esiste una clip per la combinazione corrente,
+        restituisce None. Non modifica lo stato della pianta.
         """
 
-        key = (self.state.action, self.state.direction)
-        if key not in self.sprites:
+        clip = self.clips.get((self.state.action, self.state.direction))
+        if clip is None:
             return None
-
-        sprites = self.sprites[key]
-
-        match self.state.action:
-            case Action.IDLE: return self._looping_sprite_selection(sprites)
-            case Action.ATTACKING | Action.SPAWNING: return self._locked_looping_sprite_selection(sprites)
-            case Action.DEAD: return None
-            case _: return None
+        return clip.frame(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
     def hit(self, damage: int | float) -> None:
         """Applica un danno alla pianta e aggiorna il suo stato vitale.
@@ -479,14 +401,18 @@ class Plant(Actor):
 
     @property
     def gui(self) -> list[GUIComponent]:
-        """Restituisce una lista di GUIComponent da mostrare nella GUI."""
+        """Restituisce una lista di GUIComponent da mostrare nella GUI.
+
+        La barra della vita è creata una sola volta e legata a posizione e
+        vita della pianta; la larghezza viene aggiornata solo se cambia.
+        """
 
         bar_w, bar_h = self.width, 3
-        return [
-            Bar(
+        if self.__health_bar is None:
+            self.__health_bar = Bar(
                 name_id=self.__class__.__name__,
-                x=self.x,
-                y=self.y - bar_h - 1,
+                x=lambda: self.x,
+                y=lambda: self.y - bar_h - 1,
                 width=bar_w,
                 height=bar_h,
                 text="",
@@ -494,64 +420,26 @@ class Plant(Actor):
                 text_color=(0, 0, 0, 0),
                 background_color=(116, 16, 8),
                 bar_color=(128, 248, 96),
-                max_value=self.max_health,
-                value=self.health,
+                max_value=lambda: self.max_health,
+                value=lambda: self.health,
                 padding=0,
                 fixed=False,
             )
-        ]
+        elif self.__health_bar.width != bar_w:
+            self.__health_bar.width = bar_w
+        return [self.__health_bar]
 
     # ======== HELPER METHODS ========
     def _locked_anim_finished(self) -> bool:
         """Verifica se l'animazione bloccata corrente è arrivata all ultimo frame.
 
-        Calcola l'indice del frame da mostrare usando sprite_cycle_counter
-        e sprite_cycle_speed, e restituisce True se l'indice ha superato
-        l'ultimo sprite disponibile per la combinazione (Action, Direction)
-        corrente. In caso contrario restituisce False.
-        """
-
-        sprites = self.sprites[self.state.action, self.state.direction]
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return i >= len(sprites) - 1
-
-    def _looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        """Seleziona il prossimo sprite in una animazione ciclica.
-
-        Incrementa lo sprite_cycle_counter e sceglie il frame successivo
-        nella lista sprites, ripetendola in loop in base alla velocità
-        sprite_cycle_speed.
-
-        Restituisce lo sprite selezionato.
-        """
-
-        self.sprite_cycle_counter += 1
-        sprite = sprites[(self.sprite_cycle_counter // self.sprite_cycle_speed) % len(sprites)]
-
-        self.y = self.y + self.height - sprite.height
-        self.height = sprite.height
-
-        return sprite
-
-    def _locked_looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        """Seleziona il prossimo sprite in una animazione bloccata.
-
-        Incrementa lo sprite_cycle_counter e avanza nell elenco sprites
-        in base a sprite_cycle_speed. Una volta raggiunto l ultimo frame,
-        continua a restituire sempre l'ultimo sprite disponibile senza
-        tornare all inizio della lista.
-
-        Restituisce lo sprite selezionato.
+        Calcola il passo corrente usando sprite_cycle_counter e
+        sprite_cycle_speed e lo confronta con la durata della clip della
+        combinazione (Action, Direction) corrente (vedi Clip.finished).
         """
 
-        self.sprite_cycle_counter += 1
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        sprite = sprites[i if i < len(sprites) else -1]
-
-        self.y = self.y + self.height - sprite.height
-        self.height = sprite.height
-
-        return sprite
+        clip = self.clips[self.state.action, self.state.direction]
+        return clip.finished(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
     def _set_state_action(self, action: Action) -> None:
         """Cambia l'azione dello stato della pianta e adatta lo sprite di base.
@@ -561,8 +449,8 @@ class Plant(Actor):
         - memorizza l'altezza attuale
         - aggiorna l'azione nello stato
 
-        Se esiste una lista di sprite per la nuova combinazione
-        (azione, direzione), prende il primo sprite e:
+        Se esiste una clip per la nuova combinazione
+        (azione, direzione), prende il suo primo sprite e:
         - regola la posizione verticale per mantenere il piede della
           pianta sul terreno
         - aggiorna larghezza e altezza in base alle dimensioni del
@@ -575,8 +463,8 @@ class Plant(Actor):
             old_height = self.height
             self.state.action = action
 
-            if (self.state.action, self.state.direction) in self.sprites:
-                new_sprite = self.sprites[self.state.action, self.state.direction][0]
+            if (self.state.action, self.state.direction) in self.clips:
+                new_sprite = self.clips[self.state.action, self.state.direction].first
                 # -> mantiene il plant "ancorato" al terreno
                 self.y = self.y + old_height - new_sprite.height
                 self.width = new_sprite.width
@@ -602,12 +490,14 @@ class Plant(Actor):
         if self.state.direction == Direction.RIGHT:
             offset_x = self.width + 5
         else:
-            offset_x = -5 - read_settings().get("EyeBall", {}).get("defaults", {}).get("width", 8) # -> default width di EyeBall
+            offset_x = -5 - get_settings().eye_ball.width # -> default width di EyeBall
 
         spawn_x = self.x + offset_x
         spawn_y = self.y + self.height * 0.3
 
-        eyeball = EyeBall(
+        eyeball = acquire(  # -> dal Pool di Game, se presente
+            arena,
+            EyeBall,
             x=spawn_x,
             y=spawn_y,
             direction=self.state.direction,
@@ -622,7 +512,7 @@ class Plant(Actor):
 
     # ======== AUTO CONSTRUCTOR ========
     @classmethod
-    def auto_init(cls, player: "Arthur", game: "Game", min_dist_x=100, max_dist_x=150) -> "Plant":
+    def auto_init(cls, player: "Arthur", game: "Game", min_dist_x=100, max_dist_x=150) -> "Plant | None":
         """
         Inizializza automaticamente un'istanza di Plant in una posizione valida
         rispetto al giocatore (Arthur) e all'arena.
@@ -639,76 +529,34 @@ class Plant(Actor):
             max_dist_x (int, opzionale): Ampiezza del range oltre la distanza minima. Default 150.
 
         Returns:
-            Plant: Una nuova istanza di Plant posizionata su una piattaforma valida.
+            Plant | None: Una nuova istanza di Plant posizionata su una piattaforma valida,
+            oppure None se nessuna piattaforma offre un range di spawn abbastanza ampio.
         """
-        settings: dict = read_settings()
-        defaults: dict = settings.get("Plant", {}).get("defaults", {})
+        defaults = get_settings().plant
 
         # -> se non vengono specificati valori differenti tra i parametri, si usano quelli del JSON
-        if "spawn_min_dist_x" in defaults and min_dist_x == 100:
-            min_dist_x = defaults["spawn_min_dist_x"]
-        if "spawn_max_dist_x" in defaults and max_dist_x == 150:
-            max_dist_x = defaults["spawn_max_dist_x"]
+        if defaults.spawn_min_dist_x is not None and min_dist_x == 100:
+            min_dist_x = defaults.spawn_min_dist_x
+        if defaults.spawn_max_dist_x is not None and max_dist_x == 150:
+            max_dist_x = defaults.spawn_max_dist_x
 
         # -> regione di spawn da Arthur
         min_dist_x = min_dist_x  # -> distanza minima da Arthur
         max_dist_x = max_dist_x  # -> ampiezza del range oltre la distanza minima
-        plant_width = defaults.get("width", 21)  # -> larghezza plant
-        plant_height = defaults.get("height", 32)  # -> altezza "finale" del plant
+        plant_width = defaults.width  # -> larghezza plant
+        plant_height = defaults.height  # -> altezza "finale" del plant
 
         player_cx, player_cy = player.x + player.width // 2, player.y + player.height // 2
 
-        platforms: list[Platform] = [
-            _ for _ in game.actors()
-            if isinstance(_, Platform)
-               and not isinstance(_, (GraveStone, Ladder))
-               and round(_.damage) == 0
-               and Direction.UP in (_.contact_surfaces if _.contact_surfaces is not None else [])
-        ]  # -> selezione delle Platform su cui è possibile spawnare
-
-        candidates: list[Candidate] = []  # -> candidati con range valido, distanza e direzione iniziale
-
-        for platform in platforms:
-            # left -> gestione del range sinistro
-            if max(platform.x, player_cx - min_dist_x - max_dist_x) <= platform.x + platform.width and min(platform.x + platform.width, player_cx - min_dist_x) >= platform.x:
-                min_x = max(platform.x, player_cx - min_dist_x - max_dist_x)
-                max_x = min(platform.x + platform.width, player_cx - min_dist_x)
-
-                distance = abs(platform.y - (player.y + player.height)) + (player_cx - max_x)
-
-                if max_x - min_x > plant_width:
-                    candidates.append(
-                        Candidate(
-                            distance=distance,
-                            height=platform.y,
-                            range=Range(min_x, max_x),
-                            direction=Direction.RIGHT,
-                        )
-                    )
-
-            # right -> gestione del range destro
-            if max(platform.x, player_cx + min_dist_x) <= platform.x + platform.width and min(platform.x + platform.width, player_cx + min_dist_x + max_dist_x) >= platform.x:
-                min_x = max(platform.x, player_cx + min_dist_x)
-                max_x = min(platform.x + platform.width, player_cx + min_dist_x + max_dist_x)
-
-                distance = abs(platform.y - (player.y + player.height)) + (min_x - player_cx)
-
-                if max_x - min_x > plant_width:
-                    candidates.append(
-                        Candidate(
-                            distance=distance,
-                            height=platform.y,
-                            range=Range(min_x, max_x),
-                            direction=Direction.LEFT,
-                        )
-                    )
-
-        candidates.sort(key=lambda candidate: candidate.distance)
-
-        chosen_platform = random.choice(candidates)
-        x = random.uniform(chosen_platform.range.min, chosen_platform.range.max - plant_width)
-        y = chosen_platform.height - plant_height
-        d = chosen_platform.direction
+        left = game.walkable_spans(player_cx - min_dist_x - max_dist_x, player_cx - min_dist_x, plant_width)  # -> a sinistra di Arthur, guarda a destra
+        right = game.walkable_spans(player_cx + min_dist_x, player_cx + min_dist_x + max_dist_x, plant_width)  # -> a destra di Arthur, guarda a sinistra
+
+        if not left and not right:
+            return None  # -> nessun punto di spawn valido: il chiamante non spawna nulla
+
+        i = random.randrange(len(left) + len(right))  # -> tratto scelto in modo uniforme tra i due lati
+        (min_x, max_x, top), d = (left[i], Direction.RIGHT) if i < len(left) else (right[i - len(left)], Direction.LEFT)
+        x, y = random.uniform(min_x, max_x - plant_width), top - plant_height
 
         return cls(
             x=x,
@@ -1,11 +1,11 @@
 from typing import TYPE_CHECKING
 import random
 import pathlib
-from dataclasses import dataclass
 
 # CORE
 if TYPE_CHECKING: from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
+from ...core.bodies import Body
 
 # ACTOR
 from ..actor import Actor
@@ -23,43 +23,14 @@ from ..objects import GraveStone
 from ...gui import GUIComponent, Bar
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clip, Clips
+from ...state.fields import number, integer
 
 
 
 
 
 
-# HELPER CLASSES
-@dataclass
-class Range:
-    """Rappresenta un intervallo numerico con valore minimo e massimo."""
-
-    min: float
-    max: float
-
-    def __str__(self) -> str:
-        return f"<{self.min} -> {self.max}>"
-
-    def __repr__(self) -> str:
-        return f"Range({self.min}, {self.max})"
-
-@dataclass
-class Candidate:
-    """Rappresenta un possibile punto di spawn con distanza, altezza, range e direzione."""
-
-    distance: float
-    height: float
-    range: Range
-    direction: Direction
-
-    def __str__(self) -> str:
-        return f"< Candidate | {self.distance}, {self.height}, {self.range}, {self.direction} >"
-
-    def __repr__(self) -> str:
-        return f"Candidate({repr(self.distance)}, {repr(self.height)}, {repr(self.range)}, {repr(self.direction)})"
-
-
 path = pathlib.Path(__file__).parent.parent.parent.parent / "data" / "textures" / "ghosts-goblins.png"
 
 # EMERGING
@@ -82,10 +53,36 @@ ZOMBIE_WALK_R1: Sprite = Sprite(path=path, x=700, y=65, width=21, height=32)
 ZOMBIE_WALK_R2: Sprite = Sprite(path=path, x=678, y=65, width=18, height=32)
 ZOMBIE_WALK_R3: Sprite = Sprite(path=path, x=655, y=65, width=20, height=32)
 
+ZOMBIE_EMERGING_L = (ZOMBIE_EMERGING_L1, ZOMBIE_EMERGING_L2, ZOMBIE_EMERGING_L3, ZOMBIE_EMERGING_L4)
+ZOMBIE_EMERGING_R = (ZOMBIE_EMERGING_R1, ZOMBIE_EMERGING_R2, ZOMBIE_EMERGING_R3, ZOMBIE_EMERGING_R4)
+
+ZOMBIE_CLIPS = Clips({
+    (Action.EMERGING, Direction.LEFT): Clip(ZOMBIE_EMERGING_L, loop=False),
+    (Action.EMERGING, Direction.RIGHT): Clip(ZOMBIE_EMERGING_R, loop=False),
+    (Action.IMMERSING, Direction.LEFT): Clip(ZOMBIE_EMERGING_L[::-1], loop=False),
+    (Action.IMMERSING, Direction.RIGHT): Clip(ZOMBIE_EMERGING_R[::-1], loop=False),
+    (Action.WALKING, Direction.LEFT): Clip((ZOMBIE_WALK_L1, ZOMBIE_WALK_L2, ZOMBIE_WALK_L3)),
+    (Action.WALKING, Direction.RIGHT): Clip((ZOMBIE_WALK_R1, ZOMBIE_WALK_R2, ZOMBIE_WALK_R3)),
+})
+
 
 
 
 class Zombie(Actor):
+    __slots__ = ("x", "y", "x_step", "y_step", "sprite_cycle_counter", "__attack_cooldown", "__attack_interval", "__damage", "__health", "__health_bar", "__height", "__max_health", "__name", "__speed", "__sprite_cycle_speed", "__state", "__width", "direction", "distance_to_walk", "gravity", "grounded", "max_walk_distance", "min_walk_distance", "walked_distance")
+    _checks = {"x": number("x"), "y": number("y"), "x_step": number("x_step"), "sprite_cycle_counter": integer("sprite_cycle_counter")}
+    clips = ZOMBIE_CLIPS  # -> animazioni condivise dalla classe: ogni zombie ha solo la testina (sprite_cycle_counter)
+    body = Body(
+        velocity=("x_step", "y_step"),
+        heading="speed",
+        gravity="gravity",
+        travel=("walked_distance", "distance_to_walk"),
+        cooldown="attack_cooldown",
+        halts=frozenset({Action.EMERGING, Action.DEAD}),
+        walks=frozenset({Action.WALKING}),
+        reacts=frozenset({Action.EMERGING, Action.IMMERSING}),
+    )  # -> modalità a componenti: vedi Bodies
+
     def __init__(
         self,
         name: str,
@@ -101,29 +98,28 @@ class Zombie(Actor):
         damage: float | None = None,
         attack_interval: int | None = None,
     ) -> None:
-        defaults: dict = read_settings().get("Zombie", {}).get("defaults", {})
+        defaults = get_settings().zombie
 
         # FORCED INIT
         self.name = name
-        self.x = x
-        self.y = y
+        self._init_fields(x=x, y=y)
 
         # INIT WITH DEFAULTS
-        self.max_health = defaults.get("max_health", 70.0)
-        self.health = health if health is not None else defaults.get("health", 70.0)
-        self.speed = speed if speed is not None else defaults.get("speed", 1.0)
-        self.gravity = gravity if gravity is not None else defaults.get("gravity", 0.7)
-        self.min_walk_distance = min_walk_distance if min_walk_distance is not None else defaults.get("min_walk_distance", 150.0)
-        self.max_walk_distance = max_walk_distance if max_walk_distance is not None else defaults.get("max_walk_distance", 300.0)
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 6)
-        self.direction = direction if direction is not None else getattr(Direction, defaults.get("direction", "RIGHT"), Direction.RIGHT)
-        self.damage = damage if damage is not None else defaults.get("damage", 30.0)
-        self.attack_interval = attack_interval if attack_interval is not None else defaults.get("attack_interval", 50)
+        self.max_health = defaults.max_health
+        self.health = health if health is not None else defaults.health
+        self.speed = speed if speed is not None else defaults.speed
+        self.gravity = gravity if gravity is not None else defaults.gravity
+        self.min_walk_distance = min_walk_distance if min_walk_distance is not None else defaults.min_walk_distance
+        self.max_walk_distance = max_walk_distance if max_walk_distance is not None else defaults.max_walk_distance
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
+        self.direction = direction if direction is not None else defaults.direction
+        self.damage = damage if damage is not None else defaults.damage
+        self.attack_interval = attack_interval if attack_interval is not None else defaults.attack_interval
 
         # STATE
         self.attack_cooldown = 0
         self.x_step = 0.0
-        self.y_step = 0
+        self.y_step = 0.0
         self.distance_to_walk = random.uniform(self.min_walk_distance, self.max_walk_distance)
         self.walked_distance = 0.0
 
@@ -132,40 +128,15 @@ class Zombie(Actor):
 
         self.grounded = False
 
-        # SPRITES
-        self.sprites = SpriteCollection()
-        self.__init_sprites()
+        # GUI
+        self.__health_bar: Bar | None = None  # -> creata al primo accesso a gui e poi riusata
 
-        first = self.sprites[self.state.action, self.state.direction][0]
+        # SPRITES
+        first = self.clips[self.state.action, self.state.direction].first
         self.width = first.width
         self.height = first.height
 
 
-    def __init_sprites(self) -> None:
-        global ZOMBIE_EMERGING_L1, ZOMBIE_EMERGING_L2, ZOMBIE_EMERGING_L3, ZOMBIE_EMERGING_L4
-        global ZOMBIE_EMERGING_R1, ZOMBIE_EMERGING_R2, ZOMBIE_EMERGING_R3, ZOMBIE_EMERGING_R4
-        global ZOMBIE_WALK_L1, ZOMBIE_WALK_L2, ZOMBIE_WALK_L3
-        global ZOMBIE_WALK_R1, ZOMBIE_WALK_R2, ZOMBIE_WALK_R3
-
-        self.sprites[Action.EMERGING, Direction.LEFT] = [
-            ZOMBIE_EMERGING_L1, ZOMBIE_EMERGING_L2, ZOMBIE_EMERGING_L3, ZOMBIE_EMERGING_L4
-        ]
-        self.sprites[Action.EMERGING, Direction.RIGHT] = [
-            ZOMBIE_EMERGING_R1, ZOMBIE_EMERGING_R2, ZOMBIE_EMERGING_R3, ZOMBIE_EMERGING_R4
-        ]
-
-        self.sprites[Action.IMMERSING, Direction.LEFT] = list(
-            reversed(self.sprites[(Action.EMERGING, Direction.LEFT)]))
-        self.sprites[(Action.IMMERSING, Direction.RIGHT)] = list(
-            reversed(self.sprites[(Action.EMERGING, Direction.RIGHT)]))
-
-        self.sprites[Action.WALKING, Direction.LEFT] = [ZOMBIE_WALK_L1, ZOMBIE_WALK_L2, ZOMBIE_WALK_L3]
-        self.sprites[Action.WALKING, Direction.RIGHT] = [ZOMBIE_WALK_R1, ZOMBIE_WALK_R2, ZOMBIE_WALK_R3]
-
-        self.sprites[Action.DEAD, Direction.LEFT] = []
-        self.sprites[Action.DEAD, Direction.RIGHT] = []
-
-
     # ======== INTERFACE IMPLEMENTATION ========
     def pos(self) -> tuple[float, float]:
         return self.x, self.y
@@ -179,10 +150,8 @@ class Zombie(Actor):
         Gestisce:
         - il cooldown di attacco
         - il movimento verticale con gravita (solo fuori dalla fase EMERGING)
-        - la transizione da EMERGING a WALKING al termine dell animazione
         - il movimento orizzontale in WALKING e l'accumulo della distanza percorsa
-        - il passaggio a IMMERSING quando ha camminato abbastanza ed è a terra
-        - la transizione a DEAD al termine della animazione di IMMERSING
+        - le transizioni di stato del frame (advance_state)
 
         Se lo zombie è in stato DEAD il metodo non esegue alcuna azione.
         """
@@ -198,14 +167,26 @@ class Zombie(Actor):
             self.y += self.y_step  # -> aggiornamento posizione verticale in base alla velocita
 
         # --- HORIZONTAL ---
+        if self.state.action == Action.WALKING:
+            self.x_step = self.speed if self.state.direction == Direction.RIGHT else -self.speed
+            self.x += self.x_step  # -> aggiornamento posizione orizzontale
+            self.walked_distance += abs(self.x_step)  # -> accumulo della distanza totale percorsa camminando
+
+        self.advance_state()
+
+    def advance_state(self) -> None:
+        """Applica le transizioni di stato dello zombie dopo il movimento del frame.
+
+        Chiamato da move e, nella modalità a componenti, da Bodies:
+        - da EMERGING a WALKING al termine dell animazione
+        - da WALKING a IMMERSING quando ha camminato abbastanza ed è a terra
+        - da IMMERSING a DEAD al termine della animazione
+        """
+
         if self.state.action == Action.EMERGING:
             if self._locked_anim_finished():  # -> attende che l'animazione di emersione sia terminata
                 self._set_state_action(Action.WALKING)  # -> quando finita passa allo stato di camminata
         elif self.state.action == Action.WALKING:
-            self.x_step = self.speed if self.state.direction == Direction.RIGHT else -self.speed
-            self.x += self.x_step  # -> aggiornamento posizione orizzontale
-
-            self.walked_distance += abs(self.x_step)  # -> accumulo della distanza totale percorsa camminando
             if self.walked_distance >= self.distance_to_walk and self.grounded:  # -> se ha camminato abbastanza ed è a terra, inizia l'immersione
                 self._set_state_action(Action.IMMERSING)
         elif self.state.action == Action.IMMERSING:
@@ -213,47 +194,62 @@ class Zombie(Actor):
                 self._set_state_action(Action.DEAD)
 
 
+    def animate(self) -> None:
+        """Fa avanzare di un passo l'animazione dello zombie (chiamato da Game.tick).
+
+        Incrementa lo sprite_cycle_counter negli stati animati (WALKING,
+        EMERGING e IMMERSING); in stato DEAD non fa nulla.
+        """
+
+        if self.state.action in (Action.WALKING, Action.EMERGING, Action.IMMERSING):
+            self.sprite_cycle_counter += 1
+
     def sprite(self) -> "Sprite | None":  # type: ignore
         """Restituisce lo sprite corrente dello zombie in base allo stato.
 
-        Usa la coppia (Action, Direction) per scegliere la lista di sprite
-        appropriata e:
-        - in stato WALKING seleziona i frame in modo ciclico continuo
-        - in stato EMERGING e IMMERSING avanza l'animazione in modo bloccato,
-          fermandosi sull ultimo frame
-        - in stato DEAD restituisce sempre None
+        Usa la coppia (Action, Direction) per scegliere la clip:
+        - in stato WALKING la clip è ciclica
+        - in stato EMERGING e IMMERSING non è in loop e si ferma
+          sull ultimo frame
+        - in stato DEAD (o in uno stato senza clip) restituisce None
 
-        Se lo stato non è gestito esplicitamente, restituisce None.
+        Non modifica lo stato dello zombie.
         """
 
-        sprites = self.sprites[self.state.action, self.state.direction]
-        match self.state.action:
-            case Action.WALKING: return self._looping_sprite_selection(sprites)
-            case Action.EMERGING | Action.IMMERSING: return self._locked_looping_sprite_selection(sprites)
-            case Action.DEAD: return None
-            case _: return None
+        clip = self.clips.get((self.state.action, self.state.direction))
+        if clip is None:
+            return None
+        return clip.frame(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
     @property
     def gui(self) -> list[GUIComponent]:
-        """Restituisce una lista di GUIComponent che rappresentano lo stato corrente dello zombie."""
+        """Restituisce una lista di GUIComponent che rappresentano lo stato corrente dello zombie.
+
+        La barra della vita è creata una sola volta e segue posizione e vita
+        dello zombie; la larghezza viene aggiornata solo se cambia lo sprite.
+        """
 
         bar_w, bar_h = self.width, 3
-        return [Bar(
-            name_id=self.name,
-            x=self.x,
-            y=self.y - bar_h - 1,
-            width=bar_w,
-            height=bar_h,
-            text="",
-            text_size=1,
-            text_color=(0, 0, 0, 0),
-            background_color=(116, 16, 8),
-            bar_color=(128, 248, 96),
-            max_value=self.max_health,
-            value=self.health,
-            padding=0,
-            fixed=False
-        )]
+        if self.__health_bar is None:
+            self.__health_bar = Bar(
+                name_id=self.name,
+                x=lambda: self.x,
+                y=lambda: self.y - bar_h - 1,
+                width=bar_w,
+                height=bar_h,
+                text="",
+                text_size=1,
+                text_color=(0, 0, 0, 0),
+                background_color=(116, 16, 8),
+                bar_color=(128, 248, 96),
+                max_value=lambda: self.max_health,
+                value=lambda: self.health,
+                padding=0,
+                fixed=False
+            )
+        elif self.__health_bar.width != bar_w:
+            self.__health_bar.width = bar_w
+        return [self.__health_bar]
 
     # ======= METHODS ========
     def hit(self, damage: float) -> None:
@@ -323,105 +319,46 @@ class Zombie(Actor):
             self.reset_sprite_cycle_counter()
             # update width, height, y based on the first sprite
             if action not in (Action.DEAD,):
-                first = self.sprites[(action, self.state.direction)][0]
+                first = self.clips[action, self.state.direction].first
                 self.y = self.y + self.height - first.height  # mantenere sul terreno
                 self.width = first.width
                 self.height = first.height
             self.state.action = action
 
-    def _looping_sprite_selection(self, sprites: list["Sprite"]) -> "Sprite":
-        """Seleziona il prossimo sprite in una animazione ciclica.
-
-        Incrementa lo sprite_cycle_counter e sceglie il frame successivo
-        nella lista sprites, ripetendola in loop in base alla velocità
-        sprite_cycle_speed.
-
-        Restituisce lo sprite selezionato.
-        """
-
-        self.sprite_cycle_counter += 1
-        return sprites[(self.sprite_cycle_counter // self.sprite_cycle_speed) % len(sprites)]
-
-    def _locked_looping_sprite_selection(self, sprites: list["Sprite"]) -> "Sprite":
-        """Seleziona il prossimo sprite in una animazione bloccata.
-
-        Incrementa lo sprite_cycle_counter e avanza nell elenco sprites
-        in base a sprite_cycle_speed. Una volta raggiunto l ultimo frame,
-        continua a restituire sempre l'ultimo sprite disponibile senza
-        tornare all inizio della lista.
-
-        Restituisce lo sprite selezionato.
-        """
-
-        self.sprite_cycle_counter += 1
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return sprites[i if i < len(sprites) else -1]
-
     def _locked_anim_finished(self) -> bool:
         """Verifica se l'animazione bloccata corrente è arrivata all ultimo frame.
 
-        Calcola l'indice del frame da mostrare usando sprite_cycle_counter
-        e sprite_cycle_speed, e restituisce True se l'indice ha superato
-        l'ultimo sprite disponibile per la combinazione (Action, Direction)
-        corrente. In caso contrario restituisce False.
+        Calcola il passo corrente usando sprite_cycle_counter e
+        sprite_cycle_speed e lo confronta con la durata della clip della
+        combinazione (Action, Direction) corrente (vedi Clip.finished).
         """
 
-        sprites = self.sprites[(self.state.action, self.state.direction)]
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return i >= len(sprites) - 1
+        clip = self.clips[self.state.action, self.state.direction]
+        return clip.finished(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
 
     # ======== AUTO CONSTRUCTOR ========
     @classmethod
-    def auto_init(cls, player: "Arthur", game: "Game") -> "Zombie":
-        settings: dict = read_settings()
-        defaults: dict = settings.get("Zombie", {}).get("defaults", {})
+    def auto_init(cls, player: "Arthur", game: "Game") -> "Zombie | None":
+        defaults = get_settings().zombie
 
         # -> regione di spawn da arthur
-        min_dist_x = defaults.get("spawn_min_dist_x", 50)  # -> distanza minima da Arthur
-        max_dist_x = defaults.get("spawn_max_dist_x", 250)  # -> ampiezza del range oltre la distanza minima
-        zombie_width = defaults.get("width", 21)  # -> larghezza zombie
-        zombie_height = defaults.get("height", 70)  # -> altezza zombie
+        min_dist_x = defaults.spawn_min_dist_x  # -> distanza minima da Arthur
+        max_dist_x = defaults.spawn_max_dist_x  # -> ampiezza del range oltre la distanza minima
+        zombie_width = defaults.width  # -> larghezza zombie
+        zombie_height = defaults.height  # -> altezza zombie
 
         player_cx, player_cy = player.x + player.width // 2, player.y + player.height // 2
 
-        platforms: list[Platform] = [
-            _ for _ in game.actors()
-            if isinstance(_, Platform)
-               and not isinstance(_, (GraveStone, Ladder))
-               and round(_.damage) == round(0)
-               and Direction.UP in (
-                   _.contact_surfaces
-                   if _.contact_surfaces is not None
-                   else [])
-        ]  # -> selezione delle Platform su cui è possibile spawnare
-
-        candidates: list[Candidate] = []  # -> lista contenente i candidati (ossia degli oggetti che rapparesentano le coordinate valide per lo spawn e altre proprieta come la distanza da arthur)
-        for platform in platforms:
-            # left -> gestione del range sinistro
-            if max(platform.x, player_cx - min_dist_x - max_dist_x) <= platform.x + platform.width and min(platform.x + platform.width, player_cx - min_dist_x) >= platform.x:  # -> se la piattaforma interseca la regione x di spawn sinistra...
-                min_x = max(platform.x, player_cx - min_dist_x - max_dist_x)  # -> estremo sinistro del range valido per lo spawn
-                max_x = min(platform.x + platform.width, player_cx - min_dist_x)  # -> estremo destro del range valido per lo spawn
+        left = game.walkable_spans(player_cx - min_dist_x - max_dist_x, player_cx - min_dist_x, zombie_width)  # -> a sinistra di Arthur, guarda a destra
+        right = game.walkable_spans(player_cx + min_dist_x, player_cx + min_dist_x + max_dist_x, zombie_width)  # -> a destra di Arthur, guarda a sinistra
 
-                distance = abs(platform.y - (player.y + player.height)) + (player_cx - max_x)
+        if not left and not right:
+            return None  # -> nessun punto di spawn valido: il chiamante non spawna nulla
 
-                if max_x - min_x > zombie_width:
-                    candidates.append(Candidate(distance=distance, height=platform.y, range=Range(min_x, max_x), direction=Direction.RIGHT))
-
-            # right -> gestione del range destro
-            if max(platform.x, player_cx + min_dist_x) <= platform.x + platform.width and min(platform.x + platform.width, player_cx + min_dist_x + max_dist_x) >= platform.x:  # -> se la piattaforma interseca la regione x di spawn destra...
-                min_x = max(platform.x, player_cx + min_dist_x)  # -> estremo sinistro del range valido per lo spawn
-                max_x = min(platform.x + platform.width, player_cx + min_dist_x + max_dist_x)  # -> estremo destro del range valido per lo spawn
-
-                distance = abs(platform.y - (player.y + player.height)) + (min_x - player_cx)
-
-                if max_x - min_x > zombie_width:
-                    candidates.append(Candidate(distance=distance, height=platform.y, range=Range(min_x, max_x), direction=Direction.LEFT))
-
-        candidates.sort(key=lambda candidate: candidate.distance)
-
-        chosen_platform = random.choice(candidates)
-        x, y, d = random.uniform(chosen_platform.range.min, chosen_platform.range.max - zombie_width), chosen_platform.height - zombie_height, chosen_platform.direction
+        i = random.randrange(len(left) + len(right))  # -> tratto scelto in modo uniforme tra i due lati
+        (min_x, max_x, top), d = (left[i], Direction.RIGHT) if i < len(left) else (right[i - len(left)], Direction.LEFT)
+        x, y = random.uniform(min_x, max_x - zombie_width), top - zombie_height
 
         return cls(
             name="Zombie",
@@ -439,24 +376,6 @@ class Zombie(Actor):
     def name(self, value: str):
         self.__name = str(value)
 
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y = float(value)
-
     @property
     def health(self) -> float:
         return self.__health
@@ -533,15 +452,6 @@ class Zombie(Actor):
             raise TypeError("speed must be an int or float")
         self.__speed = float(value)
 
-    @property
-    def x_step(self) -> float:
-        return self.__x_step
-    @x_step.setter
-    def x_step(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x_step must be an int or float")
-        self.__x_step = float(value)
-
     @property
     def state(self) -> "EntityState":
         return self.__state
@@ -550,15 +460,6 @@ class Zombie(Actor):
         # State(action: Action, direction: Direction)
         self.__state = value
 
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int):
-        if not isinstance(value, int):
-            raise TypeError("sprite_cycle_counter must be an int")
-        self.__sprite_cycle_counter = int(value)
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
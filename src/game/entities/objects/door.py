@@ -5,17 +5,18 @@ from ...gui import GUIComponent, Bar
 
 # CORE
 if TYPE_CHECKING: from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
 
 #ACTOR
 from ..actor import Actor
 
 # STATE
-from ...state import Sprite, EntityState, SpriteCollection, Action, Direction
+from ...state import Sprite, EntityState, Action, Direction, Clip, Clips
+from ...state.fields import number, integer
 
 
-CAMERA_W = read_settings().get("camera_width", 430)
-CAMERA_H = read_settings().get("camera_height", 230)
+CAMERA_W = get_settings().camera_width
+CAMERA_H = get_settings().camera_height
 
 
 DOOR_SPRITE_PATH: pathlib.Path = pathlib.Path(__file__).parent.parent.parent.parent / "data" / "textures" / "ghosts-goblins-bg.png"
@@ -24,8 +25,19 @@ DOOR_SPRITE_CLOSE: Sprite = Sprite(path=DOOR_SPRITE_PATH, x=2, y=261, width=48,
 DOOR_SPRITE_HALF: Sprite = Sprite(path=DOOR_SPRITE_PATH, x=53, y=261, width=48, height=64)
 DOOR_SPRITE_OPEN: Sprite = Sprite(path=DOOR_SPRITE_PATH, x=104, y=261, width=48, height=64)
 
+DOOR_CLIPS = Clips({
+    (Action.CLOSE, Direction.DOWN): Clip((DOOR_SPRITE_OPEN, DOOR_SPRITE_HALF, DOOR_SPRITE_CLOSE), loop=False),
+    (Action.OPEN, Direction.DOWN): Clip((DOOR_SPRITE_CLOSE, DOOR_SPRITE_HALF, DOOR_SPRITE_OPEN), loop=False),
+})
+
 
 class Door(Actor):
+    static = True  # -> non si muove: indicizzata una sola volta nello StaticIndex di Arena
+    clips = DOOR_CLIPS  # -> animazioni condivise dalla classe
+    __slots__ = ("x", "y", "sprite_cycle_counter", "__door_timer", "__height", "__name", "__passage_bar", "__passage_delay", "__passed", "__speed", "__sprite_cycle_speed", "__state", "__width")
+    _checks = {"x": number("x"), "y": number("y"), "sprite_cycle_counter": integer("sprite_cycle_counter")}
+
+
     def __init__(
         self,
         x: float,
@@ -38,34 +50,31 @@ class Door(Actor):
         sprite_cycle_speed: int | None = None,
         passage_delay: int | None = None,  # n of frames
     ) -> None:
-        defaults: dict = read_settings().get("Door", {}).get("defaults", {})
+        defaults = get_settings().door
 
         # FORCED INIT
-        self.x = x
-        self.y = y
+        self._init_fields(x=x, y=y)
         self.width = width
         self.height = height
 
         # DEFAULTS
-        self.name = name if name is not None else defaults.get("name", "Door")
-        self.speed = speed if speed is not None else defaults.get("speed", 3.0)
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 6)
-        self.passage_delay = passage_delay if passage_delay is not None else defaults.get("passage_delay", 60)
+        self.name = name if name is not None else defaults.name
+        self.speed = speed if speed is not None else defaults.speed
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
+        self.passage_delay = passage_delay if passage_delay is not None else defaults.passage_delay
 
         # STATE
         self.state = EntityState(action=Action.CLOSE, direction=Direction.DOWN)
 
-        # SPRITES
-        self.sprites = SpriteCollection()
-        self.sprites[Action.CLOSE, Direction.DOWN] = [DOOR_SPRITE_OPEN, DOOR_SPRITE_HALF, DOOR_SPRITE_CLOSE]
-        self.sprites[Action.OPEN, Direction.DOWN] = [DOOR_SPRITE_CLOSE, DOOR_SPRITE_HALF, DOOR_SPRITE_OPEN]
-
         self.sprite_cycle_counter = 0
 
         # INTERNAL STATE
         self.door_timer = 0
         self.passed = False
 
+        # GUI
+        self.__passage_bar: Bar | None = None  # -> creata al primo accesso a gui e poi riusata
+
 
     # ======== INTERFACE IMPLEMENTATION ========
     def pos(self) -> tuple[float, float]:
@@ -99,44 +108,52 @@ class Door(Actor):
         if self.door_timer == self.passage_delay:
             self.passed = True
 
+    def animate(self) -> None:
+        """Fa avanzare di un passo l'animazione della porta (chiamato da Game.tick).
+
+        Incrementa lo sprite_cycle_counter negli stati OPEN e CLOSE, se
+        esiste una lista di sprite per lo stato corrente.
+        """
+
+        if self.state.action not in (Action.OPEN, Action.CLOSE):
+            return
+        if (self.state.action, self.state.direction) in self.clips:
+            self.sprite_cycle_counter += 1
+
     def sprite(self) -> Sprite | None:
         """Restituisce lo sprite corrente della porta in base allo stato.
 
         Se la porta è in stato DEAD o non esiste una lista di sprite per
         la combinazione (azione, direzione) corrente, restituisce None.
 
-        Per gli stati OPEN e CLOSE utilizza una selezione bloccata degli
-        sprite, facendo avanzare l animazione e fermandosi sull ultimo
-        frame disponibile.
+        Le clip di OPEN e CLOSE non sono in loop: si fermano sull ultimo
+        frame. L'animazione avanza solo in animate.
         """
 
         if self.state.action == Action.DEAD:
             return None
 
-        if not (self.state.action, self.state.direction) in self.sprites:
+        clip = self.clips.get((self.state.action, self.state.direction))
+        if clip is None:
             return None
-
-        sprites = self.sprites[self.state.action, self.state.direction]
-        match self.state.action:
-            case Action.DEAD: return None
-            case Action.OPEN | Action.CLOSE: return self._locked_looping_sprite_selection(sprites)
-            case _: return None
+        return clip.frame(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
     @property
     def gui(self) -> list[GUIComponent]:
         global CAMERA_W, CAMERA_H
 
-        door_passage: GUIComponent = Bar(
-            name_id="door_passage",
-            x=CAMERA_W/2 - (72/2), y=3, padding=1,
-            width=72, height=14,
-            text="Crossing...", text_size=10, text_color=(255, 255, 255),
-            max_value=self.passage_delay, value=self.door_timer,
-            background_color=(116, 116, 8), bar_color=(224, 224, 96),
-            fixed=True
-        )
+        if self.__passage_bar is None:  # -> creata una sola volta, legata a door_timer
+            self.__passage_bar = Bar(
+                name_id="door_passage",
+                x=CAMERA_W/2 - (72/2), y=3, padding=1,
+                width=72, height=14,
+                text="Crossing...", text_size=10, text_color=(255, 255, 255),
+                max_value=lambda: self.passage_delay, value=lambda: self.door_timer,
+                background_color=(116, 116, 8), bar_color=(224, 224, 96),
+                fixed=True
+            )
 
-        return [door_passage] if self.door_timer > 0 else []
+        return [self.__passage_bar] if self.door_timer > 0 else []
 
 
     # ======== HELPER METHODS ========
@@ -177,71 +194,24 @@ class Door(Actor):
                 self.reset_sprite_cycle_counter()
 
             if action not in (Action.DEAD,):
-                first = self.sprites[action, self.state.direction][0]
+                first = self.clips[action, self.state.direction].first
                 self.width = first.width
                 self.height = first.height
             self.state.action = action
 
-    def _looping_sprite_selection(self, sprites: list["Sprite"]) -> "Sprite":
-        """Seleziona il prossimo sprite in una animazione ciclica.
-
-        Incrementa lo sprite_cycle_counter e sceglie il frame successivo
-        nella lista sprites, ripetendola in loop in base alla velocità
-        sprite_cycle_speed.
-
-        Restituisce lo sprite selezionato.
-        """
-        self.sprite_cycle_counter += 1
-        return sprites[(self.sprite_cycle_counter // self.sprite_cycle_speed) % len(sprites)]
-
-    def _locked_looping_sprite_selection(self, sprites: list["Sprite"]) -> "Sprite":
-        """Seleziona il prossimo sprite in una animazione bloccata.
-
-        Incrementa lo sprite_cycle_counter e avanza nell elenco sprites
-        in base a sprite_cycle_speed. Una volta raggiunto l ultimo frame,
-        continua a restituire sempre l'ultimo sprite disponibile senza
-        tornare all inizio della lista.
-
-        Restituisce lo sprite selezionato.
-        """
-
-        self.sprite_cycle_counter += 1
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return sprites[i if i < len(sprites) else -1]
-
     def _locked_anim_finished(self) -> bool:
         """Verifica se l'animazione bloccata corrente è arrivata all ultimo frame.
 
-        Calcola l'indice del frame da mostrare usando sprite_cycle_counter
-        e sprite_cycle_speed, e restituisce True se l'indice ha superato
-        l'ultimo sprite disponibile per la combinazione (Action, Direction)
-        corrente. In caso contrario restituisce False.
+        Calcola il passo corrente usando sprite_cycle_counter e
+        sprite_cycle_speed e lo confronta con la durata della clip della
+        combinazione (Action, Direction) corrente (vedi Clip.finished).
         """
 
-        sprites = self.sprites[(self.state.action, self.state.direction)]
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return i >= len(sprites) - 1
+        clip = self.clips[self.state.action, self.state.direction]
+        return clip.finished(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
 
     # ======== PROPERTIES ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be a number")
-        self.__x = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be a number")
-        self.__y = float(value)
-
     @property
     def width(self) -> int:
         return self.__width
@@ -287,24 +257,6 @@ class Door(Actor):
             raise TypeError("state must be a State")
         self.__state = value
 
-    @property
-    def sprites(self) -> SpriteCollection:
-        return self.__sprites
-    @sprites.setter
-    def sprites(self, value: SpriteCollection) -> None:
-        if not isinstance(value, SpriteCollection):
-            raise TypeError("sprites must be a SpriteCollection")
-        self.__sprites = value
-
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("sprite_cycle_counter must be a number")
-        self.__sprite_cycle_counter = int(value)
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
@@ -1,13 +1,14 @@
 import pathlib
 
 # CORE
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
 
 # ACTOR
 from ..actor import Actor, Arena
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clip, Clips
+from ...state.fields import number, integer
 
 
 SPR_PATH = pathlib.Path(__file__).parent.parent.parent.parent / "data" / "textures" / "ghosts-goblins.png"
@@ -23,8 +24,19 @@ FLAME_BIG_L2 = Sprite(SPR_PATH, 334, 427, 26, 33)
 FLAME_SMALL_L3 = Sprite(SPR_PATH, 285, 442, 18, 18)
 FLAME_SMALL_L4 = Sprite(SPR_PATH, 272, 442, 12, 18)
 
+FLAME_CLIPS = Clips({
+    (Action.BIG, Direction.RIGHT): Clip((FLAME_BIG_R1, FLAME_BIG_R2)),
+    (Action.BIG, Direction.LEFT): Clip((FLAME_BIG_L1, FLAME_BIG_L2)),
+    (Action.SMALL, Direction.RIGHT): Clip((FLAME_SMALL_R3, FLAME_SMALL_R4)),
+    (Action.SMALL, Direction.LEFT): Clip((FLAME_SMALL_L3, FLAME_SMALL_L4)),
+})
+
 
 class Flame(Actor):
+    __slots__ = ("x", "y", "sprite_cycle_counter", "__age", "__damage", "__ground_y", "__height", "__life_frames", "__sprite_cycle_speed", "__state", "__width")
+    _checks = {"x": number("x"), "y": number("y"), "sprite_cycle_counter": integer("sprite_cycle_counter")}
+    clips = FLAME_CLIPS  # -> animazioni condivise dalla classe: ogni fiamma ha solo la testina (sprite_cycle_counter)
+
     def __init__(
         self,
         x: float,
@@ -34,32 +46,45 @@ class Flame(Actor):
         life_time: int | None = None,
         sprite_cycle_speed: int | None = None,
     ) -> None:
-        defaults: dict = read_settings().get("Flame", {}).get("defaults", {})
+        # STATE
+        self.state = EntityState(action=Action.BIG, direction=Direction.RIGHT)
+
+        self.reset(x, ground_y, damage=damage, life_time=life_time, sprite_cycle_speed=sprite_cycle_speed)
+
+    def reset(
+        self,
+        x: float,
+        ground_y: float,
+        *,
+        damage: int | None = None,
+        life_time: int | None = None,
+        sprite_cycle_speed: int | None = None,
+    ) -> None:
+        """Riporta la fiamma allo stato di una appena costruita con gli stessi
+        argomenti, riusando il suo stato (chiamato da Pool.acquire).
+        """
+        defaults = get_settings().flame
 
         # FORCED INIT
         self.ground_y = ground_y
         self.age = 0
 
         # DEFAULTS
-        self.life_time = life_time if life_time is not None else defaults.get("life_time", 60)
-        self.damage = damage if damage is not None else defaults.get("damage", 1)
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 6)
+        self.life_time = life_time if life_time is not None else defaults.life_time
+        self.damage = damage if damage is not None else defaults.damage
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
 
         # STATE
-        self.state = EntityState(action=Action.BIG, direction=Direction.RIGHT)
+        self.state.action = Action.BIG
+        self.state.direction = Direction.RIGHT
         self.sprite_cycle_counter = 0
 
-        # SPRITES
-        self.sprites = SpriteCollection()
-        self._init_sprites()
-
-        first = self.sprites[self.state.action, self.state.direction][0]
+        first = self.clips[self.state.action, self.state.direction].first
         self.width = first.width
         self.height = first.height
 
         # POSITION
-        self.x = x - self.width // 2
-        self.y = self.ground_y - self.height
+        self._init_fields(x=x - self.width // 2, y=self.ground_y - self.height)
 
 
 
@@ -92,6 +117,12 @@ class Flame(Actor):
             self._set_state_action(Action.SMALL)
 
 
+    def animate(self) -> None:
+        """Fa avanzare di un passo l'animazione della fiamma (chiamato da Game.tick)."""
+
+        if self.state.action != Action.DEAD:
+            self.sprite_cycle_counter += 1
+
     def sprite(self) -> Sprite | None:  # type: ignore
         """Restituisce lo sprite corrente della fiamma in base allo stato.
         Se l'azione è DEAD restituisce None.
@@ -99,8 +130,8 @@ class Flame(Actor):
 
         if self.state.action == Action.DEAD:
             return None
-        sprites = self.sprites[self.state.action, self.state.direction]
-        return self._looping_sprite_selection(sprites)
+        clip = self.clips[self.state.action, self.state.direction]
+        return clip.frame(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
 
     # ======== METHODS ========
@@ -115,15 +146,6 @@ class Flame(Actor):
 
 
     # ======== HELPER METHODS ========
-    def _init_sprites(self) -> None:
-        global FLAME_BIG_R1, FLAME_BIG_R2, FLAME_BIG_L1, FLAME_BIG_L2
-        global FLAME_SMALL_R3, FLAME_SMALL_R4, FLAME_SMALL_L3, FLAME_SMALL_L4
-
-        self.sprites[Action.BIG, Direction.RIGHT] = [FLAME_BIG_R1, FLAME_BIG_R2] * 2
-        self.sprites[Action.BIG, Direction.LEFT] = [FLAME_BIG_L1, FLAME_BIG_L2] * 2
-        self.sprites[Action.SMALL, Direction.RIGHT] = [FLAME_SMALL_R3, FLAME_SMALL_R4] * 2
-        self.sprites[Action.SMALL, Direction.LEFT] = [FLAME_SMALL_L3, FLAME_SMALL_L4] * 2
-
     def _set_state_action(self, action: Action, *, reset: bool = True) -> None:
         """Cambia l'azione della fiamma e aggiorna dimensioni e posizione.
 
@@ -142,8 +164,8 @@ class Flame(Actor):
 
         self.state.action = action
 
-        if (self.state.action, self.state.direction) in self.sprites.__iter__():
-            first = self.sprites[self.state.action, self.state.direction][0]
+        if (self.state.action, self.state.direction) in self.clips:
+            first = self.clips[self.state.action, self.state.direction].first
             prev_width = self.width
             self.width = first.width
             self.x = self.x + prev_width//2 - self.width//2
@@ -151,17 +173,6 @@ class Flame(Actor):
             self.height = first.height
             self.y = (self.ground_y - self.height) + 1
 
-    def _looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        """Seleziona il prossimo sprite in una animazione ciclica della fiamma.
-
-        Incrementa sprite_cycle_counter e restituisce il frame successivo
-        dell elenco sprites, ripetendolo in loop in base a
-        sprite_cycle_speed.
-        """
-
-        self.sprite_cycle_counter += 1
-        return sprites[(self.sprite_cycle_counter // self.sprite_cycle_speed) % len(sprites)]
-
     def reset_sprite_cycle_counter(self) -> int:
         last = self.sprite_cycle_counter
         self.sprite_cycle_counter = 0
@@ -169,24 +180,6 @@ class Flame(Actor):
 
 
     # ======== PROPERTIES ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be a number")
-        self.__x = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be a number")
-        self.__y = float(value)
-
     @property
     def width(self) -> int:
         return self.__width
@@ -223,24 +216,6 @@ class Flame(Actor):
             raise TypeError("state must be a State")
         self.__state = value
 
-    @property
-    def sprites(self) -> SpriteCollection:
-        return self.__sprites
-    @sprites.setter
-    def sprites(self, value: SpriteCollection) -> None:
-        if not isinstance(value, SpriteCollection):
-            raise TypeError("sprites must be a SpriteCollection")
-        self.__sprites = value
-
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("sprite_cycle_counter must be a number")
-        self.__sprite_cycle_counter = int(value)
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
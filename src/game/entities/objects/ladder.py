@@ -6,6 +6,8 @@ from ..objects import Platform
 
 
 class Ladder(Platform):
+    __slots__ = ()
+
     def __init__(self,
         x: int | float,
         y: int | float,
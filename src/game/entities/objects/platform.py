@@ -3,9 +3,14 @@ from ..actor import Actor, Arena
 
 # STATE
 from ...state import Sprite, Direction
+from ...state.fields import number
 
 
 class Platform(Actor):
+    static = True  # -> non si muove: indicizzata una sola volta nello StaticIndex di Arena
+    __slots__ = ("x", "y", "__width", "__height", "__contact_surfaces", "__damage", "__name")
+    _checks = {"x": number("x"), "y": number("y")}
+
     def __init__(self,
         x: int | float,
         y: int | float,
@@ -16,8 +21,7 @@ class Platform(Actor):
         *,
         name: str = "Platform"
     ) -> None:
-        self.x = x
-        self.y = y
+        self._init_fields(x=x, y=y)
         self.width = width
         self.height = height
         self.contact_surfaces = contact_surfaces
@@ -27,24 +31,6 @@ class Platform(Actor):
 
 
     # ======== PROPERTIES ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x: float = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y: float = float(value)
-
     @property
     def width(self) -> int:
         return self.__width
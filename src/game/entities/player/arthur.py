@@ -7,7 +7,8 @@ from ..actor import Actor, Arena
 
 # CORE
 if TYPE_CHECKING: from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
+from ...core.pool import acquire
 
 # WEAPON
 from ..weapons import Torch
@@ -16,7 +17,8 @@ from ..weapons import Torch
 from ...gui import GUIComponent, Bar
 
 # STATE
-from ...state import Sprite, EntityState, Action, Direction, SpriteCollection
+from ...state import Sprite, EntityState, Action, Direction, Clip, Clips
+from ...state.fields import number, integer
 
 
 
@@ -65,9 +67,36 @@ ARTHUR_SPRITE_CROUCHED_THROW_R2: Sprite = Sprite(path=ARTHUR_SPRITE_PATH, x=101,
 ARTHUR_SPRITE_CROUCHED_THROW_L1: Sprite = Sprite(path=ARTHUR_SPRITE_PATH, x=415, y=140, width=22, height=23)
 ARTHUR_SPRITE_CROUCHED_THROW_L2: Sprite = Sprite(path=ARTHUR_SPRITE_PATH, x=384, y=140, width=27, height=23)
 
+# CLIPS
+# -> WALKING e CLIMBING sono cicliche, le altre si fermano sull ultimo frame
+ARTHUR_CLIPS = Clips({
+    (Action.IDLE, Direction.RIGHT): Clip((ARTHUR_SPRITE_IDLE_R,), loop=False),
+    (Action.IDLE, Direction.LEFT): Clip((ARTHUR_SPRITE_IDLE_L,), loop=False),
+    (Action.WALKING, Direction.RIGHT): Clip((ARTHUR_SPRITE_WALKING_R1, ARTHUR_SPRITE_WALKING_R2, ARTHUR_SPRITE_WALKING_R3,
+                                             ARTHUR_SPRITE_WALKING_R4, ARTHUR_SPRITE_WALKING_R3, ARTHUR_SPRITE_WALKING_R2)),
+    (Action.WALKING, Direction.LEFT): Clip((ARTHUR_SPRITE_WALKING_L1, ARTHUR_SPRITE_WALKING_L2, ARTHUR_SPRITE_WALKING_L3,
+                                            ARTHUR_SPRITE_WALKING_L4, ARTHUR_SPRITE_WALKING_L3, ARTHUR_SPRITE_WALKING_L2)),
+    (Action.JUMPING, Direction.RIGHT): Clip((ARTHUR_SPRITE_JUMPING_R1, ARTHUR_SPRITE_JUMPING_R2), durations=(3, 1), loop=False),
+    (Action.JUMPING, Direction.LEFT): Clip((ARTHUR_SPRITE_JUMPING_L1, ARTHUR_SPRITE_JUMPING_L2), durations=(3, 1), loop=False),
+    (Action.CROUCHING, Direction.RIGHT): Clip((ARTHUR_SPRITE_CROUCHING_R,), loop=False),
+    (Action.CROUCHING, Direction.LEFT): Clip((ARTHUR_SPRITE_CROUCHING_L,), loop=False),
+    (Action.CLIMBING, Direction.RIGHT): Clip((ARTHUR_SPRITE_CLIMBING_R, ARTHUR_SPRITE_CLIMBING_L)),
+    (Action.CLIMBING, Direction.LEFT): Clip((ARTHUR_SPRITE_CLIMBING_L, ARTHUR_SPRITE_CLIMBING_R)),
+    (Action.CLIMBING_POSE, Direction.RIGHT): Clip((ARTHUR_SPRITE_CLIMBING_R,), loop=False),
+    (Action.CLIMBING_POSE, Direction.LEFT): Clip((ARTHUR_SPRITE_CLIMBING_L,), loop=False),
+    (Action.ATTACKING, Direction.RIGHT): Clip((ARTHUR_SPRITE_NORMAL_THROW_R1, ARTHUR_SPRITE_NORMAL_THROW_R2), loop=False),
+    (Action.ATTACKING, Direction.LEFT): Clip((ARTHUR_SPRITE_NORMAL_THROW_L1, ARTHUR_SPRITE_NORMAL_THROW_L2), loop=False),
+    (Action.ATTACKING_CROUCHED, Direction.RIGHT): Clip((ARTHUR_SPRITE_CROUCHED_THROW_R1, ARTHUR_SPRITE_CROUCHED_THROW_R2), loop=False),
+    (Action.ATTACKING_CROUCHED, Direction.LEFT): Clip((ARTHUR_SPRITE_CROUCHED_THROW_L1, ARTHUR_SPRITE_CROUCHED_THROW_L2), loop=False),
+})
+
 
 
 class Arthur(Actor):
+    __slots__ = ("x", "y", "x_step", "y_step", "sprite_cycle_counter", "__gravity", "__grounded", "__gui", "__health", "__height", "__invincibility", "__invincibility_time", "__jump_speed", "__laddered", "__max_health", "__name", "__priority_action", "__speed", "__sprite_cycle_speed", "__state", "__throw_cooldown", "__throw_interval", "__width", "_crouched_height", "_default_height", "_default_width", "_laddered_width")
+    _checks = {"x": number("x"), "y": number("y"), "x_step": number("x_step"), "y_step": number("y_step"), "sprite_cycle_counter": integer("sprite_cycle_counter")}
+    clips = ARTHUR_CLIPS  # -> animazioni condivise dalla classe: ogni istanza ha solo la testina (sprite_cycle_counter)
+
     def __init__(self, 
         name: str, 
         x: int | float, 
@@ -81,103 +110,46 @@ class Arthur(Actor):
         max_health: int | float | None = None,
         throw_interval: int | None = None
     ) -> None:
-        settings: dict = read_settings()
-        defaults: dict = settings.get("Arthur", {}).get("defaults", {})
+        defaults = get_settings().arthur
 
         # FORCED INIT
         self.name = name
-        self.x = x
-        self.y = y
+        self._init_fields(x=x, y=y)
 
         # INIT WITH DEFAULTS
-        self.width = width if width is not None else defaults.get("width", 21)
-        self.height = height if height is not None else defaults.get("height", 32)
-        self.speed = speed if speed is not None else defaults.get("speed", 5)
-        self.gravity = gravity if gravity is not None else defaults.get("gravity", 0.7)
-        self.jump_speed = jump_speed if jump_speed is not None else defaults.get("jump_speed", 10.0)
-        self.max_health = max_health if max_health is not None else defaults.get("max_health", 100)
-        self.health = health if health is not None else defaults.get("health", 100)
+        self.width = width if width is not None else defaults.width
+        self.height = height if height is not None else defaults.height
+        self.speed = speed if speed is not None else defaults.speed
+        self.gravity = gravity if gravity is not None else defaults.gravity
+        self.jump_speed = jump_speed if jump_speed is not None else defaults.jump_speed
+        self.max_health = max_health if max_health is not None else defaults.max_health
+        self.health = health if health is not None else defaults.health
 
         # STATE
-        self.x_step = 0
-        self.y_step = 0
+        self.x_step = 0.0
+        self.y_step = 0.0
         self.invincibility_countdown = 0
-        self.invincibility_time = defaults.get("invincibility_time", 60)
+        self.invincibility_time = defaults.invincibility_time
 
         self.state = EntityState(action=Action.WALKING, direction=Direction.RIGHT)
         self.sprite_cycle_counter = 0
-        self.sprite_cycle_speed = defaults.get("sprite_cycle_speed", 4)
+        self.sprite_cycle_speed = defaults.sprite_cycle_speed
 
         self.grounded = False
         self.laddered = False
         self.throw_cooldown = 0
-        self.throw_interval = throw_interval if throw_interval is not None else defaults.get("throw_interval", 10)
-
-        # SPRITES
-        self.sprites = SpriteCollection()
-        self.__init_sprites()
+        self.throw_interval = throw_interval if throw_interval is not None else defaults.throw_interval
 
         # INTERNAL PROPERTIES
         self._priority_action = None
-        self._default_height = defaults.get("default_height", 32)
-        self._crouched_height = defaults.get("crouched_height", 23)
-        self._default_width = defaults.get("default_width", 21)
-        self._laddered_width = defaults.get("laddered_width", 19)
-
-    def __init_sprites(self) -> None:
-        """Inizializza la collezione di sprite di Arthur.
-
-        Associa a ogni coppia (Action, Direction) la lista di sprite corretta
-        per gli stati principali:
-        - IDLE
-        - WALKING
-        - JUMPING
-        - CROUCHING
-        - CLIMBING e CLIMBING_POSE
-        - ATTACKING e ATTACKING_CROUCHED
-
-        Queste mappe vengono poi usate dal metodo sprite per scegliere il
-        frame giusto in base allo stato corrente.
-        """
-
-        global ARTHUR_SPRITE_IDLE_R, ARTHUR_SPRITE_IDLE_L
-        global ARTHUR_SPRITE_WALKING_R1, ARTHUR_SPRITE_WALKING_R2, ARTHUR_SPRITE_WALKING_R3, ARTHUR_SPRITE_WALKING_R4
-        global ARTHUR_SPRITE_WALKING_L1, ARTHUR_SPRITE_WALKING_L2, ARTHUR_SPRITE_WALKING_L3, ARTHUR_SPRITE_WALKING_L4
-        global ARTHUR_SPRITE_JUMPING_R1, ARTHUR_SPRITE_JUMPING_R2
-        global ARTHUR_SPRITE_JUMPING_L1, ARTHUR_SPRITE_JUMPING_L2
-        global ARTHUR_SPRITE_CROUCHING_R, ARTHUR_SPRITE_CROUCHING_L
-        global ARTHUR_SPRITE_CLIMBING_R, ARTHUR_SPRITE_CLIMBING_L
-        global ARTHUR_SPRITE_NORMAL_THROW_R1, ARTHUR_SPRITE_NORMAL_THROW_R2, ARTHUR_SPRITE_NORMAL_THROW_L1, ARTHUR_SPRITE_NORMAL_THROW_L2
-        global ARTHUR_SPRITE_CROUCHED_THROW_R1, ARTHUR_SPRITE_CROUCHED_THROW_R2, ARTHUR_SPRITE_CROUCHED_THROW_L1, ARTHUR_SPRITE_CROUCHED_THROW_L2
-
-        self.sprites[Action.IDLE, Direction.RIGHT] = [ARTHUR_SPRITE_IDLE_R]
-        self.sprites[Action.IDLE, Direction.LEFT] = [ARTHUR_SPRITE_IDLE_L]
-
-        self.sprites[Action.WALKING, Direction.RIGHT] = [ARTHUR_SPRITE_WALKING_R1, ARTHUR_SPRITE_WALKING_R2,
-                                                         ARTHUR_SPRITE_WALKING_R3, ARTHUR_SPRITE_WALKING_R4] + [
-                                                            ARTHUR_SPRITE_WALKING_R3, ARTHUR_SPRITE_WALKING_R2]
-        self.sprites[Action.WALKING, Direction.LEFT] = [ARTHUR_SPRITE_WALKING_L1, ARTHUR_SPRITE_WALKING_L2,
-                                                        ARTHUR_SPRITE_WALKING_L3, ARTHUR_SPRITE_WALKING_L4] + [
-                                                           ARTHUR_SPRITE_WALKING_L3, ARTHUR_SPRITE_WALKING_L2]
+        self._default_height = defaults.default_height
+        self._crouched_height = defaults.crouched_height
+        self._default_width = defaults.default_width
+        self._laddered_width = defaults.laddered_width
 
-        self.sprites[Action.JUMPING, Direction.RIGHT] = [ARTHUR_SPRITE_JUMPING_R1] * 3 + [ARTHUR_SPRITE_JUMPING_R2]
-        self.sprites[Action.JUMPING, Direction.LEFT] = [ARTHUR_SPRITE_JUMPING_L1] * 3 + [ARTHUR_SPRITE_JUMPING_L2]
+        # GUI
+        self.__gui: tuple[Bar, Bar, Bar] | None = None  # -> barre create al primo accesso a gui e poi riusate
 
-        self.sprites[Action.CROUCHING, Direction.RIGHT] = [ARTHUR_SPRITE_CROUCHING_R]
-        self.sprites[Action.CROUCHING, Direction.LEFT] = [ARTHUR_SPRITE_CROUCHING_L]
-
-        self.sprites[Action.CLIMBING, Direction.RIGHT] = [ARTHUR_SPRITE_CLIMBING_R, ARTHUR_SPRITE_CLIMBING_L]
-        self.sprites[Action.CLIMBING, Direction.LEFT] = [ARTHUR_SPRITE_CLIMBING_L, ARTHUR_SPRITE_CLIMBING_R]
-
-        self.sprites[Action.CLIMBING_POSE, Direction.RIGHT] = [ARTHUR_SPRITE_CLIMBING_R]
-        self.sprites[Action.CLIMBING_POSE, Direction.LEFT] = [ARTHUR_SPRITE_CLIMBING_L]
-
-        self.sprites[Action.ATTACKING, Direction.RIGHT] = [ARTHUR_SPRITE_NORMAL_THROW_R1, ARTHUR_SPRITE_NORMAL_THROW_R2]
-        self.sprites[Action.ATTACKING, Direction.LEFT] = [ARTHUR_SPRITE_NORMAL_THROW_L1, ARTHUR_SPRITE_NORMAL_THROW_L2]
-
-        self.sprites[Action.ATTACKING_CROUCHED, Direction.RIGHT] = [ARTHUR_SPRITE_CROUCHED_THROW_R1, ARTHUR_SPRITE_CROUCHED_THROW_R2]
-        self.sprites[Action.ATTACKING_CROUCHED, Direction.LEFT] = [ARTHUR_SPRITE_CROUCHED_THROW_L1, ARTHUR_SPRITE_CROUCHED_THROW_L2]
-    
     # ======== ======== ======== ========
     # INTERFACE IMPLEMENTATION 
     # ........ ........ ........ ........
@@ -220,7 +192,7 @@ class Arthur(Actor):
             spawn_x = self.x + (self.width // 2) + offset_x
             spawn_y = self.y + self.height * 0.1
 
-            torch = Torch(x=spawn_x, y=spawn_y, direction=self.state.direction)
+            torch = acquire(arena, Torch, x=spawn_x, y=spawn_y, direction=self.state.direction)  # -> dal Pool di Game, se presente
             if hasattr(arena, "spawn"): arena.spawn(torch)
 
             self.throw_cooldown = self.throw_interval
@@ -268,81 +240,96 @@ class Arthur(Actor):
 
 
 
-    def sprite(self) -> Sprite | None: # type: ignore
-        """Restituisce lo sprite corrente di Arthur in base allo stato.
+    def animate(self) -> None:
+        """Fa avanzare di un passo l'animazione di Arthur (chiamato da Game.tick).
 
-        Determina l azione effettiva da visualizzare usando una eventuale
+        Determina l azione effettiva da animare usando una eventuale
         azione prioritaria (per esempio durante un attacco), quindi:
 
-        - verifica che esista una lista di sprite per (Action, Direction)
-        - imposta la proprieta blinking degli sprite se Arthur è in stato
-          di invincibilita (invincibility_countdown > 0)
         - se l'animazione prioritaria è terminata, rimuove la priorita
+        - incrementa lo sprite_cycle_counter
 
-        In base all azione effettiva:
-        - usa una selezione ciclica per WALKING e CLIMBING
-        - usa una selezione bloccata per IDLE, JUMPING, CROUCHING,
-          CLIMBING_POSE, ATTACKING e ATTACKING_CROUCHED
-        - restituisce None se non ce sprite valido per lo stato corrente.
+        Non fa nulla se non ce una clip per lo stato corrente. Il
+        lampeggio dell invincibilita non modifica gli sprite (condivisi da
+        tutte le istanze): è deciso al rendering tramite blinking.
         """
 
         action = self.state.action if self._priority_action is None else self._priority_action
-        direction = self.state.direction
 
-        if (action, direction) not in self.sprites.__iter__():
-            return None
-
-        list_sprites = self.sprites[action, direction]
-        for sprite in list_sprites:
-            sprite.blinking = self.invincibility_countdown > 0
+        if (action, self.state.direction) not in self.clips:
+            return
 
         if self._priority_action is not None and self._locked_anim_finished():
             self._priority_action = None
 
-        match action:
-            case Action.IDLE: return self._locked_looping_sprite_selection(list_sprites)
-            case Action.WALKING: return self._looping_sprite_selection(list_sprites)
-            case Action.JUMPING: return self._locked_looping_sprite_selection(list_sprites)
-            case Action.CROUCHING: return self._locked_looping_sprite_selection(list_sprites)
-            case Action.CLIMBING: return self._looping_sprite_selection(list_sprites)
-            case Action.CLIMBING_POSE: return self._locked_looping_sprite_selection(list_sprites)
-            case Action.ATTACKING: return self._locked_looping_sprite_selection(list_sprites)
-            case Action.ATTACKING_CROUCHED: return self._locked_looping_sprite_selection(list_sprites)
-            case _: return None
+        self.increment_sprite_cycle_counter()
+
+    def sprite(self) -> Sprite | None: # type: ignore
+        """Restituisce lo sprite corrente di Arthur in base allo stato.
+
+        Non modifica lo stato di Arthur: l'animazione avanza solo in
+        animate. L azione visualizzata è quella prioritaria, se presente,
+        altrimenti quella dello stato.
+
+        La clip della coppia (Action, Direction) è ciclica per WALKING e
+        CLIMBING e si ferma sull ultimo frame per le altre azioni (vedi
+        ARTHUR_CLIPS). Restituisce None se non ce una clip per lo stato
+        corrente.
+        """
+
+        action = self.state.action if self._priority_action is None else self._priority_action
+
+        clip = self.clips.get((action, self.state.direction))
+        if clip is None:
+            return None
+        return clip.frame(self.sprite_cycle_counter // self.__sprite_cycle_speed)
+
+    @property
+    def blinking(self) -> bool:
+        """True se Arthur è invincibile: il rendering lo fa lampeggiare."""
+        return self.invincibility_countdown > 0
 
     @property
     def gui(self) -> list[GUIComponent]:
-        """Restituisce una lista di GUIComponent da visualizzare nella GUI."""
-
-        health_bar: GUIComponent = Bar(
-                name_id="health_bar",
-                x=3, y=3, padding=1,
-                text="Health: {value}",
-                max_value=self.max_health,
-                value=lambda: self.health,
-                fixed=True,
-            )
+        """Restituisce una lista di GUIComponent da visualizzare nella GUI.
+
+        Le barre sono create una sola volta e legate ai valori di Arthur:
+        ad ogni accesso cambia solo quali barre sono visibili.
+        """
 
-        invincibility_bar: GUIComponent = Bar(
-                name_id="invincibility_bar",
-                x=3, y=20+14+3, padding=1,
+        if self.__gui is None:
+            health_bar: Bar = Bar(
+                    name_id="health_bar",
+                    x=3, y=3, padding=1,
+                    text="Health: {value}",
+                    max_value=lambda: self.max_health,
+                    value=lambda: self.health,
+                    fixed=True,
+                )
+
+            invincibility_bar: Bar = Bar(
+                    name_id="invincibility_bar",
+                    x=3, y=20+14+3, padding=1,
+                    width=72, height=14,
+                    background_color=(64, 64, 64), bar_color=(156, 156, 156),
+                    text="Invincibility", text_size=10, text_color=(248, 248, 248),
+                    max_value=lambda: self.invincibility_time, value=lambda: self.invincibility_countdown,
+                    fixed=True
+                )
+
+            weapon_bar: Bar = Bar(
+                name_id="weapon_bar",
+                x=3, y=20, padding=1,
                 width=72, height=14,
-                background_color=(64, 64, 64), bar_color=(156, 156, 156),
-                text="Invincibility", text_size=10, text_color=(248, 248, 248),
-                max_value=self.invincibility_time, value=self.invincibility_countdown,
+                text="Attack [1]", text_size=10, text_color=(248, 248, 248),
+                max_value=lambda: self.throw_interval, value=lambda: self.throw_interval - self.throw_cooldown,
+                background_color=(8, 16, 116), bar_color=(96, 128, 248),
                 fixed=True
             )
 
-        weapon_bar: GUIComponent = Bar(
-            name_id="weapon_bar",
-            x=3, y=20, padding=1,
-            width=72, height=14,
-            text="Attack [1]", text_size=10, text_color=(248, 248, 248),
-            max_value=self.throw_interval, value=self.throw_interval - self.throw_cooldown,
-            background_color=(8, 16, 116), bar_color=(96, 128, 248),
-            fixed=True
-        )
+            self.__gui = health_bar, invincibility_bar, weapon_bar
 
+        health_bar, invincibility_bar, weapon_bar = self.__gui
         return [health_bar] + ([invincibility_bar] if self.invincibility_countdown > 0 else []) + ([weapon_bar])
 
     def hit(self, damage: float) -> None:
@@ -443,57 +430,28 @@ class Arthur(Actor):
 
         self.laddered = False
 
-    def _looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        """Seleziona il prossimo sprite in una animazione ciclica.
-
-        Incrementa lo sprite_cycle_counter e sceglie il frame successivo
-        nella lista sprites, ripetendola in loop in base alla velocità
-        sprite_cycle_speed.
-
-        Restituisce lo sprite selezionato.
-        """
-        self.increment_sprite_cycle_counter()
-        return sprites[(self.sprite_cycle_counter // self.__sprite_cycle_speed) % len(sprites)]
-
-    def _locked_looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        """Seleziona il prossimo sprite in una animazione bloccata.
-
-        Incrementa lo sprite_cycle_counter e avanza nell elenco sprites
-        in base a sprite_cycle_speed. Una volta raggiunto l ultimo frame,
-        continua a restituire sempre l'ultimo sprite disponibile senza
-        tornare all inizio della lista.
-
-        Restituisce lo sprite selezionato.
-        """
-        self.increment_sprite_cycle_counter()
-        i = self.sprite_cycle_counter // self.__sprite_cycle_speed
-        return sprites[i if i < len(sprites) else -1]
-
     def _locked_anim_finished(self) -> bool:
         """Verifica se l'animazione bloccata corrente è arrivata all ultimo frame.
 
-        Calcola l'indice del frame da mostrare usando sprite_cycle_counter
-        e sprite_cycle_speed, e restituisce True se l'indice ha superato
-        l'ultimo sprite disponibile per la combinazione (Action, Direction)
-        corrente. In caso contrario restituisce False.
+        Calcola il passo corrente usando sprite_cycle_counter e
+        sprite_cycle_speed e lo confronta con la durata della clip della
+        combinazione (Action, Direction) corrente (vedi Clip.finished).
+        Restituisce True anche se non ce una clip per lo stato corrente.
         """
 
         action = self.state.action if self._priority_action is None else self._priority_action
-        direction = self.state.direction
 
-        if (action, direction) not in self.sprites.__iter__():
+        clip = self.clips.get((action, self.state.direction))
+        if clip is None:
             return True
-
-        sprites = self.sprites[action, direction]
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return i >= len(sprites) - 1
+        return clip.finished(self.sprite_cycle_counter // self.sprite_cycle_speed)
 
     def _set_state_action(self, action: Action, *, reset: bool = True) -> None:
         """Cambia l'azione dello stato di Arthur e adatta dimensioni e posizione.
 
         Se l'azione cambia e reset è True, azzera il contatore degli sprite.
 
-        Se esiste almeno uno sprite per la nuova combinazione (Action, Direction):
+        Se esiste una clip per la nuova combinazione (Action, Direction):
         - imposta altezza e posizione verticale in modo da mantenere i piedi
           di Arthur sul terreno, usando default_height o crouched_height a
           seconda che sia accovacciato o meno
@@ -508,7 +466,7 @@ class Arthur(Actor):
 
         self.state.action = action
 
-        if (self.state.action, self.state.direction) in self.sprites.__iter__():
+        if (self.state.action, self.state.direction) in self.clips:
             if self.state.action in (Action.CROUCHING, Action.ATTACKING_CROUCHED):
                 self.y = self.y + self.height - self._crouched_height
                 self.height = self._crouched_height
@@ -536,24 +494,6 @@ class Arthur(Actor):
     def name(self, value: str):
         self.__name: str = str(value)
 
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x: float = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y: float = float(value)
-
     @property
     def width(self) -> int:
         return self.__width
@@ -581,15 +521,6 @@ class Arthur(Actor):
             raise TypeError("speed must be an int or float")
         self.__speed: float = float(value)
 
-    @property
-    def x_step(self) -> float:
-        return self.__x_step
-    @x_step.setter
-    def x_step(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x_step must be an int or float")
-        self.__x_step: float = float(value)
-
     @property
     def gravity(self) -> float:
         return self.__gravity
@@ -608,15 +539,6 @@ class Arthur(Actor):
             raise TypeError("jump_speed must be an int or float")
         self.__jump_speed: float = float(value)
 
-    @property
-    def y_step(self) -> float:
-        return self.__y_step
-    @y_step.setter
-    def y_step(self, value: int | float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y_step must be an int or float")
-        self.__y_step: float = float(value)
-
     @property
     def health(self) -> float:
         return self.__health
@@ -666,15 +588,6 @@ class Arthur(Actor):
             raise TypeError("state must be an instance of State")
         self.__state: EntityState = value
 
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int):
-        if not isinstance(value, int):
-            raise TypeError("sprite_cycle_counter must be an int")
-        self.__sprite_cycle_counter: int = int(value)
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
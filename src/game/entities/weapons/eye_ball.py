@@ -4,7 +4,8 @@ import pathlib
 
 # CORE
 if TYPE_CHECKING: from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
+from ...core.bodies import Body
 
 # ACTOR
 from ..actor import Arena, Actor
@@ -13,7 +14,8 @@ from ..actor import Arena, Actor
 from .weapon import Weapon
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clip, Clips
+from ...state.fields import number
 
 
 
@@ -23,8 +25,18 @@ EYEBALL_SPRITE_PATH = pathlib.Path(__file__).parent.parent.parent.parent / "data
 EYEBALL_SPRITE_R1: Sprite = Sprite(path=EYEBALL_SPRITE_PATH, x=552, y=219, width=8, height=8)
 EYEBALL_SPRITE_L1: Sprite = Sprite(path=EYEBALL_SPRITE_PATH, x=746, y=219, width=8, height=8)
 
+EYEBALL_CLIPS = Clips({
+    (Action.ATTACKING, Direction.RIGHT): Clip((EYEBALL_SPRITE_R1,)),
+    (Action.ATTACKING, Direction.LEFT): Clip((EYEBALL_SPRITE_L1,)),
+})
+
 
 class EyeBall(Weapon):
+    __slots__ = ("x", "y", "__damage", "__height", "__max_travel_distance", "__speed", "__travelled_distance", "__width", "direction")
+    _checks = {"x": number("x"), "y": number("y")}
+    body = Body(heading="speed", travel=("travelled_distance", "max_travel_distance"))  # -> modalità a componenti: vedi Bodies
+    clips = EYEBALL_CLIPS
+
     def __init__(
         self,
         x: float,
@@ -37,42 +49,60 @@ class EyeBall(Weapon):
         max_travel_distance: float | None = None,
         sprite_cycle_speed: int | None = None,
     ) -> None:
-        defaults: dict = read_settings().get("EyeBall", {}).get("defaults", {})
+        defaults = get_settings().eye_ball
 
-        # FORCED INIT
-        self.x = x
-        self.y = y
-
-        # DEFAULTS
-        direction_str = defaults.get("direction", "RIGHT")
-        self.direction = direction if direction is not None else getattr(Direction, direction_str, Direction.RIGHT)
-
-        self.speed = speed if speed is not None else defaults.get("speed", 2.0)
-        self.damage = damage if damage is not None else defaults.get("damage", 10)
-        self.max_travel_distance = max_travel_distance if max_travel_distance is not None else defaults.get("max_travel_distance", 400.0)
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 6)
+        direction_val = direction if direction is not None else defaults.direction
 
         super().__init__(
             owner=owner,
             action=Action.ATTACKING,
-            direction=self.direction,
-            sprite_cycle_speed=self.sprite_cycle_speed,
+            direction=direction_val,
+            sprite_cycle_speed=sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed,
         )
 
         # STATE
-        self.state = EntityState(action=Action.ATTACKING, direction=self.direction)
-        self.sprites = SpriteCollection()
-        self.sprite_cycle_counter = 0
+        self.state = EntityState(action=Action.ATTACKING, direction=direction_val)
+
+        self.reset(x, y, direction, owner=owner, speed=speed, damage=damage, max_travel_distance=max_travel_distance, sprite_cycle_speed=sprite_cycle_speed)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        direction: Direction | None = None,
+        *,
+        owner: Actor | None = None,
+        speed: float | None = None,
+        damage: int | float | None = None,
+        max_travel_distance: float | None = None,
+        sprite_cycle_speed: int | None = None,
+    ) -> None:
+        """Riporta l'occhio allo stato di uno appena costruito con gli stessi
+        argomenti, riusando il suo stato (chiamato da Pool.acquire).
+        """
+        defaults = get_settings().eye_ball
 
-        self.sprites[Action.ATTACKING, Direction.RIGHT] = [EYEBALL_SPRITE_R1]
-        self.sprites[Action.ATTACKING, Direction.LEFT] = [EYEBALL_SPRITE_L1]
+        # FORCED INIT
+        self._init_fields(x=x, y=y)
 
-        first = self.sprites[self.state.action, self.state.direction][0]
+        # DEFAULTS
+        self.direction = direction if direction is not None else defaults.direction
+
+        self.speed = speed if speed is not None else defaults.speed
+        self.damage = damage if damage is not None else defaults.damage
+        self.max_travel_distance = max_travel_distance if max_travel_distance is not None else defaults.max_travel_distance
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
+
+        # STATE
+        self.state.action = Action.ATTACKING
+        self.state.direction = self.direction
+        self.sprite_cycle_counter = 0
+
+        first = self.clips[self.state.action, self.state.direction].first
         self.width = first.width
         self.height = first.height
 
         self.travelled_distance = 0.0
-        self.max_travel_distance = float(self.max_travel_distance)
 
 
     # ======== INTERFACE IMPLEMENTATION ========
@@ -95,19 +125,20 @@ class EyeBall(Weapon):
             self.x -= self.speed
 
         self.travelled_distance += abs(self.x - old_x)
+        self.advance_state()
 
+    def advance_state(self) -> None:
+        """Transizione di stato dopo il movimento del frame (chiamata anche da Bodies)."""
         # dies after traveling max_travel_distance
         if self.travelled_distance >= self.max_travel_distance:
             self.state.action = Action.DEAD
-            return
 
 
     def sprite(self) -> Sprite | None:
         if self.state.action is Action.DEAD:
             return None
 
-        sprites = self.sprites[self.state.action, self.state.direction]
-        return self._looping_sprite_selection(sprites)
+        return self._clip_sprite()
 
     # ======== METHODS ========
     def hit(self, damage: int | float) -> None:
@@ -115,24 +146,6 @@ class EyeBall(Weapon):
 
 
     # ======== PROPRIETÀ ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y = float(value)
-
     @property
     def width(self) -> int:
         return self.__width
@@ -3,13 +3,16 @@ import pathlib
 
 # CORE
 if TYPE_CHECKING: from ...core import Game
-from ...core.file_management import read_settings
+from ...core.settings import get_settings
+from ...core.bodies import Body
+from ...core.pool import acquire
 
 # ACTOR
 from ..actor import Actor
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clip, Clips
+from ...state.fields import number
 
 # OBJECTS
 from ..objects import Flame
@@ -30,9 +33,19 @@ TORCH_FLY_L2 = Sprite(SPR_PATH, 457, 398, 16, 16)
 TORCH_FLY_L3 = Sprite(SPR_PATH, 439, 399, 16, 16)
 TORCH_FLY_L4 = Sprite(SPR_PATH, 419, 398, 16, 16)
 
+TORCH_CLIPS = Clips({
+    (Action.ATTACKING, Direction.RIGHT): Clip((TORCH_FLY_R1, TORCH_FLY_R2, TORCH_FLY_R3, TORCH_FLY_R4, TORCH_FLY_R3, TORCH_FLY_R2)),
+    (Action.ATTACKING, Direction.LEFT): Clip((TORCH_FLY_L1, TORCH_FLY_L2, TORCH_FLY_L3, TORCH_FLY_L4, TORCH_FLY_L3, TORCH_FLY_L2)),
+})
+
 
 
 class Torch(Weapon):
+    __slots__ = ("x", "y", "x_step", "y_step", "__damage", "__gravity", "__height", "__state", "__width", "direction", "speed")
+    _checks = {"x": number("x"), "y": number("y"), "x_step": number("x_step"), "y_step": number("y_step")}
+    body = Body(velocity=("x_step", "y_step"), gravity="gravity")  # -> modalità a componenti: vedi Bodies
+    clips = TORCH_CLIPS
+
     def __init__(
         self,
         x: float,
@@ -46,49 +59,56 @@ class Torch(Weapon):
         direction: Direction | None = None,
         sprite_cycle_speed: int | None = None,
     ) -> None:
-        defaults: dict = read_settings().get("Torch", {}).get("defaults", {})
+        defaults = get_settings().torch
 
-        # DEFAULTS
-        self.damage = damage if damage is not None else defaults.get("damage", 50)
-        self.speed = speed if speed is not None else defaults.get("speed", 7.0)
-        self.gravity = gravity if gravity is not None else defaults.get("gravity", 0.7)
-        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.get("sprite_cycle_speed", 4)
+        action_val = action if action is not None else defaults.action
+        direction_val = direction if direction is not None else defaults.direction
+        sprite_cycle_speed_val = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
 
-        action_val = action if action is not None else getattr(Action, defaults.get("action", "ATTACKING"), Action.ATTACKING)
-        self.direction = direction if direction is not None else getattr(Direction, defaults.get("direction", "RIGHT"), Direction.RIGHT)
+        super().__init__(owner=owner, action=action_val, direction=direction_val, sprite_cycle_speed=sprite_cycle_speed_val)
+
+        # STATE
+        self.state = EntityState(action=Action.ATTACKING, direction=direction_val)
 
-        super().__init__(owner=owner, action=action_val, direction=self.direction, sprite_cycle_speed=self.sprite_cycle_speed)
+        self.reset(x, y, damage, speed, gravity, owner=owner, action=action, direction=direction, sprite_cycle_speed=sprite_cycle_speed)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        damage: int | float | None = None,
+        speed: float | None = None,
+        gravity: float | None = None,
+        *,
+        owner: Actor | None = None,
+        action: Action | None = None,
+        direction: Direction | None = None,
+        sprite_cycle_speed: int | None = None,
+    ) -> None:
+        """Riporta la torcia allo stato di una appena costruita con gli stessi
+        argomenti, riusando il suo stato (chiamato da Pool.acquire).
+        """
+        defaults = get_settings().torch
+
+        # DEFAULTS
+        self.damage = damage if damage is not None else defaults.damage
+        self.speed = speed if speed is not None else defaults.speed
+        self.gravity = gravity if gravity is not None else defaults.gravity
+        self.sprite_cycle_speed = sprite_cycle_speed if sprite_cycle_speed is not None else defaults.sprite_cycle_speed
+        self.direction = direction if direction is not None else defaults.direction
 
         # STATE
-        self.state = EntityState(action=Action.ATTACKING, direction=self.direction)
-        self.sprites = SpriteCollection()
-        self.init_sprites()
+        self.state.action = Action.ATTACKING
+        self.state.direction = self.direction
         self.sprite_cycle_counter = 0
 
-        first = self.sprites[self.state.action, self.state.direction][0]
+        first = self.clips[self.state.action, self.state.direction].first
         self.width = first.width
         self.height = first.height
 
         # POSITION
-        self.x = float(x)
-        self.y = float(y)
-        self.x_step = self.speed if self.direction == Direction.RIGHT else -self.speed
-        self.y_step = -5
-        self.gravity = float(self.gravity)
-
-
-    def init_sprites(self) -> None:
-        global TORCH_FLY_R1, TORCH_FLY_R2, TORCH_FLY_R3, TORCH_FLY_R4
-        global TORCH_FLY_L1, TORCH_FLY_L2, TORCH_FLY_L3, TORCH_FLY_L4
-
-        self.sprites[Action.ATTACKING, Direction.RIGHT] = [
-            TORCH_FLY_R1, TORCH_FLY_R2, TORCH_FLY_R3, TORCH_FLY_R4,
-            TORCH_FLY_R3, TORCH_FLY_R2
-        ]
-        self.sprites[Action.ATTACKING, Direction.LEFT] = [
-            TORCH_FLY_L1, TORCH_FLY_L2, TORCH_FLY_L3, TORCH_FLY_L4,
-            TORCH_FLY_L3, TORCH_FLY_L2
-        ]
+        self._init_fields(x=x, y=y, x_step=self.speed if self.direction == Direction.RIGHT else -self.speed, y_step=-5)
+
 
     # ======== INTERFACE IMPLEMENTATION ========
     def pos(self) -> tuple[float, float]:
@@ -112,8 +132,7 @@ class Torch(Weapon):
         if self.state.action == Action.DEAD:
             return None
 
-        sprites = self.sprites[(self.state.action, self.state.direction)]
-        return self._looping_sprite_selection(sprites)
+        return self._clip_sprite()
 
 
     # ======== HELPER METHODS ========
@@ -130,50 +149,15 @@ class Torch(Weapon):
 
     def _spawn_flame(self, game: "Game") -> None:
         flame_x = self.x + self.width / 2
-        flame_y = self.y + self.height
-        game.spawn(Flame(x=flame_x, ground_y=flame_y))
+        ground = game.ground_below(flame_x, self.y + self.height)
+        flame_y = self.y + self.height if ground is None else ground[0]  # -> nessun appoggio sotto il centro: resta all'altezza d'impatto
+        game.spawn(acquire(game, Flame, x=flame_x, ground_y=flame_y))  # -> dal Pool di Game, se presente
 
     def hit(self, damage: int | float) -> None:
         self.state.action = Action.DEAD
 
 
     # ======== PROPERTIES ========
-    @property
-    def x(self) -> float:
-        return self.__x
-    @x.setter
-    def x(self, value: float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x: float = float(value)
-
-    @property
-    def y(self) -> float:
-        return self.__y
-    @y.setter
-    def y(self, value: float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y: float = float(value)
-
-    @property
-    def x_step(self) -> float:
-        return self.__vx
-    @x_step.setter
-    def x_step(self, value: float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("x_step must be an int or float")
-        self.__vx: float = float(value)
-
-    @property
-    def y_step(self) -> float:
-        return self.__vy
-    @y_step.setter
-    def y_step(self, value: float):
-        if not isinstance(value, (int, float)):
-            raise TypeError("y_step must be an int or float")
-        self.__vy: float = float(value)
-
     @property
     def gravity(self) -> float:
         return self.__gravity
@@ -192,15 +176,6 @@ class Torch(Weapon):
             raise TypeError("state must be a State")
         self.__state: EntityState = value
 
-    @property
-    def sprites(self) -> SpriteCollection:
-        return self.__sprites
-    @sprites.setter
-    def sprites(self, value: SpriteCollection):
-        if not isinstance(value, SpriteCollection):
-            raise TypeError("sprites must be a SpriteCollection")
-        self.__sprites: SpriteCollection = value
-
     @property
     def width(self) -> int:
         return self.__width
@@ -2,10 +2,15 @@
 from ..actor import Actor, Arena
 
 # STATE
-from ...state import Action, Direction, Sprite, SpriteCollection, EntityState
+from ...state import Action, Direction, Sprite, EntityState, Clips
+from ...state.fields import integer
 
 
 class Weapon(Actor):
+    __slots__ = ("sprite_cycle_counter", "__sprite_cycle_speed", "state")
+    _checks = {"sprite_cycle_counter": integer("sprite_cycle_counter")}
+    clips: Clips = Clips({})  # -> animazioni condivise dalla classe: ogni arma ha solo la testina (sprite_cycle_counter)
+
     def __init__(self,
         *,
         owner: Actor = None,
@@ -14,7 +19,6 @@ class Weapon(Actor):
         sprite_cycle_speed: int = 4
     ) -> None:
         self.state = EntityState(action=action, direction=direction)
-        self.sprites = SpriteCollection()
         self.sprite_cycle_counter = 0
         self.sprite_cycle_speed = int(sprite_cycle_speed)
 
@@ -28,15 +32,6 @@ class Weapon(Actor):
         self.sprite_cycle_counter += 1
         return self.sprite_cycle_counter
 
-    @property
-    def sprite_cycle_counter(self) -> int:
-        return self.__sprite_cycle_counter
-    @sprite_cycle_counter.setter
-    def sprite_cycle_counter(self, value: int) -> None:
-        if not isinstance(value, int):
-            raise TypeError("sprite cycle counter must be an integer")
-        self.__sprite_cycle_counter: int = value
-
     @property
     def sprite_cycle_speed(self) -> int:
         return self.__sprite_cycle_speed
@@ -57,12 +52,15 @@ class Weapon(Actor):
     def move(self, arena: Arena) -> None: ...
     def sprite(self) -> Sprite | None: ...
 
-    # ======== HELPER METHODS ========
-    def _looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        self.sprite_cycle_counter += 1
-        return sprites[(self.sprite_cycle_counter // self.sprite_cycle_speed) % len(sprites)]
+    def animate(self) -> None:
+        # -> chiamato da Game.tick: l'animazione avanza con la simulazione, non con il rendering
+        if self.state.action is not Action.DEAD:
+            self.sprite_cycle_counter += 1
 
-    def _locked_looping_sprite_selection(self, sprites: list[Sprite]) -> Sprite:
-        self.sprite_cycle_counter += 1
-        i = self.sprite_cycle_counter // self.sprite_cycle_speed
-        return sprites[i if i < len(sprites) else -1]
+    # ======== HELPER METHODS ========
+    def _clip_sprite(self) -> Sprite | None:
+        """Sprite della clip di (azione, direzione) alla testina corrente, None se la clip non c'è."""
+        clip = self.clips.get((self.state.action, self.state.direction))
+        if clip is None:
+            return None
+        return clip.frame(self.sprite_cycle_counter // self.sprite_cycle_speed)
@@ -22,8 +22,11 @@ class Bar(GUIComponent):
         """
         Semplice barra orizzontale con testo opzionale.
         Può rappresentare valori come vita, mana, energia o progressi.
-        Il valore corrente può essere un numero fisso o una funzione che viene valutata ad ogni frame.
+        Il valore corrente può essere un numero fisso o una funzione che viene valutata ad ogni frame;
+        lo stesso vale per x, y e max_value, così l'entità crea la barra una sola volta e la lega
+        alle proprie grandezze. La barra viene ridisposta e ri-rasterizzata solo quando cambia render_key.
         """
+        self.__info_key, self.__info = None, None
         self.name_id = name_id
         self.x = x
         self.y = y
@@ -51,21 +54,21 @@ class Bar(GUIComponent):
 
     @property
     def x(self) -> float:
-        return self.__x
+        return self.__x if isinstance(self.__x, float) else float(self.__x())
     @x.setter
-    def x(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("x must be an int or float")
-        self.__x: float = float(value)
+    def x(self, value: float | Callable) -> None:
+        if not isinstance(value, (int, float, Callable)):
+            raise TypeError("x must be an int or float or Callable")
+        self.__x: float | Callable = float(value) if isinstance(value, (int, float)) else value
 
     @property
     def y(self) -> float:
-        return self.__y
+        return self.__y if isinstance(self.__y, float) else float(self.__y())
     @y.setter
-    def y(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("y must be an int or float")
-        self.__y: float = float(value)
+    def y(self, value: float | Callable) -> None:
+        if not isinstance(value, (int, float, Callable)):
+            raise TypeError("y must be an int or float or Callable")
+        self.__y: float | Callable = float(value) if isinstance(value, (int, float)) else value
 
     @property
     def width(self) -> float:
@@ -136,12 +139,12 @@ class Bar(GUIComponent):
 
     @property
     def max_value(self) -> float:
-        return self.__max_value
+        return self.__max_value if isinstance(self.__max_value, float) else float(self.__max_value())
     @max_value.setter
-    def max_value(self, value: float) -> None:
-        if not isinstance(value, (int, float)):
-            raise TypeError("max must be an int or float")
-        self.__max_value: float = float(value)
+    def max_value(self, value: float | Callable) -> None:
+        if not isinstance(value, (int, float, Callable)):
+            raise TypeError("max must be an int or float or Callable")
+        self.__max_value: float | Callable = float(value) if isinstance(value, (int, float)) else value
 
     @property
     def value(self) -> float:
@@ -177,6 +180,15 @@ class Bar(GUIComponent):
             raise TypeError("fixed must be a boolean")
         self.__fixed: bool = bool(value)
 
+    def render_key(self) -> tuple:
+        return (
+            self.value, self.max_value, self.width, self.height, self.padding,
+            self.text, self.text_size, self.text_color, self.background_color, self.bar_color
+        )
+
+    def bounds(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        return (self.x, self.y), (self.width, self.height)
+
     def render_info(self, new_value: float = None):
         """
         Restituisce le informazioni grafiche per disegnare la Bar.
@@ -186,11 +198,19 @@ class Bar(GUIComponent):
         - un rettangolo di sfondo
         - un rettangolo interno che rappresenta il valore attuale
         - un testo centrato con il valore formattato dentro la stringa text
+
+        Se render_key e posizione non sono cambiati dall'ultima chiamata
+        restituisce le stesse informazioni, senza ricalcolarle.
         """
 
-        self.value = new_value if new_value is not None else self.value
+        if new_value is not None:
+            self.value = new_value
 
         x, y = self.x, self.y
+        key = (self.render_key(), x, y)
+        if key == self.__info_key:
+            return self.__info
+
         width, height = self.width, self.height
 
         inner_x, inner_y = x + self.padding, y + self.padding
@@ -201,7 +221,7 @@ class Bar(GUIComponent):
 
         text = self.text.replace("{value}", str(int(round(self.value))))
 
-        return [
+        self.__info_key, self.__info = key, [
             {
                 "type": "rect",
                 "color": self.background_color,
@@ -221,4 +241,5 @@ class Bar(GUIComponent):
                 "center": (center_x, center_y),
                 "font_size": self.text_size
             }
-        ]
\ No newline at end of file
+        ]
+        return self.__info
@@ -2,9 +2,9 @@ from collections.abc import Callable
 from .gui_component import GUIComponent
 from .color import Color
 
-from ..core.file_management import read_settings
+from ..core.settings import get_settings
 
-SCALE = read_settings().get("scale", 1)
+SCALE = get_settings().scale
 
 class Button(GUIComponent):
     def __init__(self,
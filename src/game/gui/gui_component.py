@@ -13,4 +13,18 @@ class GUIComponent(object):
         raise NotImplementedError
     @fixed.setter
     def fixed(self, value) -> None:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    # ======== RETAINED MODE ========
+    def render_key(self) -> tuple | None:
+        """Chiave che descrive l'aspetto del componente (posizione esclusa).
+
+        Se diversa da None, GraphicalInterface rasterizza il componente una
+        sola volta in una superficie e la ridisegna finché la chiave non
+        cambia. None (default) -> il componente è ridisegnato ogni frame.
+        """
+        return None
+
+    def bounds(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Restituisce (pos, size) dell'area occupata dal componente."""
+        raise NotImplementedError
@@ -1,4 +1,6 @@
 from .sprite import Sprite
 from .entity_state import EntityState
 from .states import Action, Direction, Phase
-from .sprite_collection import SpriteCollection
\ No newline at end of file
+from .sprite_collection import SpriteCollection
+from .clip import Clip, Clips
+from .fields import Checked, set_debug, debug_enabled
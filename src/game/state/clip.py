@@ -0,0 +1,120 @@
+import bisect
+import itertools
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+
+from .sprite import Sprite
+from .states import Action, Direction
+
+
+@dataclass(frozen=True)
+class Clip:
+    """Animazione immutabile, condivisa da tutti gli attori di una classe.
+
+    frames sono gli sprite dell'animazione e durations la durata di ogni
+    frame in passi (None: un passo per frame); un passo dura
+    sprite_cycle_speed tick dell'attore che la riproduce. Con loop
+    l'animazione ricomincia dal primo frame, altrimenti resta sull'ultimo.
+
+    L'attore conserva solo la propria testina (sprite_cycle_counter) e
+    chiede a frame lo sprite del passo corrente.
+    """
+    frames: tuple[Sprite, ...]
+    durations: tuple[int, ...] | None = None
+    loop: bool = True
+    steps: int = field(init=False, repr=False, compare=False)  # -> durata totale, in passi
+    _ends: tuple[int, ...] | None = field(init=False, repr=False, compare=False)  # -> passo in cui finisce ogni frame; None se durano tutti un passo
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.frames, tuple) or not self.frames or not all(isinstance(s, Sprite) for s in self.frames):
+            raise TypeError("frames must be a non-empty tuple of Sprite")
+        if self.durations is not None:
+            if not isinstance(self.durations, tuple) or not all(isinstance(d, int) and not isinstance(d, bool) for d in self.durations):
+                raise TypeError("durations must be a tuple of int")
+            if len(self.durations) != len(self.frames) or any(d <= 0 for d in self.durations):
+                raise ValueError("durations must have one positive int per frame")
+        if not isinstance(self.loop, bool):
+            raise TypeError("loop must be a bool")
+
+        ends = None
+        if self.durations is not None and any(d != 1 for d in self.durations):
+            ends = tuple(itertools.accumulate(self.durations))
+        object.__setattr__(self, "_ends", ends)
+        object.__setattr__(self, "steps", ends[-1] if ends is not None else len(self.frames))
+
+
+    # ======== CLASS-METHODS ========
+    @classmethod
+    def init_from_dict(cls, data: dict) -> "Clip":
+        """Clip da un dizionario {"frames": [sprite, ...], "durations": [...], "loop": bool},
+        con gli sprite nel formato di Sprite.init_from_dict.
+        """
+        durations = data.get("durations")
+        return cls(
+            frames=tuple(Sprite.init_from_dict(s) for s in data["frames"]),
+            durations=tuple(int(d) for d in durations) if durations is not None else None,
+            loop=bool(data.get("loop", True)),
+        )
+
+
+    # ======== METHODS ========
+    def frame(self, step: int) -> Sprite:
+        """Sprite al passo step (sprite_cycle_counter // sprite_cycle_speed)."""
+        if self.loop:
+            step %= self.steps
+        elif step >= self.steps:
+            step = self.steps - 1
+        if self._ends is None:
+            return self.frames[step]
+        return self.frames[bisect.bisect_right(self._ends, step)]
+
+    def finished(self, step: int) -> bool:
+        """True se al passo step l'animazione è arrivata al suo ultimo passo."""
+        return step >= self.steps - 1
+
+    @property
+    def first(self) -> Sprite:
+        return self.frames[0]
+
+
+class Clips(Mapping):
+    """Tabella immutabile (Action, Direction) -> Clip di una classe di attori.
+
+    Viene compilata una sola volta, all'import del modulo dell'entità, ed
+    è condivisa da tutte le istanze (attributo di classe clips).
+    """
+    __slots__ = ("__table",)
+
+    def __init__(self, table: dict[tuple[Action, Direction], Clip]) -> None:
+        if not isinstance(table, dict):
+            raise TypeError("table must be a dict")
+        for key, clip in table.items():
+            if not (isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], Action) and isinstance(key[1], Direction)):
+                raise TypeError("keys must be (Action, Direction)")
+            if not isinstance(clip, Clip):
+                raise TypeError("values must be Clip")
+        self.__table = dict(table)
+
+    # ======== MAGIC METHODS ========
+    def __getitem__(self, key: tuple[Action, Direction]) -> Clip:
+        return self.__table[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__table
+
+    def __iter__(self) -> Iterator[tuple[Action, Direction]]:
+        return iter(self.__table)
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__table!r})"
+
+    # ======== METHODS ========
+    def get(self, key: tuple[Action, Direction], default: Clip | None = None) -> Clip | None:
+        return self.__table.get(key, default)
+
+    def sprites(self) -> set[Sprite]:
+        """Tutti gli sprite usati dalle animazioni della tabella."""
+        return {s for clip in self.__table.values() for s in clip.frames}
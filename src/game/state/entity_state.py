@@ -1,18 +1,25 @@
+from .fields import Checked, instance_of
 from .states import Action, Direction
 
 
 
 
-class EntityState:
+class EntityState(Checked):
     """Rappresenta lo stato logico di una entita, composto da azione e direzione.
 
     Incapsula una coppia (Action, Direction) e fornisce confronti, hash e
-    controlli di tipo per garantire stati consistenti.
+    controlli di tipo per garantire stati consistenti. action e direction
+    sono campi caldi (vedi Checked): validati alla costruzione e, in
+    modalità debug, a ogni assegnamento.
     """
+    __slots__ = ("action", "direction")
+    _checks = {
+        "action": instance_of(Action, "action"),
+        "direction": instance_of(Direction, "direction"),
+    }
 
     def __init__(self, action: Action, direction: Direction) -> None:
-        self.action = action
-        self.direction = direction
+        self._init_fields(action=action, direction=direction)
     
     # ======== MAGIC METHODS ========
     def __str__(self) -> str:
@@ -28,23 +35,3 @@ class EntityState:
 
     def __hash__(self) -> int:
         return hash((self.action, self.direction))
-    
-    # ======== PROPERTIES ========
-    @property
-    def action(self) -> Action:
-        return self.__action
-    @action.setter
-    def action(self, value: Action):
-        if not isinstance(value, Action):
-            raise TypeError("action must be an instance of Action Enum")
-        self.__action: Action = value
-    
-    @property
-    def direction(self) -> Direction:
-        return self.__direction
-    @direction.setter
-    def direction(self, value: Direction):
-        if not isinstance(value, Direction):
-            raise TypeError("direction must be an instance of Direction Enum")
-        self.__direction: Direction = value
-
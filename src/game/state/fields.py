@@ -0,0 +1,96 @@
+import os
+from collections.abc import Callable
+from typing import Any
+
+
+Check = Callable[[Any], Any]  # -> valida e converte il valore di un campo, oppure solleva TypeError
+
+
+# ======== CONTROLLI ========
+def number(name: str) -> Check:
+    """Campo float: accetta int o float e lo converte in float.
+
+    La conversione avviene solo quando il controllo viene eseguito: alla
+    costruzione e, in modalità debug, a ogni assegnamento.
+    """
+    def check(value: Any) -> float:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"{name} must be an int or float")
+        return float(value)
+    return check
+
+def integer(name: str) -> Check:
+    """Campo int: accetta solo int."""
+    def check(value: Any) -> int:
+        if not isinstance(value, int):
+            raise TypeError(f"{name} must be an int")
+        return value
+    return check
+
+def instance_of(t: type, name: str) -> Check:
+    """Campo di tipo t (ad es. un Enum)."""
+    def check(value: Any) -> Any:
+        if not isinstance(value, t):
+            raise TypeError(f"{name} must be an instance of {t.__name__}")
+        return value
+    return check
+
+
+# ======== BASE ========
+class Checked:
+    """Base delle classi con campi "caldi", scritti più volte per tick.
+
+    I campi caldi sono attributi in __slots__, letti e scritti direttamente
+    senza property. Ogni sottoclasse dichiara in _checks i controlli dei
+    propri campi (nome -> Check); quelli delle classi base sono ereditati.
+
+    Il controllo dei tipi avviene alla costruzione (_init_fields) e, solo in
+    modalità debug (set_debug), a ogni assegnamento. Con la modalità debug
+    spenta un assegnamento costa quanto quello di un attributo semplice, ma
+    il valore non viene convertito: a differenza delle property sostituite
+    (float(value)), un campo number a cui si assegna un int contiene un int
+    finché non gli viene assegnato un float. Nei calcoli è indifferente;
+    chi ha bisogno di un float (ad es. per serializzare) deve convertirlo.
+    """
+    __slots__ = ()
+    _checks: dict[str, Check] = {}
+    _all_checks: dict[str, Check] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        checks: dict[str, Check] = {}
+        for c in reversed(cls.__mro__):
+            checks.update(c.__dict__.get("_checks", {}))
+        cls._all_checks = checks
+
+    def _init_fields(self, **values: Any) -> None:
+        """Valida, converte e assegna i campi caldi; usato dai costruttori."""
+        checks = type(self)._all_checks
+        for name, value in values.items():
+            object.__setattr__(self, name, checks[name](value))
+
+
+def _checked_setattr(self: Checked, name: str, value: Any) -> None:
+    check = type(self)._all_checks.get(name)
+    object.__setattr__(self, name, value if check is None else check(value))
+
+
+# ======== MODALITÀ DEBUG ========
+def set_debug(enabled: bool) -> bool:
+    """Attiva o disattiva il controllo dei tipi a ogni assegnamento dei campi caldi.
+
+    Returns:
+        bool: lo stato precedente, per ripristinarlo.
+    """
+    previous = debug_enabled()
+    if enabled:
+        Checked.__setattr__ = _checked_setattr  # type: ignore[method-assign]
+    elif previous:
+        del Checked.__setattr__
+    return previous
+
+def debug_enabled() -> bool:
+    return "__setattr__" in Checked.__dict__
+
+
+set_debug(os.environ.get("GNG_DEBUG", "0") not in ("", "0"))  # -> GNG_DEBUG=1: modalità debug dall'avvio
@@ -2,19 +2,21 @@ import pathlib
 from urllib.parse import urlparse
 from typing import Iterator
 
-class Sprite:
+from .fields import Checked, integer
+
+class Sprite(Checked):
     """Rappresenta un riquadro di immagine all interno di una texture.
 
     Memorizza percorso dell immagine, coordinate di origine, dimensioni
     e stato di blinking, fornendo anche proprieta derivate come pos e size.
+    x, y, width e height sono campi caldi (vedi Checked).
     """
+    __slots__ = ("x", "y", "width", "height", "blinking", "__path")
+    _checks = {name: integer(name) for name in ("x", "y", "width", "height")}
 
     def __init__(self, path: str | pathlib.Path, x: int, y: int, width: int, height: int, blinking: bool = False) -> None:
         self.path = path
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        self._init_fields(x=x, y=y, width=width, height=height)
         self.blinking = blinking
 
 
@@ -86,42 +88,6 @@ class Sprite:
             return
         raise TypeError("path must be a str or pathlib.Path")
 
-    @property
-    def x(self) -> int:
-        return self.__x
-    @x.setter
-    def x(self, new: int) -> None:
-        if not isinstance(new, int):
-            raise TypeError("x must be an integer")
-        self.__x: int = new
-
-    @property
-    def y(self) -> int:
-        return self.__y
-    @y.setter
-    def y(self, new: int) -> None:
-        if not isinstance(new, int):
-            raise TypeError("y must be an integer")
-        self.__y: int = new
-
-    @property
-    def width(self) -> int:
-        return self.__width
-    @width.setter
-    def width(self, new: int) -> None:
-        if not isinstance(new, int):
-            raise TypeError("width must be an integer")
-        self.__width: int = new
-
-    @property
-    def height(self) -> int:
-        return self.__height
-    @height.setter
-    def height(self, new: int) -> None:
-        if not isinstance(new, int):
-            raise TypeError("height must be an integer")
-        self.__height: int = new
-
 
     # ======== DERIVATIVES ========
     @property
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from src.g2d_lib import g2d
+
+
+@unittest.skipUnless(hasattr(g2d, "pg"), "backend pygame non attivo")
+class G2DFixedLoopTest(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        g2d.init_canvas((40, 30))
+        self.now = 0.0
+
+    def run_loop(self, render_cost: float, max_frame_skip: int, stop_after: int) -> tuple[list[int], dict]:
+        """Esegue fixed_loop a 30 ups con un orologio simulato e un render che costa render_cost secondi."""
+        updates, batches = [0], []
+
+        def update():
+            updates[0] += 1
+            if updates[0] == stop_after:
+                g2d.pg.event.post(g2d.pg.event.Event(g2d.pg.QUIT))
+
+        def render():
+            batches.append(updates[0] - sum(batches))
+            self.now += render_cost
+
+        def sleep(fps):
+            self.now += 1 / 120
+
+        clock = Mock(tick=sleep)
+        with patch.object(g2d.time, "perf_counter", side_effect=lambda: self.now), \
+                patch.object(g2d.pg.time, "Clock", return_value=clock), \
+                self.assertRaises(SystemExit):
+            g2d.fixed_loop(update, render, ups=30, max_frame_skip=max_frame_skip)
+        return batches, g2d.loop_rates()
+
+    def test_slow_render_is_skipped_not_the_updates(self):
+        """Con un render lento si eseguono più update per frame: la simulazione resta a 30 ups."""
+        batches, rates = self.run_loop(render_cost=0.1, max_frame_skip=5, stop_after=90)
+
+        self.assertGreaterEqual(max(batches[1:]), 3)  # -> 0.1s di render = 3 passi da 1/30s
+        self.assertLess(rates["renders"], rates["updates"])
+        self.assertEqual(rates["skipped"], rates["updates"] - rates["renders"])
+        self.assertEqual(rates["dropped"], 0)
+
+    def test_frame_skip_is_capped(self):
+        """Al massimo max_frame_skip update per frame: oltre, il ritardo accumulato viene scartato invece di inseguirlo."""
+        batches, rates = self.run_loop(render_cost=1.0, max_frame_skip=2, stop_after=30)
+
+        self.assertEqual(max(batches), 2)
+        self.assertGreater(rates["dropped"], 0)
+
+
+@unittest.skipUnless(hasattr(g2d, "pg"), "backend pygame non attivo")
+class G2DTextCacheTest(unittest.TestCase):
+    def setUp(self):
+        g2d.pg.font.init()
+        self.canvas = g2d._canvas
+        g2d._canvas = g2d.pg.Surface((200, 100))
+        g2d.clear_text_cache()
+        g2d.set_text_cache_size(256)
+        g2d.set_color((255, 255, 255))
+
+    def tearDown(self):
+        g2d._canvas = self.canvas
+        g2d.clear_text_cache()
+        g2d.set_text_cache_size(256)
+
+    def test_repeated_text_hits_cache(self):
+        """Lo stesso testo con stessa size e colore non viene né cercato né renderizzato di nuovo."""
+        with patch.object(g2d.pg.font, "SysFont", wraps=g2d.pg.font.SysFont) as mock_font:
+            for _ in range(5):
+                g2d.draw_text("100/100", (50, 50), 10)
+
+        info = g2d.text_cache_info()
+        self.assertEqual(mock_font.call_count, 1)
+        self.assertEqual((info["hits"], info["misses"]), (4, 1))
+        self.assertAlmostEqual(info["hit_rate"], 0.8)
+
+    def test_color_and_size_are_part_of_the_key(self):
+        """Colore o size diversi producono superfici diverse; il font è condiviso per size."""
+        g2d.draw_text("abc", (50, 50), 10)
+        g2d.set_color((255, 0, 0))
+        g2d.draw_text("abc", (50, 50), 10)
+        g2d.draw_text("abc", (50, 50), 12)
+
+        info = g2d.text_cache_info()
+        self.assertEqual((info["misses"], info["size"], info["fonts"]), (3, 3, 2))
+
+    def test_least_recently_used_text_is_evicted(self):
+        """Superata la capacità, viene scartato il testo usato meno di recente."""
+        g2d.set_text_cache_size(2)
+        g2d.draw_text("a", (0, 0), 10)
+        g2d.draw_text("b", (0, 0), 10)
+        g2d.draw_text("a", (0, 0), 10)  # -> "a" diventa il più recente
+        g2d.draw_text("c", (0, 0), 10)  # -> scarta "b"
+        g2d.draw_text("a", (0, 0), 10)
+        g2d.draw_text("b", (0, 0), 10)
+
+        info = g2d.text_cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (2, 4, 2))
+
+
+    def test_draw_cached_repaints_only_on_version_change(self):
+        """draw_cached rasterizza solo quando cambia la versione e ridisegna la superficie in cache."""
+        g2d.clear_layer_cache()
+        paint = []
+
+        def painter():
+            paint.append(1)
+            g2d.draw_rect((0, 0), (4, 4))
+
+        for version in (1, 1, 1, 2, 2):
+            g2d.draw_cached("hp", version, (10, 10), (8, 8), painter)
+
+        info = g2d.layer_cache_info()
+        self.assertEqual(len(paint), 2)
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (3, 2, 1))
+        self.assertEqual(tuple(g2d._canvas.get_at((12, 12)))[:3], (255, 255, 255))  # -> disegnato in coordinate locali
+        g2d.clear_layer_cache()
+
+
+    def test_evicted_layers_stay_drawable_until_the_frame_is_presented(self):
+        """Un layer scartato dalla cache resta disegnabile fino alla fine del frame: il suo handle non viene riusato prima."""
+        g2d.clear_layer_cache()
+        g2d._release_handles()
+        self.addCleanup(g2d._release_handles)
+        self.addCleanup(g2d.clear_layer_cache)
+
+        def painter(color):
+            return lambda: (g2d.set_color(color), g2d.draw_rect((0, 0), (4, 4)))
+
+        with patch.object(g2d, "_layers_max", 1):
+            red = g2d.load_cached("a", 1, (4, 4), painter((255, 0, 0)))
+            green = g2d.load_cached("b", 1, (4, 4), painter((0, 255, 0)))  # -> scarta "a"
+            blue = g2d.load_cached("c", 1, (4, 4), painter((0, 0, 255)))  # -> scarta "b"
+            self.assertEqual(len({red, green, blue}), 3)  # -> "a" non ancora riusato
+
+            g2d._canvas.fill((0, 0, 0))
+            g2d.draw_sprites([(red, (0, 0)), (green, (10, 0))])  # -> come un flush dopo le evizioni
+            self.assertEqual(tuple(g2d._canvas.get_at((1, 1)))[:3], (255, 0, 0))
+            self.assertEqual(tuple(g2d._canvas.get_at((11, 1)))[:3], (0, 255, 0))
+
+            g2d._release_handles()  # -> come alla presentazione del frame
+            self.assertIsNone(g2d._textures[red])
+            self.assertIn(g2d.load_cached("d", 1, (4, 4), painter((0, 0, 0))), (red, green))
+
+    def test_load_variant_recolors_in_memory_once(self):
+        """load_variant genera la variante dalla superficie caricata, una volta per (texture, effetto)."""
+        image = g2d.pg.Surface((2, 1), g2d.pg.SRCALPHA)
+        image.set_at((0, 0), (40, 80, 100, 255))
+        image.set_at((1, 0), (10, 10, 10, 0))
+        g2d._loaded["test-sheet"] = image
+        try:
+            bright = g2d.load_variant("test-sheet", "bright", 3)
+            self.assertIs(g2d._loaded[g2d.load_variant("test-sheet", "bright", 3)], g2d._loaded[bright])
+
+            self.assertEqual(tuple(g2d._loaded[bright].get_at((0, 0))), (120, 240, 255, 255))
+            self.assertEqual(g2d._loaded[bright].get_at((1, 0))[3], 0)  # -> l'alpha non cambia
+            flash = g2d._loaded[g2d.load_variant("test-sheet", "flash")]
+            self.assertEqual(tuple(flash.get_at((0, 0))), (255, 255, 255, 255))
+            tint = g2d._loaded[g2d.load_variant("test-sheet", "tint", (255, 0, 128))]
+            self.assertEqual(tuple(tint.get_at((0, 0)))[:2], (40, 0))
+            self.assertEqual(tuple(image.get_at((0, 0))), (40, 80, 100, 255))  # -> l'originale resta intatto
+            with self.assertRaises(ValueError):
+                g2d.load_variant("test-sheet", "sepia")
+        finally:
+            for name in [n for n in g2d._loaded if str(n).startswith("test-sheet")]:
+                del g2d._loaded[name]
+
+    def test_sprite_handles_blit_pre_sliced_areas(self):
+        """load_image e load_sprite restituiscono handle interi stabili; draw_sprite disegna solo l'area registrata."""
+        image = g2d.pg.Surface((4, 2), g2d.pg.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        image.fill((0, 0, 255, 255), (2, 0, 2, 2))
+        g2d._loaded["test-handles"] = image
+        try:
+            texture = g2d.load_image("test-handles")
+            sprite = g2d.load_sprite("test-handles", (2, 0), (2, 2))
+            self.assertIsInstance(texture, int)
+            self.assertEqual((g2d.load_image("test-handles"), g2d.load_sprite("test-handles", (2.2, 0), (2, 2))), (texture, sprite))
+            self.assertEqual(g2d._textures[sprite].get_size(), (2, 2))
+
+            g2d._canvas.fill((0, 0, 0))
+            with patch.object(g2d, "_tup", wraps=g2d._tup) as mock_tup:
+                g2d.draw_sprite(sprite, (10.4, 10.6))
+            mock_tup.assert_not_called()  # -> nessun arrotondamento del rettangolo a ogni disegno
+            self.assertEqual(tuple(g2d._canvas.get_at((10, 11)))[:3], (0, 0, 255))
+            self.assertEqual(tuple(g2d._canvas.get_at((12, 11)))[:3], (0, 0, 0))
+
+            g2d.draw_image(texture, (20, 20))
+            self.assertEqual(tuple(g2d._canvas.get_at((20, 20)))[:3], (255, 0, 0))
+        finally:
+            del g2d._loaded["test-handles"]
+            for key in [k for k in g2d._handles if k == "test-handles" or (isinstance(k, tuple) and k[0] == "test-handles")]:
+                del g2d._handles[key]
+
+    def test_batched_draws_match_single_draws(self):
+        """draw_sprites, fill_rects e draw_texts producono gli stessi pixel delle chiamate singole, anche con colori trasparenti."""
+        image = g2d.pg.Surface((4, 4), g2d.pg.SRCALPHA)
+        image.fill((0, 200, 0, 255))
+        g2d._loaded["test-batch"] = image
+        rects = [((1.4, 2), (10, 5)), ((30, 40), (-8, -6))]  # -> anche un rettangolo con dimensioni negative
+        sprite = g2d.load_sprite("test-batch", (1, 1), (2, 2))
+
+        def single():
+            for color in ((200, 10, 10), (10, 10, 200, 128)):
+                g2d.set_color(color)
+                for pos, size in rects:
+                    g2d.draw_rect(pos, size)
+            g2d.set_color((255, 255, 0))
+            g2d.draw_text("ok", (60, 50), 12)
+            g2d.draw_sprite(sprite, (80.6, 10.2))
+
+        def batched():
+            g2d.fill_rects((200, 10, 10), rects)
+            g2d.fill_rects((10, 10, 200, 128), rects)
+            g2d.draw_texts([("ok", (60, 50), 12, (255, 255, 0))])
+            g2d.draw_sprites([(sprite, (80.6, 10.2))])
+
+        try:
+            with patch.object(g2d, "_draw", g2d.pg.Surface((200, 100), g2d.pg.SRCALPHA), create=True):
+                pixels = []
+                for draw in (single, batched):
+                    g2d._canvas.fill((0, 0, 0))
+                    draw()
+                    pixels.append(g2d.pg.image.tobytes(g2d._canvas, "RGB"))
+            self.assertEqual(pixels[0], pixels[1])
+        finally:
+            del g2d._loaded["test-batch"]
+            for key in [k for k in g2d._handles if k == "test-batch" or (isinstance(k, tuple) and k[0] == "test-batch")]:
+                del g2d._handles[key]
+
+
+if __name__ == "__main__":
+    unittest.main()
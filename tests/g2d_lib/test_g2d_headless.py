@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import unittest
+from unittest.mock import Mock
+
+from src.g2d_lib import g2d_headless
+
+
+class G2DHeadlessTest(unittest.TestCase):
+    def setUp(self):
+        g2d_headless.set_input_script(None)
+        g2d_headless.init_canvas((430, 230))
+
+    def test_main_loop_runs_fixed_number_of_ticks(self):
+        """main_loop con ticks=N chiama tick esattamente N volte."""
+        tick = Mock()
+        n = g2d_headless.main_loop(tick, fps=30, ticks=250)
+
+        self.assertEqual(n, 250)
+        self.assertEqual(tick.call_count, 250)
+        self.assertEqual(g2d_headless.tick_count(), 250)
+
+    def test_close_canvas_stops_loop(self):
+        """close_canvas interrompe il loop senza uscire dal processo."""
+        calls = []
+
+        def tick():
+            calls.append(1)
+            if len(calls) == 3:
+                g2d_headless.close_canvas()
+
+        self.assertEqual(g2d_headless.main_loop(tick), 3)
+
+    def test_sequence_script_feeds_keys(self):
+        """Uno script a sequenza fornisce i tasti tick per tick."""
+        seen = []
+        g2d_headless.set_input_script([["ArrowRight"], ["ArrowRight", "1"], []])
+        g2d_headless.main_loop(lambda: seen.append(sorted(g2d_headless.current_keys())), ticks=4)
+
+        self.assertEqual(seen, [["ArrowRight"], ["1", "ArrowRight"], [], []])
+
+    def test_callable_script_and_key_edges(self):
+        """Uno script callable riceve l'indice del tick; key_pressed/key_released seguono i fronti."""
+        pressed, released = [], []
+        g2d_headless.set_input_script(lambda t: ["1"] if t == 1 else [])
+
+        def tick():
+            pressed.append(g2d_headless.key_pressed("1"))
+            released.append(g2d_headless.key_released("1"))
+
+        g2d_headless.main_loop(tick, ticks=3)
+
+        self.assertEqual(pressed, [False, True, False])
+        self.assertEqual(released, [False, False, True])
+
+    def test_draw_functions_are_noops(self):
+        """Le funzioni di disegno non richiedono un display."""
+        g2d_headless.set_color((10, 20, 30))
+        g2d_headless.draw_rect((0, 0), (10, 10))
+        g2d_headless.draw_text("x", (5, 5), 10)
+        handle = g2d_headless.load_image("sheet.png")
+        self.assertEqual(g2d_headless.load_image("sheet.png"), handle)
+        g2d_headless.draw_image("sheet.png", (0, 0), (1, 1), (2, 2))
+        g2d_headless.draw_image(handle, (0, 0))
+        g2d_headless.draw_sprite(g2d_headless.load_sprite("sheet.png", (1, 1), (2, 2)), (0, 0))
+        self.assertEqual(g2d_headless.canvas_size(), (430, 230))
+
+
+    def test_fixed_loop_runs_update_then_render(self):
+        """fixed_loop alterna update e render e ne riporta numero e tempi."""
+        calls = []
+        n = g2d_headless.fixed_loop(lambda: calls.append("u"), lambda: calls.append("r"), ticks=3)
+        rates = g2d_headless.loop_rates()
+
+        self.assertEqual(n, 3)
+        self.assertEqual(calls, ["u", "r"] * 3)
+        self.assertEqual((rates["updates"], rates["renders"], rates["skipped"]), (3, 3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
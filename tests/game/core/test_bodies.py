@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import unittest
+from unittest.mock import patch
+
+import src.game.core.bodies as bodies_module
+from src.game.core.bodies import Bodies, Body
+from src.game.entities import Zombie, Torch, EyeBall, Platform
+from src.game.state import Action, Direction
+
+
+def make_actors():
+    zombies = [Zombie(name=f"z{i}", x=10.0 * i, y=0.0, direction=d) for i, d in enumerate((Direction.LEFT, Direction.RIGHT, Direction.RIGHT))]
+    zombies[1].distance_to_walk = 3.0
+    zombies[2].attack_cooldown = 2
+    torches = [Torch(x=0.0, y=50.0, direction=d) for d in (Direction.LEFT, Direction.RIGHT)]
+    eye_balls = [EyeBall(x=0.0, y=0.0, direction=Direction.LEFT, speed=2.0, max_travel_distance=7.0)]
+    return zombies + torches + eye_balls
+
+def snapshot(actors):
+    fields = ("x", "y", "x_step", "y_step", "walked_distance", "attack_cooldown", "travelled_distance")
+    return [(a.state.action, a.state.direction, *(getattr(a, f, None) for f in fields)) for a in actors]
+
+
+class BodiesTest(unittest.TestCase):
+    def backends(self):
+        return (False, True) if bodies_module.numpy is not None else (False,)
+
+    def test_step_matches_move(self):
+        """I sistemi in blocco producono gli stessi campi e le stesse transizioni di move, tick per tick."""
+        for vectorized in self.backends():
+            with self.subTest(vectorized=vectorized):
+                classic, batched = make_actors(), make_actors()
+                bodies = Bodies((Zombie, Torch, EyeBall), vectorized=vectorized)
+                for tick in range(60):
+                    for a in classic:
+                        a.move(None)  # type: ignore
+                    bodies.step(tuple(batched))
+                    for a in classic + batched:
+                        if isinstance(a, Zombie) and tick % 10 == 9:
+                            a.on_platform_collision(Direction.UP, 0.0, 0.0)  # -> atterra: y_step azzerato, grounded
+                        if hasattr(a, "animate"):
+                            a.animate()
+                    self.assertEqual(snapshot(batched), snapshot(classic))
+
+                self.assertNotEqual(batched[0].state.action, Action.EMERGING)  # -> transizioni di Zombie coperte
+                self.assertEqual(batched[-1].state.action, Action.DEAD)  # -> EyeBall oltre max_travel_distance
+
+    def test_movers_leave_out_managed_actors(self):
+        """movers restituisce solo gli attori non gestiti, ricalcolati quando cambia lo snapshot."""
+        platform = Platform(x=0, y=0, width=10, height=10)
+        torch = Torch(x=0.0, y=0.0)
+        bodies = Bodies((Torch,))
+        awake = (platform, torch)
+
+        self.assertEqual(bodies.movers(awake), (platform,))
+        self.assertIs(bodies.movers(awake), bodies.movers(awake))
+        self.assertEqual(bodies.managed(Torch), Torch)
+        self.assertIsNone(bodies.managed(Platform))
+
+    def test_advance_state_only_when_needed(self):
+        """advance_state è chiamato solo per le azioni di reacts o al raggiungimento del limite di travel."""
+        eye = EyeBall(x=0.0, y=0.0, speed=2.0, max_travel_distance=3.0)
+        bodies = Bodies((EyeBall,))
+        with patch.object(EyeBall, "advance_state") as mock_advance:
+            bodies.step((eye,))
+            mock_advance.assert_not_called()
+            bodies.step((eye,))
+            mock_advance.assert_called_once_with()
+
+    @unittest.skipIf(bodies_module.numpy is None, "numpy non installato")
+    def test_numpy_ops_match_list_ops(self):
+        """Le operazioni vettorizzate con numpy danno gli stessi risultati di quelle sulle liste."""
+        lists, arrays = bodies_module._ListOps, bodies_module._NumpyOps
+        a, b = [1.5, -2.0, 0.0, 4.0], [0.5, 3.0, -1.0, 4.0]
+        mask, other = [True, False, True, False], [True, True, False, False]
+        calls = [
+            ("add", (a, b)), ("add", (a, 2.0)), ("neg", (a,)), ("abs", (a,)), ("maximum", (a, 0.0)),
+            ("where", (mask, a, b)), ("where", ([True] * 4, a, b)), ("ge", (a, b)), ("positive", (a,)),
+            ("and_", (mask, other)), ("or_", (mask, other)),
+        ]
+        for name, args in calls:
+            with self.subTest(op=name, args=args):
+                expected = getattr(lists, name)(*args)
+                result = getattr(arrays, name)(*(arrays.array(x) if isinstance(x, list) else x for x in args))
+                self.assertEqual(arrays.tolist(result), expected)
+        self.assertEqual(arrays.nonzero(arrays.array(mask)), lists.nonzero(mask))
+
+    def test_type_errors(self):
+        """I tipi gestiti devono dichiarare un Body; vectorized richiede numpy."""
+        with self.assertRaises(TypeError):
+            Bodies((Platform,))
+        with self.assertRaises(TypeError):
+            Bodies((Torch,), vectorized="yes")  # type: ignore
+        with patch.object(bodies_module, "numpy", None):
+            self.assertFalse(Bodies((Torch,)).vectorized)
+            with self.assertRaises(ValueError):
+                Bodies((Torch,), vectorized=True)
+
+    def test_body_columns(self):
+        """columns associa a ogni componente presente l'attributo dell'attore."""
+        self.assertEqual(Body().columns(), {"x": "x", "y": "y"})
+        self.assertEqual(
+            Torch.body.columns(),
+            {"x": "x", "y": "y", "vx": "x_step", "vy": "y_step", "g": "gravity"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from src.game.core import Game
+from src.game.entities.actor import check_collision
 from src.game.state import Phase, Direction
 
 
@@ -60,7 +61,57 @@ class GameTest(unittest.TestCase):
         self.assertFalse(self.game.game_over)
         self.assertTrue(self.game.game_won)
 
-    # ======== METODI ========
+    def test_spawner_built_from_settings(self):
+        """Lo spawner usa spawn_chance e i limiti delle impostazioni; spawner deve essere uno Spawner."""
+        from src.game.entities import Zombie, Plant
+        settings = self.game._settings
+        spawner = self.game.spawner
+
+        self.assertEqual(spawner.rates, {Zombie: settings.zombie.spawn_chance, Plant: settings.plant.spawn_chance})
+        self.assertEqual(spawner.caps, {Zombie: settings.zombie.max_alive, Plant: settings.plant.max_alive})
+        self.assertEqual((spawner.max_alive, spawner.budget), (settings.max_enemies, settings.spawn_budget))
+        with self.assertRaises(TypeError):
+            self.game.spawner = None
+
+    def test_bodies_move_managed_actors_in_batch(self):
+        """bodies è None di default; se impostato, Torch non è mosso da Arena.tick ma da Bodies.step."""
+        from src.game.core.bodies import Bodies
+        from src.game.entities import Torch
+        self.assertIsNone(self.game.bodies)
+        with self.assertRaises(TypeError):
+            self.game.bodies = "bodies"
+
+        self.game.bodies = Bodies((Torch,), vectorized=False)
+        torch = Torch(x=100.0, y=50.0)
+        self.game.spawn(torch)
+        with patch.object(Game, "player", new=Mock(state=Mock(action=None), health=1, pos=Mock(return_value=(10, 10)), size=Mock(return_value=(5, 5)))), \
+                patch.object(Game, "inside_arena", return_value=True), \
+                patch.object(self.game.spawner, "tick"), \
+                patch.object(Torch, "move") as mock_move:
+            self.game.tick([])
+
+        mock_move.assert_not_called()
+        self.assertEqual(torch.y, 50.0 - 5 + torch.gravity)
+
+    def test_pools_built_from_settings_and_released_on_kill(self):
+        """I Pool di Torch, Flame ed EyeBall sono prewarmati al caricamento; kill rilascia l'attore solo alla rimozione effettiva."""
+        from src.game.entities import Torch, Flame, EyeBall
+        settings = self.game._settings
+        pools = self.game.pools
+
+        self.assertEqual(set(pools), {Torch, Flame, EyeBall})
+        self.assertEqual(pools[Flame].free(), settings.flame.pool_size)
+        with self.assertRaises(TypeError):
+            self.game.pools = {Torch: pools[Flame]}
+
+        torch = pools[Torch].acquire(x=100.0, y=50.0)
+        self.game.spawn(torch)
+        with self.game.deferred():
+            self.game.kill(torch)
+            self.assertEqual(pools[Torch].stats()["released"], 0)  # -> rimozione ancora in coda
+        self.assertEqual(pools[Torch].stats()["released"], 1)
+        self.assertIs(pools[Torch].acquire(x=0.0, y=0.0), torch)
+
     def test_inside_arena_true_and_false(self):
         """inside_arena deve riconoscere oggetti dentro/fuori i bordi."""
         obj_inside = Mock()
@@ -129,6 +180,44 @@ class GameTest(unittest.TestCase):
         handler.assert_any_call(a, b, self.game)
         handler.assert_any_call(b, a, self.game)
 
+    def test_collision_dispatch_resolves_along_mro_and_is_cached(self):
+        """Un gestore registrato per una classe base vale per le sottoclassi; il tipo esatto ha la precedenza."""
+
+        class A: pass
+        class B: pass
+        class SubB(B): pass
+
+        base, exact = Mock(), Mock()
+        self.game.add_collision_handler(A, B, base)
+
+        a, sub = A(), SubB()
+        self.game._handle_collisions([(sub, a)])
+        base.assert_called_once_with(a, sub, self.game)  # -> argomenti nell'ordine della registrazione
+        self.assertEqual(self.game._Game__dispatch[SubB, A], (base, True))  # -> flag, non lambda
+
+        self.game.add_collision_handler(A, SubB, exact)  # -> invalida la tabella compilata
+        self.game._handle_collisions([(a, sub)])
+        exact.assert_called_once_with(a, sub, self.game)
+        self.assertEqual(base.call_count, 1)
+
+    def test_eyeball_passes_through_ladder_and_gravestone(self):
+        """I gestori di Platform non valgono per scale e lapidi: un EyeBall le attraversa, come due EyeBall tra loro."""
+        from src.game.entities import EyeBall, Ladder, GraveStone, Zombie
+
+        eye, other = EyeBall(x=10.0, y=10.0), EyeBall(x=12.0, y=10.0)
+        ladder = Ladder(x=0, y=0, width=20, height=100)
+        stone = GraveStone(x=0, y=0, width=20, height=20)
+        for a in (eye, other, ladder, stone):
+            self.game.spawn(a)
+
+        with self.game.deferred():
+            self.game._handle_collisions([(eye, ladder), (stone, eye), (eye, other)])
+
+        self.assertIn(eye, self.game.actors())
+        self.assertIn(other, self.game.actors())
+        self.assertEqual(self.game._resolve_handler(Zombie, Ladder), (Game._handle_nothing, False))
+        self.assertEqual(self.game._resolve_handler(Zombie, GraveStone), (Game._handle_nothing, False))
+
     def test_add_collision_free_handler_symmetry(self):
         """add_collision_free_handler registra anche la coppia invertita."""
 
@@ -246,7 +335,7 @@ class GameTest(unittest.TestCase):
         handler.assert_called_once_with(a1, a2, self.game)
 
     def test_handle_collisions_calls_free_handler_when_no_collision(self):
-        """Se non ci sono collisioni, chiama il collision_free handler."""
+        """Se non ci sono collisioni, chiama il collision_free handler con i primi attori dei due tipi, senza scorrere tutti gli attori."""
         class A: pass
         class B: pass
 
@@ -258,18 +347,470 @@ class GameTest(unittest.TestCase):
         a2.pos = Mock(return_value=(10, 10))
         a2.size = Mock(return_value=(10, 10))
 
-        self.game.actors = Mock(return_value=[a1, a2])
+        for a in (a1, a2):
+            self.game.spawn(a)
         self.game._collision_handlers.clear()
         self.game._collision_free_handlers.clear()
 
         free_handler = Mock()
         self.game.add_collision_free_handler(A, B, free_handler)
 
-        with patch("src.game.entities.check_collision", return_value=False):
-            self.game._handle_collisions()
+        with patch.object(Game, "actors", side_effect=AssertionError("scansione di tutti gli attori")):
+            self.game._handle_collisions([])
 
         free_handler.assert_called_once_with(a1, a2, self.game)
 
 
+    def test_broadphase_matches_naive_collisions(self):
+        """La broadphase con spatial hash trova le stesse coppie del controllo O(n^2)."""
+        import random
+        rng = random.Random(3)
+
+        class Box:
+            def __init__(self, x, y, w, h):
+                self._p, self._s = (x, y), (w, h)
+            def pos(self): return self._p
+            def size(self): return self._s
+
+        boxes = [Box(rng.uniform(-20, 330), rng.uniform(-20, 250), rng.randint(1, 60), rng.randint(1, 60)) for _ in range(120)]
+        boxes.append(Box(-10, 0, 10, 240))  # -> parzialmente fuori dall'arena
+
+        naive = [(id(a), id(b)) for a, b in self.game._naive_collisions(boxes)]
+        hashed = [(id(a), id(b)) for a, b in self.game._detect_collisions(boxes)]
+
+        self.assertEqual(hashed, naive)
+        self.assertGreater(len(hashed), 0)
+
+    def test_tick_dispatches_handlers_from_arena_pairs(self):
+        """Game.tick usa le coppie della broadphase di Arena per gli handler."""
+        with patch.object(Game, "_handle_collisions") as mock_handle, \
+                patch.object(Game, "player", new=Mock(state=Mock(action=None), health=1, pos=Mock(return_value=(10, 10)), size=Mock(return_value=(5, 5)))), \
+                patch.object(Game, "inside_arena", return_value=True):
+            self.game.tick([])
+
+        mock_handle.assert_called_once_with(self.game.collision_pairs())
+
+    def test_tick_advances_animations_of_all_actors(self):
+        """Game.tick chiama animate su ogni attore, anche se non viene disegnato."""
+        actor = Mock(pos=Mock(return_value=(10, 10)), size=Mock(return_value=(5, 5)), static=True)
+        self.game.spawn(actor)
+
+        with patch.object(Game, "player", new=Mock(state=Mock(action=None), health=1, pos=Mock(return_value=(10, 10)), size=Mock(return_value=(5, 5)))), \
+                patch.object(Game, "inside_arena", return_value=True), \
+                patch.object(self.game.spawner, "tick"):  # -> nessuno spawn casuale con un giocatore finto
+            self.game.tick([])
+            self.game.tick([])
+
+        self.assertEqual(actor.animate.call_count, 2)
+        actor.sprite.assert_not_called()
+
+
+    def test_actors_in_returns_intersecting_actors_in_order(self):
+        """actors_in restituisce, nell'ordine di registrazione, solo gli attori che intersecano il rettangolo."""
+        from src.game.entities import Arena
+
+        class Box:
+            def __init__(self, x, y, w, h):
+                self.x, self.y, self.w, self.h = x, y, w, h
+            def pos(self): return self.x, self.y
+            def size(self): return self.w, self.h
+
+        arena = Arena((1000, 240))
+        a, b, c, d = Box(500, 10, 20, 20), Box(90, 100, 20, 20), Box(210, 50, 10, 10), Box(-30, 0, 20, 20)
+        for box in (a, b, c, d):
+            arena.spawn(box)
+
+        self.assertEqual(arena.actors_in((0, 0), (200, 240)), [b])
+        self.assertEqual(arena.actors_in((100, 0), (500, 240)), [a, b, c])
+        self.assertEqual(arena.actors_in((-50, -50), (30, 100)), [d])  # -> anche fuori dall'arena
+        arena.kill(b)
+        self.assertEqual(arena.actors_in((0, 0), (1000, 240)), [a, c])
+
+    def test_persistent_grid_tracks_moves_spawn_and_kill(self):
+        """La spatial hash persistente segue spostamenti, spawn e kill degli attori."""
+        from src.game.entities import Arena, Platform
+
+        class Box:
+            def __init__(self, x, y, w, h):
+                self.x, self.y, self.w, self.h = x, y, w, h
+            def pos(self): return self.x, self.y
+            def size(self): return self.w, self.h
+            def move(self, arena): self.x += 7
+
+        arena = Arena((320, 240))
+        ground = Platform(x=0, y=200, width=320, height=40)
+        wall = Platform(x=150, y=120, width=10, height=80)
+        box = Box(100, 170, 20, 30)
+        for a in (ground, wall, box):
+            arena.spawn(a)
+
+        self.assertIn(ground, arena._static)
+        self.assertNotIn(ground, arena._ranges)  # -> statici fuori dalla spatial hash
+
+        arena.tick()
+        statics = arena._statics
+        self.assertEqual(len(statics), 2)
+        arena.tick()
+        self.assertIs(arena._statics, statics)  # -> indice statico costruito una sola volta
+        self.assertEqual(arena.collision_pairs(), [(ground, box)])  # -> ground/wall (statici) non testati
+
+        for _ in range(4):
+            arena.tick()
+        self.assertIn((wall, box), arena.collision_pairs())
+
+        arena.kill(box)
+        self.assertNotIn(box, arena._ranges)
+        self.assertFalse(any(box in cell for cell in arena._cells.values()))
+
+    def test_spatial_queries_use_static_geometry(self):
+        """ground_below, query_region, nearest e line_of_sight rispondono sulla geometria del livello."""
+        from src.game.entities import Platform, GraveStone, Ladder, Zombie
+
+        ground = Platform(x=0, y=200, width=320, height=40)
+        ledge = Platform(x=100, y=120, width=60, height=10, contact_surfaces=[Direction.DOWN])
+        stone = GraveStone(x=200, y=180, width=20, height=20)
+        ladder = Ladder(x=40, y=100, width=20, height=100)
+        near = Zombie(name="Zombie", x=180, y=130, direction=Direction.LEFT)
+        far = Zombie(name="Zombie", x=20, y=130, direction=Direction.LEFT)
+        for a in (ground, ledge, stone, ladder, near, far):
+            self.game.spawn(a)
+
+        self.assertEqual(self.game.ground_below(110, 50), (200, ground))  # -> ledge non calpestabile dall'alto
+        self.assertEqual(self.game.ground_below(210, 50), (180, stone))
+        self.assertIsNone(self.game.ground_below(210, 50, max_distance=100))
+
+        self.assertEqual(self.game.query_region((150, 110), (60, 80)), [ledge, stone, near])
+        self.assertEqual(self.game.query_region((150, 110), (60, 80), Platform), [ledge, stone])
+
+        self.assertIs(self.game.nearest(Zombie, (200, 150)), near)
+        self.assertIsNone(self.game.nearest(Zombie, (200, 400), max_distance=50))
+
+        self.assertFalse(self.game.line_of_sight((80, 125), (180, 125)))  # -> attraversa ledge
+        self.assertTrue(self.game.line_of_sight((20, 150), (180, 150)))  # -> la Ladder non blocca
+        self.assertTrue(self.game.line_of_sight((0, 200), (320, 200)))  # -> sfiorare il bordo non blocca
+        self.assertFalse(self.game.line_of_sight((190, 170), (230, 190)))
+
+    def test_nearest_queries_spatial_hash_in_expanding_rings(self):
+        """nearest coincide con la ricerca esaustiva ma interroga actors_in, senza scorrere of_type."""
+        import random
+        from src.game.entities import Zombie, Platform
+
+        rng = random.Random(7)
+        zombies = [Zombie(name="Zombie", x=rng.uniform(-30, 300), y=rng.uniform(0, 200), direction=Direction.LEFT)
+                   for _ in range(25)]
+        for a in zombies + [Platform(x=0, y=200, width=320, height=40)]:
+            self.game.spawn(a)
+
+        def brute(pos, max_distance=None):
+            best, best_d = None, float("inf") if max_distance is None else max_distance
+            for z in zombies:
+                d = ((z.x + z.width / 2 - pos[0]) ** 2 + (z.y + z.height / 2 - pos[1]) ** 2) ** 0.5
+                if d < best_d or (best is None and d == best_d):
+                    best, best_d = z, d
+            return best
+
+        with patch.object(Game, "of_type", side_effect=AssertionError("scansione di of_type")), \
+             patch.object(Game, "actors_in", autospec=True, side_effect=Game.actors_in) as actors_in:
+            for _ in range(50):
+                pos = (rng.uniform(-50, 370), rng.uniform(-50, 290))
+                self.assertIs(self.game.nearest(Zombie, pos), brute(pos))
+                self.assertIs(self.game.nearest(Zombie, pos, max_distance=30), brute(pos, 30))
+        self.assertTrue(actors_in.called)
+
+    def test_walkable_spans_index_is_built_once_per_level(self):
+        """walkable_spans ritaglia le piattaforme calpestabili e ricalcola i segmenti solo se cambia la geometria."""
+        from src.game.entities import Platform, GraveStone, Ladder
+
+        ground = Platform(x=0, y=200, width=100, height=40)
+        far = Platform(x=250, y=200, width=70, height=40)
+        lava = Platform(x=100, y=220, width=150, height=20, damage=5)
+        ceiling = Platform(x=0, y=0, width=320, height=10, contact_surfaces=[Direction.DOWN])
+        for a in (ground, far, lava, ceiling, GraveStone(x=10, y=180, width=20, height=20), Ladder(x=40, y=100, width=20, height=100)):
+            self.game.spawn(a)
+
+        self.assertEqual(self.game.walkable_spans(0, 320), [(0, 100, 200), (250, 320, 200)])
+        self.assertEqual(self.game.walkable_spans(50, 260), [(50, 100, 200), (250, 260, 200)])  # -> ritagliati sulla fascia
+        self.assertEqual(self.game.walkable_spans(50, 260, min_width=10), [(50, 100, 200)])
+        self.assertEqual(self.game.walkable_spans(120, 200), [])
+
+        index = self.game._Game__walkable
+        with patch("src.game.core.game.sorted", create=True, side_effect=AssertionError("segmenti riordinati")):
+            self.game.walkable_spans(0, 320)
+        self.assertIs(self.game._Game__walkable, index)
+
+        ledge = Platform(x=150, y=120, width=40, height=10)
+        self.game.spawn(ledge)
+        self.assertEqual(self.game.walkable_spans(120, 200), [(150, 190, 120)])
+
+    def test_walkable_spans_matches_exhaustive_scan(self):
+        """Le due bisect di walkable_spans trovano gli stessi tratti di una scansione completa delle piattaforme."""
+        import random
+        from src.game.entities import Platform
+
+        rng = random.Random(3)
+        platforms = [Platform(x=rng.uniform(0, 300), y=rng.uniform(20, 220), width=rng.choice([10, 40, 150]), height=10)
+                     for _ in range(40)]
+        for p in platforms:
+            self.game.spawn(p)
+
+        for _ in range(50):
+            x0 = rng.uniform(-50, 320)
+            x1 = x0 + rng.uniform(0, 200)
+            expected = [
+                (max(p.x, x0), min(p.x + p.width, x1), p.y)
+                for p in sorted(platforms, key=lambda p: (p.x, p.x + p.width, p.y))  # -> ordine dei segmenti del livello
+                if min(p.x + p.width, x1) - max(p.x, x0) > 5
+            ]
+            self.assertEqual(self.game.walkable_spans(x0, x1, 5), expected)
+
+    def test_actors_outside_active_region_sleep_and_despawn_by_policy(self):
+        """Gli attori fuori dalla regione attiva dormono, si svegliano al rientro e sono rimossi secondo la politica."""
+        from src.game.core import Camera
+        from src.game.entities import Arthur, Flame, Platform
+
+        camera = Camera(view_x=0, view_y=0, width=100, height=100)
+        game = Game((2000, 240), camera=camera)
+        arthur = Arthur(name="Arthur", x=20, y=20)
+        ground = Platform(x=0, y=200, width=2000, height=40)
+        ledge = Platform(x=1500, y=120, width=40, height=10)
+        zombie = Mock(pos=Mock(return_value=(500, 50)), size=Mock(return_value=(20, 30)), static=False)
+        flame = Flame(x=700, ground_y=200)
+        for a in (arthur, ground, ledge, zombie, flame):
+            game.spawn(a)
+        game.despawn_policy = {Mock: 3, Flame: 0}
+
+        with patch.object(Game, "inside_arena", return_value=True):
+            game.tick([])
+            self.assertIsNotNone(game.sleeping_since(zombie))
+            self.assertNotIn(flame, game.actors())  # -> politica 0: rimossa appena si addormenta
+            self.assertIsNone(game.sleeping_since(ground))  # -> interseca la regione attiva
+            self.assertIsNone(game.sleeping_since(ledge))  # -> statica: fuori dall'attivazione
+            self.assertEqual(zombie.move.call_count, 0)
+            self.assertEqual(zombie.animate.call_count, 0)  # -> i dormienti non avanzano l'animazione
+
+            camera.view_x = 400  # -> il dormiente rientra nella regione e viene svegliato
+            game.tick([])
+            self.assertIsNone(game.sleeping_since(zombie))
+            self.assertEqual(zombie.move.call_count, 1)
+            self.assertEqual(zombie.animate.call_count, 1)
+
+            camera.view_x = 0
+            for _ in range(4):
+                game.tick([])
+        self.assertNotIn(zombie, game.actors())  # -> rimosso dopo 3 tick di sonno
+        self.assertIn(arthur, game.actors())
+        with self.assertRaises(TypeError):
+            game.despawn_policy = {Mock: 1.5}
+
+    def test_registry_keeps_order_and_typed_snapshots(self):
+        """Il registro mantiene l'ordine di spawn, indicizza per tipo e rinnova gli snapshot solo se cambiano."""
+        from src.game.entities import Arena, Platform, GraveStone, Ladder
+
+        arena = Arena((320, 240))
+        ground = Platform(x=0, y=200, width=320, height=40)
+        stone = GraveStone(x=50, y=180, width=20, height=20)
+        ladder = Ladder(x=100, y=100, width=20, height=100)
+        for a in (ground, stone, ladder, ground):  # -> lo spawn ripetuto è ignorato
+            arena.spawn(a)
+
+        self.assertEqual(arena.actors(), (ground, stone, ladder))
+        self.assertEqual(arena.of_type(Platform), (ground, stone, ladder))  # -> sottoclassi incluse
+        self.assertEqual(arena.of_type(Ladder), (ladder,))
+        self.assertEqual(arena.of_type(int), ())
+        self.assertIs(arena.of_type(Platform), arena.of_type(Platform))  # -> snapshot in cache
+
+        ladders = arena.of_type(Ladder)
+        for a in arena.actors():  # -> kill durante l'iterazione dello snapshot
+            arena.kill(a)
+            if a is stone:
+                break
+        self.assertEqual(arena.actors(), (ladder,))
+        self.assertIs(arena.of_type(Ladder), ladders)  # -> nessuna Ladder modificata
+        self.assertEqual(arena.of_type(GraveStone), ())
+
+    def test_sleeping_actors_are_not_moved_nor_hashed(self):
+        """Un attore dormiente non viene mosso, esce dalla spatial hash e si ritrova con sleepers_in."""
+        from src.game.entities import Arena
+
+        arena = Arena((320, 240))
+        a = Mock(pos=Mock(return_value=(10, 10)), size=Mock(return_value=(5, 5)), static=False)
+        b = Mock(pos=Mock(return_value=(12, 10)), size=Mock(return_value=(5, 5)), static=False)
+        for actor in (a, b):
+            arena.spawn(actor)
+
+        arena.tick()
+        arena.sleep(a)
+        self.assertEqual(arena.sleeping_since(a), 1)
+        self.assertEqual(arena.awake(), (b,))
+        self.assertNotIn(a, arena._ranges)
+        arena.tick()
+        self.assertEqual((a.move.call_count, b.move.call_count), (1, 2))
+        self.assertEqual(arena.collision_pairs(), [])
+        self.assertEqual(arena.sleepers_in(0, 0, 10, 10), [a])  # -> bordo incluso
+        self.assertEqual(arena.actors_in((0, 0), (20, 20)), [a, b])
+
+        arena.wake(a)
+        self.assertIsNone(arena.sleeping_since(a))
+        self.assertEqual(arena.awake(), (a, b))
+        arena.tick()
+        self.assertEqual(arena.collision_pairs(), [(a, b)])
+
+        arena.sleep(a)
+        arena.kill(a)
+        self.assertEqual(arena.sleepers_in(0, 0, 320, 240), [])
+
+    def test_deferred_spawn_and_kill_are_applied_in_order_at_flush(self):
+        """Durante deferred spawn e kill sono accodati, i kill ripetuti ignorati e applicati in ordine."""
+        from src.game.entities import Arena, Platform
+
+        arena = Arena((320, 240))
+        a, b, c = (Platform(x=10 * i, y=0, width=5, height=5) for i in range(3))
+        arena.spawn(a)
+
+        with arena.deferred():
+            arena.spawn(b)
+            arena.kill(a)
+            arena.kill(a)
+            arena.spawn(c)
+            self.assertEqual(arena.actors(), (a,))  # -> nessuna modifica prima del flush
+            self.assertEqual(len(arena._pending), 3)
+
+        self.assertEqual(arena.actors(), (b, c))
+        self.assertIsNone(arena._pending)
+
+    def test_actors_spawned_while_moving_are_not_moved_until_next_tick(self):
+        """Un attore spawnato da move entra nel registro dopo i movimenti, prima delle collisioni."""
+        from src.game.entities import Arena
+
+        class Box:
+            def __init__(self, x, y, child=None):
+                self.x, self.y, self.child, self.moves = x, y, child, 0
+            def pos(self): return self.x, self.y
+            def size(self): return 10, 10
+            def move(self, arena):
+                self.moves += 1
+                if self.child is not None:
+                    arena.spawn(self.child)
+                    self.child = None
+
+        child = Box(5, 5)
+        parent = Box(0, 0, child)
+        arena = Arena((320, 240))
+        arena.spawn(parent)
+
+        arena.tick()
+        self.assertEqual(arena.actors(), (parent, child))
+        self.assertEqual(child.moves, 0)
+        self.assertEqual(arena.collision_pairs(), [(parent, child)])
+
+        arena.tick()
+        self.assertEqual(child.moves, 1)
+
+    def test_collisions_during_move_are_those_of_the_previous_tick(self):
+        """collisions() durante move riporta le collisioni rilevate alla fine del tick precedente."""
+        from src.game.entities import Arena
+
+        class Box:
+            def __init__(self, x, y):
+                self.x, self.y, self.seen = x, y, []
+            def pos(self): return self.x, self.y
+            def size(self): return 10, 10
+            def move(self, arena):
+                self.seen.append(list(arena.collisions()))
+
+        a, b, c = Box(0, 0), Box(5, 5), Box(100, 100)
+        arena = Arena((320, 240))
+        arena.spawn(a)
+        arena.tick()
+        self.assertEqual(a.seen, [[]])  # -> nessuna rilevazione prima del primo tick
+
+        arena.spawn(b)  # -> spawnato tra due tick: non ancora rilevato
+        arena.tick()
+        self.assertEqual(a.seen[-1], [])
+        self.assertEqual(b.seen[-1], [])
+        self.assertEqual(arena.collision_pairs(), [(a, b)])  # -> rilevato dopo i movimenti
+
+        b.x, b.y = 100, 100  # -> spostato fuori da move: visto solo alla prossima rilevazione
+        arena.spawn(c)
+        arena.tick()
+        self.assertEqual(a.seen[-1], [b])
+        self.assertEqual(b.seen[-1], [a])
+        self.assertEqual(arena.collision_pairs(), [(b, c)])
+
+    def test_static_index_query_matches_brute_force(self):
+        """StaticIndex restituisce gli stessi attori di un controllo su tutti i pezzi, anche con pezzi molto lunghi."""
+        import random
+        from src.game.entities.actor import StaticIndex
+
+        rng = random.Random(5)
+
+        class Box:
+            def __init__(self, x, y, w, h):
+                self._p, self._s = (x, y), (w, h)
+            def pos(self): return self._p
+            def size(self): return self._s
+
+        boxes = [Box(rng.uniform(0, 3500), rng.uniform(0, 230), rng.randint(5, 200), rng.randint(5, 50)) for _ in range(60)]
+        boxes.append(Box(0, 192, 1664, 48))  # -> terreno lungo
+        index = StaticIndex(boxes)
+        probe = Box(0, 0, 0, 0)
+
+        for _ in range(200):
+            probe._p = (rng.uniform(-50, 3600), rng.uniform(-20, 250))
+            probe._s = (rng.randint(1, 40), rng.randint(1, 40))
+            (x, y), (w, h) = probe.pos(), probe.size()
+            expected = {b for b in boxes if check_collision(b, probe)}
+            self.assertEqual(set(index.query(x, y, x + w, y + h)), expected)
+
+    def test_collision_layers_skip_pairs_without_handlers(self):
+        """Con i layer di collisione vengono testate solo le coppie di tipi abilitate."""
+        from src.game.entities import Arena
+
+        class Box:
+            def __init__(self, x, y): self.x, self.y = x, y
+            def pos(self): return self.x, self.y
+            def size(self): return 10, 10
+            def move(self, arena): pass
+        class Hero(Box): pass
+        class Wall(Box): pass
+        class Ghost(Box): pass
+
+        arena = Arena((320, 240))
+        hero, wall, wall2, ghost = Hero(0, 0), Wall(5, 5), Wall(5, 0), Ghost(2, 2)
+        for a in (hero, wall, wall2, ghost):
+            arena.spawn(a)
+
+        arena.tick()
+        self.assertEqual(len(arena.collision_pairs()), 6)  # -> senza layer tutte le coppie
+
+        arena.allow_collision(Hero, Wall)
+        with patch("src.game.entities.actor.check_collision", wraps=check_collision) as mock_check:
+            arena.tick()
+        self.assertEqual(arena.collision_pairs(), [(hero, wall), (hero, wall2)])
+        self.assertEqual(mock_check.call_count, 2)  # -> Wall/Wall e Ghost scartati prima dei bounding box
+
+        class SubWall(Wall): pass
+        sub = SubWall(0, 5)
+        arena.spawn(sub)
+        arena.tick()
+        self.assertIn((hero, sub), arena.collision_pairs())  # -> i layer seguono la MRO
+
+    def test_player_and_door_handles(self):
+        """player e door restituiscono il primo Arthur/Door registrato, o None."""
+        from src.game.entities import Arthur, Door
+
+        self.assertIsNone(self.game.player)
+        self.assertIsNone(self.game.door)
+
+        arthur, door = Arthur(name="Arthur", x=10, y=10), Door(100, 100, 30, 40)
+        self.game.spawn(arthur)
+        self.game.spawn(door)
+        self.assertIs(self.game.player, arthur)
+        self.assertIs(self.game.door, door)
+
+        self.game.kill(door)
+        self.assertIsNone(self.game.door)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -135,7 +135,7 @@ class GraphicalInterfaceTest(unittest.TestCase):
         actor2.sprite.return_value = None
         actor2.gui = [DummyGUI()]
 
-        game.actors.return_value = [actor1, actor2]
+        game.actors_in.return_value = [actor1, actor2]
 
         # patcho clear_canvas E draw_image perché non sono rilevanti qui
         with patch("src.g2d_lib.g2d.clear_canvas"), \
@@ -145,9 +145,95 @@ class GraphicalInterfaceTest(unittest.TestCase):
         gui_comps = gi._GraphicalInterface__gui_actors_components  # type: ignore
         self.assertEqual(len(gui_comps), 3)
 
+    def test_render_sprites_blinking_alternates_with_in_memory_variant(self):
+        """Uno sprite lampeggiante alterna ogni 5 frame l'immagine normale e la variante schiarita."""
+        from src.game.state import Sprite
+
+        sprite = Sprite("sheet.png", 0, 0, 10, 10, blinking=True)
+        arthur = Mock(spec=["sprite", "pos"])
+        arthur.sprite.return_value = sprite
+        arthur.pos.return_value = (0, 0)
+        game = Mock()
+        game.background = None
+        game.actors_in.return_value = [arthur]
+
+        drawn = []
+        with patch("src.g2d_lib.g2d.clear_canvas"), \
+                patch("src.g2d_lib.g2d.load_variant", return_value="sheet.png#bright:3") as mock_variant, \
+                patch("src.g2d_lib.g2d.load_image", return_value=0), \
+                patch("src.g2d_lib.g2d.load_sprite", side_effect=lambda src, pos, size: str(src)) as mock_sprite, \
+                patch("src.g2d_lib.g2d.draw_sprites", side_effect=lambda batch: drawn.extend(h for h, _ in batch)):
+            for frame in range(10):
+                self.gui._GraphicalInterface__frame = frame  # type: ignore
+                game.actors_in.return_value = [arthur]
+                self.gui.render_sprites(game)
+
+        self.assertEqual(drawn, ["sheet.png"] * 5 + ["sheet.png#bright:3"] * 5)
+        mock_variant.assert_called_once_with(sprite.path, "bright", 3)
+        self.assertEqual(mock_sprite.call_count, 2)  # -> le due aree sono registrate una volta sola, poi si usano gli handle
+
+    def test_render_sprites_blinking_actor_uses_variant_without_touching_sprite(self):
+        """Un attore con blinking True lampeggia anche se il suo sprite (condiviso) non è lampeggiante."""
+        from src.game.state import Sprite
+
+        sprite = Sprite("sheet.png", 0, 0, 10, 10)
+        arthur = Mock(spec=["sprite", "pos", "blinking"])
+        arthur.sprite.return_value = sprite
+        arthur.pos.return_value = (0, 0)
+        arthur.blinking = True
+        game = Mock()
+        game.background = None
+
+        drawn = []
+        with patch("src.g2d_lib.g2d.clear_canvas"), \
+                patch("src.g2d_lib.g2d.load_variant", return_value="sheet.png#bright:3"), \
+                patch("src.g2d_lib.g2d.load_image", return_value=0), \
+                patch("src.g2d_lib.g2d.load_sprite", side_effect=lambda src, pos, size: str(src)), \
+                patch("src.g2d_lib.g2d.draw_sprites", side_effect=lambda batch: drawn.extend(h for h, _ in batch)):
+            for frame in (0, 5):
+                self.gui._GraphicalInterface__frame = frame  # type: ignore
+                game.actors_in.return_value = [arthur]
+                self.gui.render_sprites(game)
+
+        self.assertEqual(drawn, ["sheet.png", "sheet.png#bright:3"])
+        self.assertFalse(sprite.blinking)
+
+    def test_prewarm_builds_blink_variants(self):
+        """prewarm genera subito la variante di blinking di ogni texture."""
+        with patch("src.g2d_lib.g2d.load_variant") as mock_variant:
+            self.gui.prewarm(["a.png", "b.png"])
+
+        self.assertEqual([c.args for c in mock_variant.call_args_list], [("a.png", "bright", 3), ("b.png", "bright", 3)])
+
+    def test_render_sprites_culls_actors_outside_camera(self):
+        """Solo gli attori dentro la camera (più il margine) vengono disegnati e danno la loro GUI."""
+        from src.game.entities import Arena
+
+        class Box:
+            def __init__(self, x):
+                self.x = x
+                self.sprite = Mock(return_value=None)
+                self.gui = [DummyGUI()]
+            def pos(self): return self.x, 100
+            def size(self): return 20, 20
+
+        arena = Arena((3000, 240))
+        arena.background = None
+        visible, near, far = Box(100), Box(330), Box(2000)  # -> near: fuori dalla camera ma dentro il margine
+        for box in (far, visible, near):
+            arena.spawn(box)
+
+        with patch("src.g2d_lib.g2d.clear_canvas"):
+            self.gui.render_sprites(arena)
+
+        far.sprite.assert_not_called()
+        visible.sprite.assert_called_once()
+        near.sprite.assert_called_once()
+        self.assertEqual(len(self.gui._GraphicalInterface__gui_actors_components), 2)  # type: ignore
+
     # ======== RENDER GUIS ========
     def test_render_guis_draws_rect(self):
-        """Un GUIComponent che ritorna un 'rect' deve chiamare draw_rect."""
+        """Un GUIComponent che ritorna un 'rect' viene disegnato con g2d.fill_rects, senza cambiare il colore globale."""
         info = [{
             "type": "rect",
             "color": (255, 0, 0),
@@ -160,16 +246,33 @@ class GraphicalInterfaceTest(unittest.TestCase):
 
         with patch("src.g2d_lib.g2d.clear_canvas"), \
                 patch("src.g2d_lib.g2d.set_color") as mock_color, \
-                patch("src.g2d_lib.g2d.draw_rect") as mock_rect, \
-                patch("src.g2d_lib.g2d.draw_text") as mock_text:
+                patch("src.g2d_lib.g2d.fill_rects") as mock_rects, \
+                patch("src.g2d_lib.g2d.draw_texts") as mock_texts:
+            self.gui.render_guis()
+
+        mock_color.assert_not_called()
+        mock_rects.assert_called_once_with((255, 0, 0), [((1, 2), (3, 4))])
+        mock_texts.assert_not_called()
+
+    def test_render_guis_keeps_components_stacked(self):
+        """Le figure di un componente sono disegnate tutte sopra quelle dei componenti precedenti, anche con gli stessi colori."""
+        def bar(x):
+            return DummyGUI(fixed=True, info=[
+                {"type": "rect", "color": (0, 0, 0), "pos": (x, 0), "size": (10, 4)},
+                {"type": "rect", "color": (255, 0, 0), "pos": (x, 0), "size": (6, 4)},
+            ])
+        self.gui.gui = [bar(0), bar(5)]  # -> il secondo copre in parte il primo
+        self.gui._GraphicalInterface__gui_actors_components = []  # type: ignore
+
+        with patch("src.g2d_lib.g2d.clear_canvas"), \
+                patch("src.g2d_lib.g2d.fill_rects") as mock_rects:
             self.gui.render_guis()
 
-        mock_color.assert_called_once_with((255, 0, 0))
-        mock_rect.assert_called_once_with(pos=(1, 2), size=(3, 4))
-        mock_text.assert_not_called()
+        self.assertEqual([(c.args[0], c.args[1][0][0]) for c in mock_rects.call_args_list],
+                         [((0, 0, 0), (0, 0)), ((255, 0, 0), (0, 0)), ((0, 0, 0), (5, 0)), ((255, 0, 0), (5, 0))])
 
     def test_render_guis_draws_text(self):
-        """Un GUIComponent che ritorna un 'text' deve chiamare draw_text."""
+        """Un GUIComponent che ritorna un 'text' viene disegnato con g2d.draw_texts."""
         info = [{
             "type": "text",
             "color": (0, 255, 0),
@@ -182,14 +285,43 @@ class GraphicalInterfaceTest(unittest.TestCase):
         self.gui._GraphicalInterface__gui_actors_components = []  # type: ignore
 
         with patch("src.g2d_lib.g2d.clear_canvas"), \
-                patch("src.g2d_lib.g2d.set_color") as mock_color, \
+                patch("src.g2d_lib.g2d.fill_rects") as mock_rects, \
+                patch("src.g2d_lib.g2d.draw_texts") as mock_texts:
+            self.gui.render_guis()
+
+        mock_texts.assert_called_once_with([("Testing", (100, 50), 16, (0, 255, 0))])
+        mock_rects.assert_not_called()
+
+    def test_render_guis_retained_component_uses_layer_cache(self):
+        """Un componente con render_key viene rasterizzato tramite load_cached, in coordinate locali, e disegnato con un blit."""
+        from src.game.gui import Bar
+
+        health = {"value": 50}
+        bar = Bar("hp", x=lambda: 40, y=lambda: 30, width=20, height=4, text="", padding=0,
+                  max_value=100, value=lambda: health["value"], fixed=False)
+        self.camera.view_x, self.camera.view_y = 10, 5
+        self.gui.gui = [bar]
+        self.gui._GraphicalInterface__gui_actors_components = []  # type: ignore
+
+        with patch("src.g2d_lib.g2d.clear_canvas"), \
+                patch("src.g2d_lib.g2d.load_cached", return_value=7) as mock_cached, \
+                patch("src.g2d_lib.g2d.draw_sprites") as mock_sprites, \
+                patch("src.g2d_lib.g2d.set_color"), \
                 patch("src.g2d_lib.g2d.draw_rect") as mock_rect, \
-                patch("src.g2d_lib.g2d.draw_text") as mock_text:
+                patch("src.g2d_lib.g2d.draw_text"):
             self.gui.render_guis()
+            layer, key, size, paint = mock_cached.call_args.args
+            mock_rect.assert_not_called()  # -> nulla viene disegnato finché g2d non chiede di rasterizzare
+            paint()
 
-        mock_color.assert_called_once_with((0, 255, 0))
-        mock_text.assert_called_once_with(text="Testing", center=(100, 50), size=16)
-        mock_rect.assert_not_called()
+        self.assertEqual(layer, id(bar))
+        self.assertEqual(key, bar.render_key())
+        self.assertEqual(size, (20, 4))
+        mock_sprites.assert_called_once_with([(7, (30, 25))])
+        self.assertEqual(mock_rect.call_args_list[1].kwargs, {"pos": (0, 0), "size": (10, 4)})
+
+        health["value"] = 25
+        self.assertNotEqual(bar.render_key(), key)  # -> il valore legato cambia la chiave
 
 
     # ======== RENDER ========
@@ -211,6 +343,35 @@ class GraphicalInterfaceTest(unittest.TestCase):
         mock_spr.assert_called_once_with(game, clear_canvas=False)  # <-- QUI
         mock_gui.assert_called_once()
 
+    def test_render_draws_the_whole_frame_with_one_flush(self):
+        """render registra sprite e GUI e li disegna con una sola Surface.blits; Arthur sopra gli altri attori."""
+        from src.game.entities import Arthur
+        from src.game.state import Sprite
+
+        gi = GraphicalInterface(self.camera, profile=True)
+        gi.camera.tick = Mock()
+        arthur = Arthur("Arthur", 10, 10)
+        zombie = Mock(spec=["sprite", "pos"])
+        zombie.sprite.return_value = Sprite("sheet.png", 0, 0, 10, 10)
+        zombie.pos.return_value = (12, 10)
+        game = Mock()
+        game.background = None
+        game.actors_in.return_value = [arthur, zombie]
+
+        with patch("src.g2d_lib.g2d.clear_canvas"), \
+                patch("src.g2d_lib.g2d.load_image", return_value=0), \
+                patch("src.g2d_lib.g2d.load_sprite", side_effect=lambda src, pos, size: "zombie" if str(src) == "sheet.png" else "arthur"), \
+                patch("src.g2d_lib.g2d.load_cached", return_value="bar"), \
+                patch("src.g2d_lib.g2d.draw_sprites") as mock_sprites:
+            gi.render(game)
+
+        mock_sprites.assert_called_once()
+        handles = [h for h, _ in mock_sprites.call_args.args[0]]
+        self.assertEqual(handles[:2], ["zombie", "arthur"])
+        self.assertEqual(set(handles[2:]), {"bar"})  # -> barre della GUI di Arthur, sopra gli sprite
+        self.assertEqual(gi.render_stats()["batches"], 1)
+        self.assertEqual(gi.render_stats()["blits"], len(handles))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import unittest
+from unittest.mock import Mock
+
+from src.game.core.pool import Pool, acquire
+from src.game.entities import Torch, Flame, EyeBall
+from src.game.state import Action, Direction
+
+
+def snapshot(a):
+    names = ("x", "y", "x_step", "y_step", "width", "height", "damage", "speed", "gravity", "direction", "sprite_cycle_counter",
+             "sprite_cycle_speed", "travelled_distance", "max_travel_distance", "ground_y", "age", "life_time")
+    return (a.state.action, a.state.direction, a.sprite(), *(getattr(a, n, None) for n in names))
+
+
+class PoolTest(unittest.TestCase):
+    def test_acquire_counts_hits_and_misses(self):
+        """acquire riusa gli oggetti liberi (hit) e costruisce solo quando non ce ne sono (miss)."""
+        pool = Pool(Torch, 2)
+        first = pool.acquire(x=1.0, y=2.0)
+        pool.release(first)
+        second = pool.acquire(x=3.0, y=4.0)
+        third = pool.acquire(x=5.0, y=6.0)
+
+        self.assertIs(second, first)
+        self.assertIsNot(third, first)
+        self.assertEqual((second.x, second.y), (3.0, 4.0))
+        self.assertEqual(pool.stats(), {"hits": 1, "misses": 2, "released": 1, "dropped": 0, "free": 0})
+
+    def test_release_keeps_at_most_size_objects(self):
+        """release tiene al massimo size oggetti liberi, senza duplicati; prewarm li costruisce in anticipo."""
+        pool = Pool(Flame, 2)
+        pool.prewarm(1)
+        self.assertEqual(pool.free(), 1)
+        pool.prewarm()
+        self.assertEqual(pool.free(), 2)
+
+        flames = [Flame(x=0.0, ground_y=0.0) for _ in range(2)]
+        pool.release(flames[0])
+        self.assertEqual(pool.stats()["dropped"], 1)
+
+        pool = Pool(Flame, 2)
+        pool.release(flames[0])
+        pool.release(flames[0])
+        self.assertEqual((pool.free(), pool.stats()["released"]), (1, 1))
+
+    def test_reset_matches_a_new_object(self):
+        """Un oggetto riusato dopo essere stato in gioco è uguale a uno appena costruito con gli stessi argomenti."""
+        cases = (
+            (Torch, dict(x=10.0, y=20.0, direction=Direction.LEFT, speed=3.0)),
+            (Flame, dict(x=10.0, ground_y=20.0, life_time=30)),
+            (EyeBall, dict(x=10.0, y=20.0, direction=Direction.LEFT, speed=2.0, damage=20.0)),
+        )
+        for t, kwargs in cases:
+            with self.subTest(t=t.__name__):
+                pool = Pool(t, 1)
+                used = pool.acquire(x=0.0, **({"ground_y": 0.0} if t is Flame else {"y": 0.0}))
+                for _ in range(40):
+                    used.move(None)  # type: ignore
+                    used.animate()
+                used.state.action = Action.DEAD
+                pool.release(used)
+
+                reused = pool.acquire(**kwargs)
+                self.assertIs(reused, used)
+                self.assertEqual(snapshot(reused), snapshot(t(**kwargs)))
+
+    def test_acquire_without_pool_builds_the_object(self):
+        """acquire(arena, t, ...) usa il Pool di arena per t, se esiste; altrimenti costruisce t."""
+        pool = Pool(EyeBall, 1)
+        pool.prewarm()
+        arena = Mock(pools={EyeBall: pool})
+
+        self.assertIsInstance(acquire(arena, EyeBall, x=1.0, y=1.0), EyeBall)
+        self.assertEqual(pool.stats()["hits"], 1)
+        self.assertIsInstance(acquire(arena, Torch, x=1.0, y=1.0), Torch)
+        self.assertIsInstance(acquire(Mock(), Torch, x=1.0, y=1.0), Torch)
+
+    def test_type_errors(self):
+        """t deve avere reset, size deve essere un int; release accetta solo oggetti di tipo t."""
+        with self.assertRaises(TypeError):
+            Pool(object, 1)
+        with self.assertRaises(TypeError):
+            Pool(Torch, 1.5)  # type: ignore
+        with self.assertRaises(TypeError):
+            Pool(Torch, 1).release(Flame(x=0.0, ground_y=0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
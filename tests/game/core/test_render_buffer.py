@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import unittest
+from unittest.mock import patch
+
+from src.game.core.render_buffer import RenderBuffer, LAYER_ACTORS, LAYER_PLAYER, LAYER_GUI
+
+
+class RenderBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.patches = [
+            patch("src.g2d_lib.g2d.draw_sprites", side_effect=lambda batch: self.calls.append(("blits", [h for h, _ in batch]))),
+            patch("src.g2d_lib.g2d.fill_rects", side_effect=lambda color, rects: self.calls.append(("fill", color, len(rects)))),
+            patch("src.g2d_lib.g2d.draw_texts", side_effect=lambda batch: self.calls.append(("texts", [t for t, *_ in batch]))),
+        ]
+        for p in self.patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_commands_are_sorted_by_layer_in_insertion_order(self):
+        """I comandi sono disegnati per livello; dentro un livello, se si sovrappongono, nell'ordine di registrazione."""
+        buffer = RenderBuffer()
+        buffer.blit(1, (0, 0), layer=LAYER_PLAYER, texture=0, size=(4, 4))
+        buffer.blit(2, (0, 0), texture=5, size=(4, 4))
+        buffer.blit(3, (2, 2), texture=0, size=(4, 4))  # -> sopra al 2: non viene anticipato per texture
+        buffer.blit(4, (8, 0), texture=5, size=(4, 4))
+        buffer.text("hp", (0, 0), 10, (255, 255, 255))
+        buffer.flush()
+
+        self.assertEqual(self.calls, [("blits", [2, 3, 4, 1]), ("texts", ["hp"])])
+        self.assertEqual(len(buffer), 0)
+
+    def test_disjoint_blits_are_grouped_by_texture(self):
+        """Blit di un livello che non si sovrappongono sono raggruppati per texture; senza texture o dimensioni no."""
+        buffer = RenderBuffer()
+        for handle, x, texture in ((1, 0, 5), (2, 4, 0), (3, 8, 5), (4, 12, 0)):
+            buffer.blit(handle, (x, 0), texture=texture, size=(4, 4))  # -> bordi a contatto: nessuna sovrapposizione
+        buffer.flush()
+        buffer.blit(1, (0, 0), texture=5, size=(4, 4))
+        buffer.blit(2, (8, 0))
+        buffer.blit(3, (16, 0), texture=0, size=(4, 4))
+        buffer.flush()
+
+        self.assertEqual(self.calls, [("blits", [2, 4, 1, 3]), ("blits", [1, 2, 3])])
+
+    def test_overlapping_fills_keep_their_layer_order(self):
+        """Solo i rettangoli consecutivi dello stesso colore sono uniti: rettangoli sovrapposti di livelli diversi restano nel loro ordine."""
+        buffer = RenderBuffer()
+        buffer.fill((1, 0, 0), (0, 0), (4, 4), layer=LAYER_GUI + 2)
+        buffer.fill((1, 0, 0), (4, 0), (4, 4), layer=LAYER_GUI + 2)
+        buffer.fill((1, 0, 0), (0, 0), (8, 4), layer=LAYER_GUI + 4)  # -> registrato prima del verde, ma sopra
+        buffer.fill((0, 1, 0), (2, 0), (4, 4), layer=LAYER_GUI + 3)
+        buffer.text("a", (0, 0), 10, (0, 0, 0), layer=LAYER_GUI + 5)
+        buffer.flush()
+
+        self.assertEqual(self.calls, [("fill", (1, 0, 0), 2), ("fill", (0, 1, 0), 1), ("fill", (1, 0, 0), 1), ("texts", ["a"])])
+
+    def test_frame_flushes_once(self):
+        """Dentro frame i flush non disegnano nulla: i comandi sono disegnati tutti all'uscita."""
+        buffer = RenderBuffer()
+        with buffer.frame():
+            buffer.blit(1, (0, 0))
+            buffer.flush()
+            buffer.blit(2, (0, 0), layer=LAYER_ACTORS)
+            buffer.flush()
+            self.assertEqual(self.calls, [])
+
+        self.assertEqual(self.calls, [("blits", [1, 2])])
+
+    def test_profile_reports_counts_of_last_frame(self):
+        """In modalità profile stats() riporta i comandi per tipo e le chiamate g2d dell'ultimo frame."""
+        buffer = RenderBuffer(profile=True)
+        buffer.blit(1, (0, 0))
+        buffer.blit(2, (0, 0))
+        buffer.fill((1, 0, 0), (0, 0), (1, 1))
+        buffer.fill((0, 1, 0), (0, 0), (1, 1))
+        buffer.text("a", (0, 0), 10, (0, 0, 0))
+        buffer.flush()
+
+        self.assertEqual(buffer.stats(), {"commands": 5, "blits": 2, "fills": 2, "labels": 1, "batches": 4})
+        buffer.flush()
+        self.assertEqual(buffer.stats()["commands"], 0)
+        with self.assertRaises(TypeError):
+            buffer.profile = 1  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
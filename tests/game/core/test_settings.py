@@ -0,0 +1,70 @@
+import dataclasses
+import unittest
+from unittest.mock import patch
+
+import src.game.core.settings as settings_module
+from src.game.core.settings import Settings, get_settings, reload_settings
+from src.game.state import Action, Direction
+
+
+class SettingsTest(unittest.TestCase):
+    def tearDown(self):
+        reload_settings()
+
+    def test_get_settings_reads_file_once(self):
+        """get_settings legge settings.json una sola volta e restituisce sempre lo stesso oggetto."""
+        with patch.object(settings_module, "read_settings", return_value={"fps": 60}) as mock_rs:
+            first = reload_settings()
+            second = get_settings()
+            get_settings()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.fps, 60)
+        self.assertEqual(mock_rs.call_count, 1)
+
+    def test_reload_replaces_cached_settings(self):
+        """reload_settings rilegge il file e sostituisce l'oggetto in cache."""
+        with patch.object(settings_module, "read_settings", side_effect=[{"scale": 2}, {"scale": 4}]):
+            old = reload_settings()
+            new = reload_settings()
+
+        self.assertEqual((old.scale, new.scale), (2, 4))
+        self.assertIs(get_settings(), new)
+
+    def test_sections_are_typed_and_frozen(self):
+        """Le sezioni per entità diventano oggetti immutabili con enum già convertiti."""
+        settings = Settings.from_dict({
+            "Zombie": {"defaults": {"direction": "LEFT", "width": 30}},
+            "Torch": {"defaults": {"action": "ATTACKING"}},
+        })
+
+        self.assertEqual(settings.zombie.direction, Direction.LEFT)
+        self.assertEqual(settings.zombie.width, 30)
+        self.assertEqual(settings.torch.action, Action.ATTACKING)
+        self.assertIs(settings.defaults("Zombie"), settings.zombie)
+        self.assertEqual(settings.plant.height, 32)  # -> chiavi mancanti: default
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            settings.zombie.width = 10
+
+    def test_invalid_values_are_rejected(self):
+        """Tipi errati, chiavi sconosciute e nomi di enum inesistenti sollevano un errore."""
+        with self.assertRaises(TypeError):
+            Settings.from_dict({"Arthur": {"defaults": {"width": 2.5}}})
+        with self.assertRaises(TypeError):
+            Settings.from_dict({"scale": "3"})
+        with self.assertRaises(ValueError):
+            Settings.from_dict({"Plant": {"defaults": {"direction": "NORTH"}}})
+        with self.assertRaises(ValueError):
+            Settings.from_dict({"Door": {"defaults": {"colour": "red"}}})
+
+    def test_shipped_settings_file_is_valid(self):
+        """Il settings.json distribuito con il gioco supera la validazione."""
+        settings = reload_settings()
+
+        self.assertEqual(settings.scale, 3)
+        self.assertEqual(settings.arthur.throw_interval, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
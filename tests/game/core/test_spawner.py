@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+import math
+import unittest
+from unittest.mock import Mock, patch
+
+import src.game.core.spawner as spawner_module
+from src.game.core.spawner import Spawner
+
+
+class Enemy:
+    site = True
+
+    @classmethod
+    def auto_init(cls, player, game):
+        return cls() if cls.site else None
+
+class Other:
+    auto_init = Enemy.__dict__["auto_init"]
+    site = True
+
+
+class FakeGame:
+    def __init__(self):
+        self.now = 0
+        self.player = object()
+        self.alive: list = []
+
+    def count(self):
+        return self.now
+
+    def of_type(self, t):
+        return tuple(a for a in self.alive if isinstance(a, t))
+
+    def spawn(self, a):
+        self.alive.append(a)
+
+
+class SpawnerTest(unittest.TestCase):
+    def setUp(self):
+        Enemy.site = True
+        self.game = FakeGame()
+
+    def run_ticks(self, spawner, n):
+        for _ in range(n):
+            spawner.tick(self.game)
+            self.game.now += 1
+
+    def test_next_gap_is_geometric_with_the_same_mean(self):
+        """Il tempo di attesa tra due eventi ha media 1/rate; rate <= 0 non pianifica mai, rate >= 1 ogni tick."""
+        spawner = Spawner({Enemy: 0.01, Other: 0.0})
+        with patch.object(spawner_module.random, "random", side_effect=[i / 2000 for i in range(2000)]):
+            mean = sum(spawner.next_gap(Enemy) for _ in range(2000)) / 2000
+
+        self.assertAlmostEqual(mean, 100, delta=2)
+        self.assertEqual(spawner.next_gap(Other), math.inf)
+        spawner.rates = {Enemy: 1}
+        self.assertEqual(spawner.next_gap(Enemy), 1)
+
+    def test_events_are_drawn_only_when_due(self):
+        """Un numero casuale viene estratto solo alla pianificazione di un evento, non a ogni tick."""
+        spawner = Spawner({Enemy: 0.1}, caps={Enemy: 10})
+        with patch.object(Spawner, "next_gap", return_value=5) as mock_gap:
+            self.run_ticks(spawner, 11)
+
+        self.assertEqual(mock_gap.call_count, 3)  # -> tick 0 (pianificazione), 5 e 10
+        self.assertEqual(len(self.game.alive), 2)
+        self.assertEqual(spawner.due(Enemy), 15)
+
+    def test_caps_and_budget_limit_spawns(self):
+        """Limiti per tipo e globali scartano l'evento; oltre il budget l'evento è rimandato al tick dopo."""
+        spawner = Spawner({Enemy: 1, Other: 1}, caps={Other: 1}, max_alive=3, budget=1)
+        self.run_ticks(spawner, 5)
+
+        stats = spawner.stats()
+        self.assertEqual(len(self.game.alive), 3)
+        self.assertEqual(len(self.game.of_type(Other)), 1)
+        self.assertEqual(stats["Other"]["deferred"], 2)  # -> tick 1 e 3: il budget è già usato da Enemy
+        self.assertEqual(stats["Enemy"]["deferred"], 1)  # -> tick 2: prima l'evento rimandato di Other
+        self.assertEqual((stats["Other"]["capped"], stats["Enemy"]["capped"]), (1, 1))  # -> tick 4: max_alive
+        self.assertEqual(stats["Enemy"]["spawned"] + stats["Other"]["spawned"], 3)
+
+    def test_no_site_and_no_player(self):
+        """Senza punto di spawn l'evento è contato come no_site; senza giocatore resta in attesa."""
+        Enemy.site = False
+        spawner = Spawner({Enemy: 1})
+        self.run_ticks(spawner, 3)  # -> tick 0: solo pianificazione
+        self.assertEqual(spawner.stats()["Enemy"]["no_site"], 2)
+
+        self.game.player = None
+        Enemy.site = True
+        self.run_ticks(spawner, 3)
+        self.assertEqual(self.game.alive, [])
+
+    def test_type_errors(self):
+        """rates, caps, max_alive e budget sono validati."""
+        with self.assertRaises(TypeError):
+            Spawner({"Zombie": 0.1})
+        with self.assertRaises(TypeError):
+            Spawner({Enemy: 0.1}, caps={Enemy: 1.5})
+        with self.assertRaises(TypeError):
+            Spawner({Enemy: 0.1}, max_alive="3")
+        with self.assertRaises(TypeError):
+            Spawner({Enemy: 0.1}, budget=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
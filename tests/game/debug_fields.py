@@ -0,0 +1,15 @@
+import unittest
+
+from src.game.state import set_debug
+
+
+class DebugFieldsTest(unittest.TestCase):
+    """Base dei test di entità con campi caldi (vedi Checked).
+
+    I test vengono eseguiti in modalità debug, l'unica in cui anche gli
+    assegnamenti dei campi caldi sono validati; lo stato precedente viene
+    ripristinato alla fine di ogni test.
+    """
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(set_debug, set_debug(True))
@@ -7,8 +7,6 @@ from src.game.entities.enemies import Plant
 Action = plant_module.Action
 Direction = plant_module.Direction
 Bar = plant_module.Bar
-Range = plant_module.Range
-Candidate = plant_module.Candidate
 
 
 class PlantTest(unittest.TestCase):
@@ -74,8 +72,8 @@ class PlantTest(unittest.TestCase):
         self.plant.state.action = Action.SPAWNING
         arena = Mock()
 
-        with patch.object(self.plant, "_locked_anim_finished", return_value=True) as mock_finished, \
-             patch.object(self.plant, "_set_state_action") as mock_set_state:
+        with patch.object(Plant, "_locked_anim_finished", return_value=True) as mock_finished, \
+             patch.object(Plant, "_set_state_action") as mock_set_state:
 
             self.plant.move(arena)
 
@@ -90,7 +88,7 @@ class PlantTest(unittest.TestCase):
         arena = Mock()
         arena.player = Mock()  # -> esiste il player ma cooldown > 0
 
-        with patch.object(self.plant, "_set_state_action") as mock_set_state:
+        with patch.object(Plant, "_set_state_action") as mock_set_state:
             self.plant.move(arena)
 
         self.assertEqual(self.plant.attack_cooldown, 4)
@@ -99,7 +97,7 @@ class PlantTest(unittest.TestCase):
     def test_move_idle_starts_attack_and_sets_direction(self):
         """In IDLE con cooldown 0 setta direction verso Arthur e passa ad ATTACKING."""
         arena = Mock()
-        arena.player = Mock()
+        player = arena.nearest.return_value
         self.plant.state.action = Action.IDLE
         self.plant.attack_cooldown = 0
 
@@ -120,12 +118,12 @@ class PlantTest(unittest.TestCase):
                 self.plant.state.direction = Direction.RIGHT  # -> default
 
                 # -> posizione del player
-                arena.player.x = player_cx - 10
-                arena.player.width = 20
-                arena.player.y = 0
-                arena.player.height = 30
+                player.x = player_cx - 10
+                player.width = 20
+                player.y = 0
+                player.height = 30
 
-                with patch.object(self.plant, "_set_state_action") as mock_set_state:
+                with patch.object(Plant, "_set_state_action") as mock_set_state:
                     self.plant.move(arena)
 
                 # -> direction aggiornata
@@ -134,15 +132,47 @@ class PlantTest(unittest.TestCase):
                 mock_set_state.assert_called_once_with(Action.ATTACKING)
                 # -> cooldown resettato
                 self.assertEqual(self.plant.attack_cooldown, self.plant.attack_interval)
+                # -> Arthur cercato con Game.nearest dal centro della pianta
+                arena.nearest.assert_called_with(plant_module.Arthur, (plant_cx, self.plant.y + self.plant.height / 2))
+
+    def test_move_idle_without_player_does_not_attack(self):
+        """In IDLE con cooldown 0, se Game.nearest non trova Arthur la pianta resta IDLE."""
+        arena = Mock()
+        arena.nearest.return_value = None
+        self.plant.state.action = Action.IDLE
+        self.plant.attack_cooldown = 0
+
+        with patch.object(Plant, "_set_state_action") as mock_set_state:
+            self.plant.move(arena)
+
+        mock_set_state.assert_not_called()
+        self.assertEqual(self.plant.attack_cooldown, 0)
+
+    def test_move_idle_finds_player_through_nearest(self):
+        """Su una Game reale la pianta trova Arthur tramite nearest e si gira verso di lui."""
+        from src.game.core import Game
+        from src.game.entities import Arthur
+
+        game = Game((320, 240))
+        game.spawn(Arthur(name="Arthur", x=0, y=100))
+        self.plant.state.action = Action.IDLE
+        self.plant.state.direction = Direction.RIGHT
+        self.plant.attack_cooldown = 0
+
+        with patch.object(Plant, "_set_state_action") as mock_set_state:
+            self.plant.move(game)
+
+        self.assertEqual(self.plant.state.direction, Direction.LEFT)
+        mock_set_state.assert_called_once_with(Action.ATTACKING)
 
     def test_move_attacking_shoots_and_goes_back_to_idle(self):
         """In ATTACKING, quando l'animazione è finita spara EyeBall e torna a IDLE."""
         arena = Mock()
         self.plant.state.action = Action.ATTACKING
 
-        with patch.object(self.plant, "_locked_anim_finished", return_value=True) as mock_finished, \
-             patch.object(self.plant, "_shoot_eyeball") as mock_shoot, \
-             patch.object(self.plant, "_set_state_action") as mock_set_state:
+        with patch.object(Plant, "_locked_anim_finished", return_value=True) as mock_finished, \
+             patch.object(Plant, "_shoot_eyeball") as mock_shoot, \
+             patch.object(Plant, "_set_state_action") as mock_set_state:
 
             self.plant.move(arena)
 
@@ -252,133 +282,48 @@ class PlantTest(unittest.TestCase):
         arena.spawn.assert_called_once_with(eyeball_instance)
 
     # ======== AUTO_INIT ========
-    def test_auto_init_spawn_ranges_on_closest_platform(self):
+    def test_auto_init_spawn_ranges_on_walkable_spans(self):
         """
         auto_init:
-        - calcola i range di spawn corretti sulle piattaforme a sinistra e destra,
-        - sceglie un Candidate tra le piattaforme selezionate,
+        - ritaglia i tratti calpestabili nelle fasce di spawn a sinistra e destra di Arthur,
+        - sceglie un tratto in modo uniforme tra i due lati (random.randrange),
         - crea un Plant con x, y, direction coerenti.
         """
-        min_dist_x = 50
-        max_dist_x = 100
-
-        settings = plant_module.read_settings()
-        defaults = settings.get("Plant", {}).get("defaults", {})
-        plant_height = defaults.get("height", 32)
+        from src.game.core import Game
+        from src.game.entities import Platform
 
         # Player
-        player = Mock()
-        player.x = 100
-        player.y = 50
-        player.width = 20   # cx = 110
-        player.height = 30  # base_y = 80
-
-        # -> dummy di platform
-        class DummyPlatform(plant_module.Platform):
-            def __init__(self, x, y, width, height, damage, contact_surfaces):
-                self.x = x
-                self.y = y
-                self.width = width
-                self.height = height
-                self.damage = damage
-                self.contact_surfaces = contact_surfaces
-
-        # piattaforma vicina:
-        #   intersezione sinistra: [0, 60]
-        #   intersezione destra: [160, 200]
-        platform_close = DummyPlatform(
-            x=0, y=100, width=200, height=10,
-            damage=0,
-            contact_surfaces=[Direction.UP],
-        )
-
-        # piattaforma più lontana (y=200)
-        #   intersezione sinistra: [0, 60]
-        #   intersezione destra: [160, 200]
-        platform_far = DummyPlatform(
-            x=0, y=200, width=200, height=10,
-            damage=0,
-            contact_surfaces=[Direction.UP],
-        )
-
-        game = Mock()
-        game.actors.return_value = [platform_close, platform_far]
-
-        with patch.object(plant_module.random, "choice") as mock_choice, \
-             patch.object(plant_module.random, "uniform") as mock_uniform:
-
-            # -> salvo i candidati che auto_init passerà a choice in 'captured'
-            captured = {}
-
-            def fake_choice(candidates):
-                captured["candidates"] = list(candidates)
-                # -> dopo il sort, il candidato migliore è il primo
-                return candidates[0]
+        player = Mock(x=100, y=50, width=20, height=30)  # -> cx = 110
 
-            mock_choice.side_effect = fake_choice
+        # -> due piattaforme sovrapposte in x:
+        #   fascia sinistra [-40, 60] -> tratti (0, 60)
+        #   fascia destra [160, 260] -> tratti (160, 200)
+        game = Game((320, 240))
+        game.spawn(Platform(x=0, y=200, width=200, height=10))
+        game.spawn(Platform(x=0, y=100, width=200, height=10))
+        game.spawn(Platform(x=50, y=150, width=30, height=10))  # -> tratto sinistro troppo stretto
 
-            # uniform(a, b) -> scelgo sempre il minimo
-            def fake_uniform(a, b):
-                return a
+        min_dist_x = 50
+        max_dist_x = 100
+        plant_height = plant_module.get_settings().plant.height
 
-            mock_uniform.side_effect = fake_uniform
+        with patch.object(plant_module.random, "randrange", return_value=2) as mock_randrange, \
+             patch.object(plant_module.random, "uniform", side_effect=lambda a, b: a):
 
             # -> chiamata reale ad auto_init
-            spawned_plant = Plant.auto_init(
-                player,
-                game,
-                min_dist_x=min_dist_x,
-                max_dist_x=max_dist_x,
-            )
-
-        # -> CHECK CANDIDATES
-        self.assertIn("candidates", captured)
-        candidates = captured["candidates"]
-
-        # -> ci devono essere candidati su entrambe le piattaforme
-        close_candidates = [c for c in candidates if c.height == platform_close.y]
-        far_candidates = [c for c in candidates if c.height == platform_far.y]
-        self.assertTrue(close_candidates)
-        self.assertTrue(far_candidates)
-
-        # -> tra i candidati sulla piattaforma vicina, troviamo i due lati
-        left_close = [
-            c for c in close_candidates
-            if c.direction == Direction.RIGHT   # -> LEFT range
-        ]
-        right_close = [
-            c for c in close_candidates
-            if c.direction == Direction.LEFT    # -> RIGHT range
-        ]
-
-        self.assertTrue(left_close)
-        self.assertTrue(right_close)
-
-        left_candidate = left_close[0]
-        right_candidate = right_close[0]
-
-        # -> range sinistro atteso: [0, 60]
-        self.assertAlmostEqual(left_candidate.range.min, 0.0)
-        self.assertAlmostEqual(left_candidate.range.max, 60.0)
-
-        # -> range destro atteso: [160, 200]
-        self.assertAlmostEqual(right_candidate.range.min, 160.0)
-        self.assertAlmostEqual(right_candidate.range.max, 200.0)
+            spawned = Plant.auto_init(player, game, min_dist_x=min_dist_x, max_dist_x=max_dist_x)
 
-        # -> il candidato scelto (dopo il sort) deve stare sulla piattaforma più vicina (imposto da fake_choice)
-        chosen_candidate = candidates[0]  # -> return di fake_choice
-        self.assertEqual(chosen_candidate.height, platform_close.y)
 
-        # -> CHECK PLANT
-        # -> x deve essere l'estremo sinistro del range (fake_uniform ritorna il minimo)
-        expected_x = chosen_candidate.range.min
-        # -> y = altezza piattaforma - altezza plant
-        expected_y = chosen_candidate.height - plant_height
+        # -> CHECK SPANS: tuple (x0, x1, top) ordinate, prima il lato sinistro poi il destro
+        self.assertEqual(game.walkable_spans(-40, 60, 16), [(0, 60, 100), (0, 60, 200)])
+        self.assertEqual(game.walkable_spans(160, 260, 16), [(160, 200, 100), (160, 200, 200)])
+        mock_randrange.assert_called_once_with(4)
 
-        self.assertIsInstance(spawned_plant, Plant)
-        self.assertAlmostEqual(spawned_plant.x, expected_x)
-        self.assertAlmostEqual(spawned_plant.y, expected_y)
-        self.assertEqual(spawned_plant.state.direction, chosen_candidate.direction)
+        # -> CHECK PLANT: indice 2 -> primo tratto destro, rivolto verso Arthur
+        self.assertIsInstance(spawned, Plant)
+        self.assertAlmostEqual(spawned.x, 160)
+        self.assertAlmostEqual(spawned.y, 100 - plant_height)
+        self.assertEqual(spawned.state.direction, Direction.LEFT)
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 import src.game.entities.enemies.zombie as zombie_module
+from src.game.core.settings import Settings
 from src.game.entities.enemies.zombie import Zombie, Action, Direction, EntityState
 
 
@@ -66,6 +67,19 @@ class ZombieTest(unittest.TestCase):
 
         self.assertIsInstance(bar, zombie_module.GUIComponent)
 
+    def test_gui_bar_is_retained_and_bound_to_zombie(self):
+        """La barra è creata una volta e segue posizione e vita dello zombie."""
+        bar = self.zombie.gui[0]
+        key = bar.render_key()
+
+        self.zombie.x += 15
+        self.zombie.health -= 20
+
+        self.assertIs(self.zombie.gui[0], bar)
+        self.assertEqual(bar.x, self.zombie.x)
+        self.assertEqual(bar.value, self.zombie.health)
+        self.assertNotEqual(bar.render_key(), key)
+
     # ======== POSITION, SIZE ========
     def test_pos_size(self):
         self.zombie.x = 10
@@ -138,6 +152,22 @@ class ZombieTest(unittest.TestCase):
         spr2 = self.zombie.sprite()
         self.assertIsNone(spr2)
 
+    def test_animate_advances_counter_and_sprite_does_not(self):
+        """Il contatore avanza solo con animate; sprite() non lo modifica."""
+        self.zombie.state.action = Action.WALKING
+        self.zombie.sprite_cycle_counter = 0
+
+        for _ in range(5):
+            self.zombie.sprite()
+        self.assertEqual(self.zombie.sprite_cycle_counter, 0)
+
+        self.zombie.animate()
+        self.assertEqual(self.zombie.sprite_cycle_counter, 1)
+
+        self.zombie.state.action = Action.DEAD
+        self.zombie.animate()
+        self.assertEqual(self.zombie.sprite_cycle_counter, 1)
+
     # ======== ARTHUR COLLISION ========
     def test_on_arthur_collision_does_nothing_when_not_walking(self):
         """In EMERGING/IMMERSING/DEAD non deve colpire Arthur."""
@@ -207,15 +237,29 @@ class ZombieTest(unittest.TestCase):
     def test_auto_init(self):
         """
         auto_init:
-        - calcola i range di spawn corretti sulle piattaforme a sinistra e destra,
-        - sceglie un Candidate tra le piattaforme selezionate,
+        - ritaglia i tratti calpestabili nelle fasce di spawn a sinistra e destra di Arthur,
+        - sceglie un tratto in modo uniforme tra i due lati (random.randrange),
         - crea uno Zombie con x, y, direction coerenti.
         """
-        with patch.object(zombie_module, "read_settings") as mock_rs, \
-             patch.object(zombie_module.random, "choice") as mock_choice, \
-             patch.object(zombie_module.random, "uniform") as mock_uniform:
+        from src.game.core import Game
+        from src.game.entities import Platform
 
-            mock_rs.return_value = {
+        # Player
+        player = Mock(x=100, y=50, width=20, height=30)  # -> cx = 110
+
+        # -> due piattaforme sovrapposte in x:
+        #   fascia sinistra [-40, 60] -> tratti (0, 60)
+        #   fascia destra [160, 260] -> tratti (160, 200)
+        game = Game((320, 240))
+        game.spawn(Platform(x=0, y=200, width=200, height=10))
+        game.spawn(Platform(x=0, y=100, width=200, height=10))
+        game.spawn(Platform(x=50, y=150, width=30, height=10))  # -> tratto sinistro troppo stretto
+
+        with patch.object(zombie_module, "get_settings") as mock_gs, \
+             patch.object(zombie_module.random, "randrange", return_value=2) as mock_randrange, \
+             patch.object(zombie_module.random, "uniform", side_effect=lambda a, b: a):
+
+            mock_gs.return_value = Settings.from_dict({
                 "Zombie": {
                     "defaults": {
                         "width": 21,
@@ -234,116 +278,31 @@ class ZombieTest(unittest.TestCase):
                         "attack_interval": 50,
                     }
                 }
-            }
-
-            zombie_width = 21
-            zombie_height = 32
-
-            # Player
-            player = Mock()
-            player.x = 100
-            player.y = 50
-            player.width = 20   # cx = 110
-            player.height = 30  # base_y = 80
-
-            # -> dummy di platform
-            class DummyPlatform(zombie_module.Platform):
-                def __init__(self, x, y, width, height, damage, contact_surfaces):
-                    self.x = x
-                    self.y = y
-                    self.width = width
-                    self.height = height
-                    self.damage = damage
-                    self.contact_surfaces = contact_surfaces
-
-            # piattaforma vicina:
-            #   intersezione sinistra: [0, 60]
-            #   intersezione destra: [160, 200]
-            platform_close = DummyPlatform(
-                x=0, y=100, width=200, height=10,
-                damage=0,
-                contact_surfaces=[Direction.UP],
-            )
-
-            # piattaforma più lontana (y=200)
-            #   intersezione sinistra: [0, 60]
-            #   intersezione destra: [160, 200]
-            platform_far = DummyPlatform(
-                x=0, y=200, width=200, height=10,
-                damage=0,
-                contact_surfaces=[Direction.UP],
-            )
-
-            game = Mock()
-            game.actors.return_value = [platform_close, platform_far]
-
-            # -> salvo i candidati che auto_init passerà a choice in 'captured'
-            captured = {}
-
-            def fake_choice(candidates):
-                captured["candidates"] = list(candidates)
-                # -> dopo il sort, il candidato migliore è il primo
-                return candidates[0]
-
-            mock_choice.side_effect = fake_choice
-
-            # uniform(a, b) -> scelgo sempre il minimo
-            def fake_uniform(a, b):
-                return a
-
-            mock_uniform.side_effect = fake_uniform
+            })
 
             # -> chiamata reale ad auto_init
-            spawned_zombie = Zombie.auto_init(player, game)
-
-        # -> CHECK CANDIDATES
-        self.assertIn("candidates", captured)
-        candidates = captured["candidates"]
-
-        # -> ci devono essere candidati su entrambe le piattaforme
-        close_candidates = [c for c in candidates if c.height == platform_close.y]
-        far_candidates = [c for c in candidates if c.height == platform_far.y]
-        self.assertTrue(close_candidates)
-        self.assertTrue(far_candidates)
-
-        # -> tra i candidati sulla piattaforma vicina, troviamo i due lati
-        left_close = [
-            c for c in close_candidates
-            if c.direction == Direction.RIGHT   # -> LEFT range
-        ]
-        right_close = [
-            c for c in close_candidates
-            if c.direction == Direction.LEFT    # -> RIGHT range
-        ]
-
-        self.assertTrue(left_close)
-        self.assertTrue(right_close)
-
-        left_candidate = left_close[0]
-        right_candidate = right_close[0]
-
-        # -> range sinistro atteso: [0, 60]
-        self.assertAlmostEqual(left_candidate.range.min, 0.0)
-        self.assertAlmostEqual(left_candidate.range.max, 60.0)
-
-        # -> range destro atteso: [160, 200]
-        self.assertAlmostEqual(right_candidate.range.min, 160.0)
-        self.assertAlmostEqual(right_candidate.range.max, 200.0)
-
-        # -> il candidato scelto (dopo il sort) deve stare sulla piattaforma più vicina (imposto da fake_choice)
-        chosen_candidate = candidates[0] # -> return di fake_choice
-        self.assertEqual(chosen_candidate.height, platform_close.y)
-
-        # -> CHECK ZOMBIE
-        # -> x deve essere l'estremo sinistro del range (fake_uniform ritorna il minimo)
-        expected_x = chosen_candidate.range.min
-        # -> y = altezza piattaforma - altezza zombie
-        expected_y = chosen_candidate.height - zombie_height
-
-        self.assertIsInstance(spawned_zombie, Zombie)
-        self.assertAlmostEqual(spawned_zombie.x, expected_x)
-        self.assertAlmostEqual(spawned_zombie.y, expected_y)
-        self.assertEqual(spawned_zombie.state.direction, chosen_candidate.direction)
+            spawned = Zombie.auto_init(player, game)
+
+        zombie_height = 32
+
+        # -> CHECK SPANS: tuple (x0, x1, top) ordinate, prima il lato sinistro poi il destro
+        self.assertEqual(game.walkable_spans(-40, 60, 16), [(0, 60, 100), (0, 60, 200)])
+        self.assertEqual(game.walkable_spans(160, 260, 16), [(160, 200, 100), (160, 200, 200)])
+        mock_randrange.assert_called_once_with(4)
+
+        # -> CHECK ZOMBIE: indice 2 -> primo tratto destro, rivolto verso Arthur
+        self.assertIsInstance(spawned, Zombie)
+        self.assertAlmostEqual(spawned.x, 160)
+        self.assertAlmostEqual(spawned.y, 100 - zombie_height)
+        self.assertEqual(spawned.state.direction, Direction.LEFT)
+
+    def test_auto_init_without_candidates_returns_none(self):
+        """Senza piattaforme nella fascia di spawn auto_init restituisce None invece di sollevare."""
+        player = Mock(x=100, y=50, width=20, height=30)
+        game = Mock()
+        game.walkable_spans.return_value = []
+
+        self.assertIsNone(Zombie.auto_init(player, game))
 
 
 if __name__ == "__main__":
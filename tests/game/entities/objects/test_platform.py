@@ -2,15 +2,17 @@ import unittest
 from unittest.mock import Mock
 
 from src.game.entities.objects import platform as platform_module
+from ...debug_fields import DebugFieldsTest
 
 Platform = platform_module.Platform
 Direction = platform_module.Direction
 Actor = platform_module.Actor
 
 
-class PlatformTest(unittest.TestCase):
+class PlatformTest(DebugFieldsTest):
 
     def setUp(self):
+        super().setUp()
         self.platform = Platform(
             x=10,
             y=20,
@@ -5,11 +5,13 @@ from unittest.mock import Mock, patch
 import src.game.entities.player.arthur as arthur_module
 from src.game.entities.player import Arthur
 from src.game.state import Action, Direction, EntityState
+from ...debug_fields import DebugFieldsTest
 
 
-class ArthurTest(unittest.TestCase):
+class ArthurTest(DebugFieldsTest):
 
     def setUp(self):
+        super().setUp()
         self.arthur = Arthur(
             name="Arthur",
             x=50,
@@ -258,21 +260,52 @@ class ArthurTest(unittest.TestCase):
         self.arthur.state.direction = Direction.RIGHT
         self.arthur.invincibility_countdown = 0
 
+        self.arthur.animate()
         spr = self.arthur.sprite()
         # -> controllo che non sia None
         self.assertIsNotNone(spr)
         # -> blinking deve essere False quando countdown == 0
-        self.assertFalse(spr.blinking)
+        self.assertFalse(self.arthur.blinking)
 
-    def test_sprite_sets_blinking_when_invincible(self):
-        """Se invincibility_countdown > 0, gli sprite devono avere blinking == True."""
+    def test_animate_sets_blinking_when_invincible(self):
+        """Se invincibility_countdown > 0, Arthur lampeggia senza modificare gli sprite condivisi."""
         self.arthur.state.action = Action.WALKING
         self.arthur.state.direction = Direction.RIGHT
         self.arthur.invincibility_countdown = int(1e99)
 
+        self.arthur.animate()
         spr = self.arthur.sprite()
         self.assertIsNotNone(spr)
-        self.assertTrue(spr.blinking)
+        self.assertTrue(self.arthur.blinking)
+        self.assertFalse(spr.blinking)  # -> lo sprite è della clip di classe: il lampeggio è deciso al rendering
+
+    def test_sprite_has_no_side_effects(self):
+        """sprite() non avanza l'animazione e non rimuove l'azione prioritaria."""
+        self.arthur.state.action = Action.IDLE
+        self.arthur.state.direction = Direction.RIGHT
+        self.arthur._priority_action = Action.ATTACKING
+        self.arthur.sprite_cycle_counter = 100
+
+        first = self.arthur.sprite()
+        for _ in range(10):
+            self.assertIs(self.arthur.sprite(), first)
+        self.assertEqual(self.arthur.sprite_cycle_counter, 100)
+        self.assertEqual(self.arthur._priority_action, Action.ATTACKING)
+
+    def test_animate_advances_counter_and_clears_finished_priority(self):
+        """animate incrementa il contatore e rimuove la priorita a fine animazione."""
+        self.arthur.state.action = Action.IDLE
+        self.arthur.state.direction = Direction.RIGHT
+        self.arthur._priority_action = Action.ATTACKING
+        self.arthur.sprite_cycle_counter = 0
+
+        self.arthur.animate()
+        self.assertEqual(self.arthur.sprite_cycle_counter, 1)
+        self.assertEqual(self.arthur._priority_action, Action.ATTACKING)
+
+        self.arthur.sprite_cycle_counter = 100
+        self.arthur.animate()
+        self.assertIsNone(self.arthur._priority_action)
 
     # ======== GUI ========
     def test_gui_health_bar_updates_with_health(self):
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch
 
 from src.game.entities.weapons import eye_ball as eye_ball_module
+from ...debug_fields import DebugFieldsTest
 
 EyeBall = eye_ball_module.EyeBall
 Action = eye_ball_module.Action
@@ -9,9 +10,10 @@ Direction = eye_ball_module.Direction
 EntityState = eye_ball_module.EntityState
 
 
-class EyeBallTest(unittest.TestCase):
+class EyeBallTest(DebugFieldsTest):
 
     def setUp(self):
+        super().setUp()
         self.eye_ball = EyeBall(x=10.0, y=20.0)
 
     # ======== INIT ========
@@ -25,9 +27,10 @@ class EyeBallTest(unittest.TestCase):
         self.assertIsInstance(self.eye_ball.state.direction, Direction)
 
         key = (Action.ATTACKING, self.eye_ball.state.direction)
-        self.assertIn(key, self.eye_ball.sprites)
+        self.assertIn(key, self.eye_ball.clips)
+        self.assertIs(self.eye_ball.clips, EyeBall.clips)  # -> animazioni condivise dalla classe
 
-        first = self.eye_ball.sprites[key][0]
+        first = self.eye_ball.clips[key].first
         self.assertEqual(self.eye_ball.width, first.width)
         self.assertEqual(self.eye_ball.height, first.height)
 
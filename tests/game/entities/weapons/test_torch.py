@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from src.game.entities.weapons import torch as torch_module
+from ...debug_fields import DebugFieldsTest
 
 Torch = torch_module.Torch
 Action = torch_module.Action
@@ -9,9 +10,10 @@ Direction = torch_module.Direction
 EntityState = torch_module.EntityState
 
 
-class TorchTest(unittest.TestCase):
+class TorchTest(DebugFieldsTest):
 
     def setUp(self):
+        super().setUp()
         self.torch = Torch(
             x=10,
             y=20,
@@ -98,6 +100,7 @@ class TorchTest(unittest.TestCase):
         self.torch.height = 16
 
         game = Mock()
+        game.ground_below.return_value = None  # -> nessun appoggio sotto il centro: resta all'altezza d'impatto
 
         with patch("src.game.entities.weapons.torch.Flame") as MockFlame:
             flame_instance = Mock()
@@ -114,10 +117,33 @@ class TorchTest(unittest.TestCase):
         expected_flame_x = 12 + self.torch.width / 2
         expected_flame_y = 23 + self.torch.height
 
+        game.ground_below.assert_called_once_with(expected_flame_x, expected_flame_y)
         MockFlame.assert_called_once_with(x=expected_flame_x, ground_y=expected_flame_y)
         game.spawn.assert_called_once_with(flame_instance)
         self.assertEqual(self.torch.state.action, Action.DEAD)
 
+    def test_spawn_flame_uses_ground_below(self):
+        """La Flame nasce sulla piattaforma trovata da Game.ground_below sotto il centro della Torch."""
+        from src.game.core import Game
+        from src.game.entities import Platform
+
+        game = Game((320, 240))
+        ledge = Platform(x=0, y=120, width=100, height=10)
+        ground = Platform(x=0, y=200, width=320, height=40)
+        game.spawn(ledge)
+        game.spawn(ground)
+
+        self.torch.width = 16
+        self.torch.height = 16
+        with patch("src.game.entities.weapons.torch.Flame") as MockFlame, patch.object(game, "spawn"):
+            self.torch.x, self.torch.y = 40, 104  # -> appoggiata sul ledge
+            self.torch._spawn_flame(game)
+            self.torch.x = 95  # -> centro oltre il bordo del ledge: la fiamma cade sul terreno
+            self.torch._spawn_flame(game)
+
+        self.assertEqual(MockFlame.call_args_list[0].kwargs, {"x": 48, "ground_y": 120})
+        self.assertEqual(MockFlame.call_args_list[1].kwargs, {"x": 103, "ground_y": 200})
+
     def test_on_platform_collision_side_only_kills(self):
         """
         on_platform_collision con direzione diversa da UP:
@@ -130,7 +156,7 @@ class TorchTest(unittest.TestCase):
 
         game = Mock()
 
-        with patch.object(self.torch, "_spawn_flame") as mock_spawn_flame:
+        with patch.object(torch_module.Torch, "_spawn_flame") as mock_spawn_flame:
             self.torch.on_platform_collision(Direction.LEFT, dx=5, dy=5, game=game)
 
         # -> posizione invariata
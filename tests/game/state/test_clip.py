@@ -0,0 +1,100 @@
+import dataclasses
+import unittest
+
+from src.game.state import Clip, Clips, Sprite, Action, Direction
+from src.game.entities.enemies import Zombie
+from src.game.entities.player import Arthur
+
+
+A, B, C = (Sprite("sheet.png", x, 0, 10, 10) for x in (0, 10, 20))
+
+
+class ClipTest(unittest.TestCase):
+    def test_frame_loops_or_stops_on_last(self):
+        """Una clip in loop ricomincia dal primo frame, altrimenti resta sull'ultimo."""
+        looping = Clip((A, B, C))
+        locked = Clip((A, B, C), loop=False)
+
+        self.assertEqual([looping.frame(i) for i in range(5)], [A, B, C, A, B])
+        self.assertEqual([locked.frame(i) for i in range(5)], [A, B, C, C, C])
+
+    def test_durations(self):
+        """Con durations ogni frame dura il numero di passi indicato."""
+        clip = Clip((A, B), durations=(3, 1), loop=False)
+
+        self.assertEqual(clip.steps, 4)
+        self.assertEqual([clip.frame(i) for i in range(6)], [A, A, A, B, B, B])
+        self.assertEqual([Clip((A, B), durations=(2, 1)).frame(i) for i in range(4)], [A, A, B, A])
+
+    def test_finished(self):
+        """finished è True dall'ultimo passo in poi."""
+        clip = Clip((A, B), durations=(3, 1), loop=False)
+        self.assertEqual([clip.finished(i) for i in range(5)], [False, False, False, True, True])
+        self.assertTrue(Clip((A,)).finished(0))
+
+    def test_is_immutable(self):
+        """Una clip non può essere modificata dopo la costruzione."""
+        clip = Clip((A, B))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            clip.loop = False  # type: ignore
+
+    def test_errors(self):
+        """frames, durations e loop sono validati."""
+        with self.assertRaises(TypeError):
+            Clip([A, B])  # type: ignore
+        with self.assertRaises(TypeError):
+            Clip(())
+        with self.assertRaises(TypeError):
+            Clip((A, B), durations=(1.5, 1))  # type: ignore
+        with self.assertRaises(ValueError):
+            Clip((A, B), durations=(1,))
+        with self.assertRaises(ValueError):
+            Clip((A, B), durations=(0, 1))
+        with self.assertRaises(TypeError):
+            Clip((A,), loop=1)  # type: ignore
+
+    def test_init_from_dict(self):
+        """Una clip può essere compilata da dati, con gli sprite nel formato di Sprite.init_from_dict."""
+        clip = Clip.init_from_dict({"frames": [dict(A), dict(B)], "durations": [2, 1], "loop": False})
+
+        self.assertEqual(clip.frame(1).pos, A.pos)
+        self.assertEqual(clip.frame(2).pos, B.pos)
+        self.assertFalse(clip.loop)
+
+
+class ClipsTest(unittest.TestCase):
+    def setUp(self):
+        self.clips = Clips({(Action.IDLE, Direction.RIGHT): Clip((A,)), (Action.WALKING, Direction.RIGHT): Clip((B, C))})
+
+    def test_mapping(self):
+        """Clips è una mappa di sola lettura (Action, Direction) -> Clip."""
+        self.assertIn((Action.IDLE, Direction.RIGHT), self.clips)
+        self.assertNotIn((Action.IDLE, Direction.LEFT), self.clips)
+        self.assertIsNone(self.clips.get((Action.IDLE, Direction.LEFT)))
+        self.assertEqual(len(self.clips), 2)
+        self.assertEqual(self.clips.sprites(), {A, B, C})
+        with self.assertRaises(TypeError):
+            self.clips[Action.IDLE, Direction.LEFT] = Clip((A,))  # type: ignore
+
+    def test_errors(self):
+        """Chiavi e valori sono validati."""
+        with self.assertRaises(TypeError):
+            Clips([])  # type: ignore
+        with self.assertRaises(TypeError):
+            Clips({Action.IDLE: Clip((A,))})  # type: ignore
+        with self.assertRaises(TypeError):
+            Clips({(Action.IDLE, Direction.RIGHT): [A]})  # type: ignore
+
+    def test_instances_share_class_clips(self):
+        """Le istanze di una entità non costruiscono sprite propri: usano la tabella della classe."""
+        first = Zombie("Zombie", x=0, y=0)
+        second = Zombie("Zombie", x=50, y=0)
+
+        self.assertIs(first.clips, second.clips)
+        self.assertIs(first.sprite(), second.sprite())
+        self.assertFalse(hasattr(first, "sprites"))
+        self.assertIs(Arthur.clips, Arthur("Arthur", 0, 0).clips)
+
+
+if __name__ == "__main__":
+    unittest.main()
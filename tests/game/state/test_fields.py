@@ -0,0 +1,88 @@
+import unittest
+
+from src.game.state import Checked, Sprite, set_debug, debug_enabled
+from src.game.state.fields import number, integer
+from src.game.entities.objects import Platform
+
+
+class Point(Checked):
+    __slots__ = ("x", "n")
+    _checks = {"x": number("x"), "n": integer("n")}
+
+    def __init__(self, x, n) -> None:
+        self._init_fields(x=x, n=n)
+
+class Point3(Point):
+    __slots__ = ("z",)
+    _checks = {"z": number("z")}
+
+
+class CheckedTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(set_debug, set_debug(False))
+
+    def test_init_fields_validates_and_converts(self):
+        """Alla costruzione i campi caldi sono sempre validati e convertiti, anche fuori dalla modalità debug."""
+        p = Point(3, 2)
+        self.assertIsInstance(p.x, float)
+        self.assertEqual((p.x, p.n), (3.0, 2))
+        with self.assertRaises(TypeError):
+            Point("3", 2)
+        with self.assertRaises(TypeError):
+            Platform(x="0", y=0, width=10, height=10)
+        with self.assertRaises(TypeError):
+            Sprite("a.png", 0, 0, 1.5, 1)
+
+    def test_checks_are_inherited(self):
+        """I controlli delle classi base valgono anche per le sottoclassi."""
+        self.assertEqual(set(Point3._all_checks), {"x", "n", "z"})
+        p = Point3(1, 1)
+        p.z = 0  # -> z non passa da _init_fields: assegnamento semplice
+        with self.assertRaises(TypeError):
+            p._init_fields(n=1.0)
+
+    def test_fast_mode_skips_validation_on_assignment(self):
+        """Con la modalità debug spenta gli assegnamenti non sono validati."""
+        p = Point(0, 0)
+        p.x = "not-a-number"  # type: ignore
+        self.assertEqual(p.x, "not-a-number")
+        self.assertFalse(debug_enabled())
+
+    def test_fast_mode_keeps_the_assigned_type(self):
+        """Con la modalità debug spenta un int assegnato a un campo number resta un int; in debug diventa float."""
+        p = Point(0, 0)
+        p.x = 2
+        self.assertIs(type(p.x), int)
+        p.x += 0.5
+        self.assertIs(type(p.x), float)
+
+        set_debug(True)
+        p.x = 2
+        self.assertIs(type(p.x), float)
+
+    def test_debug_mode_validates_every_assignment(self):
+        """In modalità debug ogni assegnamento di un campo caldo è validato e convertito."""
+        previous = set_debug(True)
+        self.assertFalse(previous)
+        self.assertTrue(debug_enabled())
+
+        p = Point(0, 0)
+        p.x = 2
+        self.assertIsInstance(p.x, float)
+        with self.assertRaises(TypeError):
+            p.n = 1.5
+
+        set_debug(False)
+        p.n = 1.5
+        self.assertEqual(p.n, 1.5)
+
+    def test_slots_have_no_instance_dict(self):
+        """Le classi con campi caldi non hanno __dict__ per istanza."""
+        self.assertFalse(hasattr(Point(0, 0), "__dict__"))
+        self.assertFalse(hasattr(Platform(x=0, y=0, width=10, height=10), "__dict__"))
+        with self.assertRaises(AttributeError):
+            Point(0, 0).w = 1  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()